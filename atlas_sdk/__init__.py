@@ -1,42 +1,139 @@
-"""PipelineAtlas SDK — Shared models and schemas for all atlas-* services."""
+"""PipelineAtlas SDK — Shared models and schemas for all atlas-* services.
+
+Public names are re-exported lazily: ``from atlas_sdk import ConfidenceScore``
+only imports ``atlas_sdk.confidence`` (and its enums), not the graph, event or
+report models. Each name is resolved on first access and then cached in the
+module namespace.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 __version__ = "0.1.0"
 
-# Re-export core types for convenient access
-from atlas_sdk.confidence import ConfidenceScore  # noqa: F401
-from atlas_sdk.enums import (  # noqa: F401
-    ArtifactType,
-    ConfidenceLevel,
-    DocType,
-    EdgeType,
-    NodeType,
-    Platform,
-    Severity,
-    SourceType,
-)
-from atlas_sdk.events import (  # noqa: F401
-    BaseEvent,
-    FindingsEvent,
-    ParseResultEvent,
-    ReportReadyEvent,
-    ScanRequestEvent,
-    ScanResultEvent,
-)
-from atlas_sdk.models.edges import Edge  # noqa: F401
-from atlas_sdk.models.findings import Evidence, Finding  # noqa: F401
-from atlas_sdk.models.graph import CICDGraph  # noqa: F401
-from atlas_sdk.models.nodes import (  # noqa: F401
-    ArtifactNode,
-    ContainerImageNode,
-    DocFileNode,
-    EnvironmentNode,
-    ExternalServiceNode,
-    JobNode,
-    Node,
-    PipelineNode,
-    RepositoryNode,
-    RunnerNode,
-    SecretRefNode,
-    StageNode,
-    StepNode,
-)
+# Re-export core types for convenient access (name → defining module)
+_LAZY_IMPORTS: dict[str, str] = {
+    "ConfidenceScore": "atlas_sdk.confidence",
+    "ArtifactType": "atlas_sdk.enums",
+    "ConfidenceLevel": "atlas_sdk.enums",
+    "DocType": "atlas_sdk.enums",
+    "EdgeType": "atlas_sdk.enums",
+    "NodeType": "atlas_sdk.enums",
+    "Platform": "atlas_sdk.enums",
+    "Severity": "atlas_sdk.enums",
+    "SourceType": "atlas_sdk.enums",
+    "BaseEvent": "atlas_sdk.events",
+    "FindingsEvent": "atlas_sdk.events",
+    "ParseResultEvent": "atlas_sdk.events",
+    "ReportReadyEvent": "atlas_sdk.events",
+    "ScanRequestEvent": "atlas_sdk.events",
+    "ScanResultEvent": "atlas_sdk.events",
+    "Edge": "atlas_sdk.models.edges",
+    "Evidence": "atlas_sdk.models.findings",
+    "Finding": "atlas_sdk.models.findings",
+    "CICDGraph": "atlas_sdk.models.graph",
+    "ArtifactNode": "atlas_sdk.models.nodes",
+    "ContainerImageNode": "atlas_sdk.models.nodes",
+    "DocFileNode": "atlas_sdk.models.nodes",
+    "EnvironmentNode": "atlas_sdk.models.nodes",
+    "ExternalServiceNode": "atlas_sdk.models.nodes",
+    "JobNode": "atlas_sdk.models.nodes",
+    "Node": "atlas_sdk.models.nodes",
+    "PipelineNode": "atlas_sdk.models.nodes",
+    "RepositoryNode": "atlas_sdk.models.nodes",
+    "RunnerNode": "atlas_sdk.models.nodes",
+    "SecretRefNode": "atlas_sdk.models.nodes",
+    "StageNode": "atlas_sdk.models.nodes",
+    "StepNode": "atlas_sdk.models.nodes",
+}
+
+__all__ = [
+    "ArtifactNode",
+    "ArtifactType",
+    "BaseEvent",
+    "CICDGraph",
+    "ConfidenceLevel",
+    "ConfidenceScore",
+    "ContainerImageNode",
+    "DocFileNode",
+    "DocType",
+    "Edge",
+    "EdgeType",
+    "EnvironmentNode",
+    "Evidence",
+    "ExternalServiceNode",
+    "Finding",
+    "FindingsEvent",
+    "JobNode",
+    "Node",
+    "NodeType",
+    "ParseResultEvent",
+    "PipelineNode",
+    "Platform",
+    "ReportReadyEvent",
+    "RepositoryNode",
+    "RunnerNode",
+    "ScanRequestEvent",
+    "ScanResultEvent",
+    "SecretRefNode",
+    "Severity",
+    "SourceType",
+    "StageNode",
+    "StepNode",
+    "__version__",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
+
+if TYPE_CHECKING:
+    from atlas_sdk.confidence import ConfidenceScore
+    from atlas_sdk.enums import (
+        ArtifactType,
+        ConfidenceLevel,
+        DocType,
+        EdgeType,
+        NodeType,
+        Platform,
+        Severity,
+        SourceType,
+    )
+    from atlas_sdk.events import (
+        BaseEvent,
+        FindingsEvent,
+        ParseResultEvent,
+        ReportReadyEvent,
+        ScanRequestEvent,
+        ScanResultEvent,
+    )
+    from atlas_sdk.models.edges import Edge
+    from atlas_sdk.models.findings import Evidence, Finding
+    from atlas_sdk.models.graph import CICDGraph
+    from atlas_sdk.models.nodes import (
+        ArtifactNode,
+        ContainerImageNode,
+        DocFileNode,
+        EnvironmentNode,
+        ExternalServiceNode,
+        JobNode,
+        Node,
+        PipelineNode,
+        RepositoryNode,
+        RunnerNode,
+        SecretRefNode,
+        StageNode,
+        StepNode,
+    )
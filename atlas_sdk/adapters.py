@@ -0,0 +1,109 @@
+"""Precompiled, shared TypeAdapters for common collection shapes.
+
+Services should validate ``list[Node]``, ``list[Finding]``, event payloads
+etc. through these module-level adapters rather than building a
+``TypeAdapter`` per request. The models' own schemas are built when their
+modules are imported; the adapters wrapping them are declared with
+``defer_build``, so each would otherwise build its core schema on first
+use. Call ``warmup()`` during service startup to build them all before the
+first request arrives.
+"""
+
+from __future__ import annotations
+
+import operator
+from functools import reduce
+from typing import Annotated, Any
+
+from pydantic import ConfigDict, Discriminator, Tag, TypeAdapter
+
+from atlas_sdk.events import (
+    AITokenUsageEvent,
+    FindingsEvent,
+    LogAnalysisEvent,
+    ParseResultEvent,
+    ReportReadyEvent,
+    ScanRequestEvent,
+    ScanResultEvent,
+)
+from atlas_sdk.models.edges import Edge
+from atlas_sdk.models.findings import Evidence, Finding
+from atlas_sdk.models.graph import CICDGraph, CrossProjectEdge
+from atlas_sdk.models.nodes import NODE_TYPE_MAP, Node
+from atlas_sdk.models.refactors import RefactorSuggestion
+from atlas_sdk.models.scan_history import ScanSnapshot
+
+_DEFERRED = ConfigDict(defer_build=True)
+
+
+def _node_tag(value: Any) -> str | None:
+    if isinstance(value, dict):
+        return value.get("node_type")
+    return getattr(value, "node_type", None)
+
+
+# A node validated into its concrete subclass (PipelineNode, JobNode, ...)
+# by dispatching on ``node_type`` instead of trying every subclass.
+AnyNode = Annotated[
+    reduce(operator.or_, (Annotated[cls, Tag(nt.value)] for nt, cls in NODE_TYPE_MAP.items())),
+    Discriminator(_node_tag),
+]
+
+# Unlike nodes, event payloads carry no type tag (the event type travels in
+# the stream name or the ``schema_registry`` frame header), so this union
+# cannot be discriminated and pydantic picks the best-matching model. When
+# the type is known, validate with the event class or ``registry.decode``.
+AnyEvent = (
+    ScanRequestEvent
+    | ScanResultEvent
+    | ParseResultEvent
+    | FindingsEvent
+    | ReportReadyEvent
+    | AITokenUsageEvent
+    | LogAnalysisEvent
+)
+
+NODE_LIST: TypeAdapter[list[Node]] = TypeAdapter(list[Node], config=_DEFERRED)
+TYPED_NODE_LIST: TypeAdapter[list[Node]] = TypeAdapter(list[AnyNode], config=_DEFERRED)
+EDGE_LIST: TypeAdapter[list[Edge]] = TypeAdapter(list[Edge], config=_DEFERRED)
+CROSS_EDGE_LIST: TypeAdapter[list[CrossProjectEdge]] = TypeAdapter(
+    list[CrossProjectEdge], config=_DEFERRED
+)
+FINDING_LIST: TypeAdapter[list[Finding]] = TypeAdapter(list[Finding], config=_DEFERRED)
+EVIDENCE_LIST: TypeAdapter[list[Evidence]] = TypeAdapter(list[Evidence], config=_DEFERRED)
+GRAPH_LIST: TypeAdapter[list[CICDGraph]] = TypeAdapter(list[CICDGraph], config=_DEFERRED)
+SUGGESTION_LIST: TypeAdapter[list[RefactorSuggestion]] = TypeAdapter(
+    list[RefactorSuggestion], config=_DEFERRED
+)
+SNAPSHOT_LIST: TypeAdapter[list[ScanSnapshot]] = TypeAdapter(list[ScanSnapshot], config=_DEFERRED)
+EVENT: TypeAdapter[Any] = TypeAdapter(AnyEvent, config=_DEFERRED)
+EVENT_LIST: TypeAdapter[list[Any]] = TypeAdapter(list[AnyEvent], config=_DEFERRED)
+
+ALL_ADAPTERS: tuple[TypeAdapter[Any], ...] = (
+    NODE_LIST,
+    TYPED_NODE_LIST,
+    EDGE_LIST,
+    CROSS_EDGE_LIST,
+    FINDING_LIST,
+    EVIDENCE_LIST,
+    GRAPH_LIST,
+    SUGGESTION_LIST,
+    SNAPSHOT_LIST,
+    EVENT,
+    EVENT_LIST,
+)
+
+
+def warmup() -> int:
+    """Build the core schema of every shared (``defer_build``) adapter.
+
+    Returns:
+        The number of adapters that were built by this call (0 when
+        everything was already warm).
+    """
+    built = 0
+    for adapter in ALL_ADAPTERS:
+        if not adapter.pydantic_complete:
+            adapter.rebuild()
+            built += 1
+    return built
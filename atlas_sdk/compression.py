@@ -0,0 +1,375 @@
+"""Compressed graph snapshots and events with trained dictionaries.
+
+Stored ``CICDGraph`` JSON is highly repetitive: the same field names, enum
+strings and metadata keys appear in every node. A generic compressor has
+to rediscover them in every blob; a dictionary trained on earlier
+snapshots of the same platform starts with them already in its window,
+which pays off most on the small and medium payloads that dominate (one
+project graph, one ``FindingsEvent``).
+
+``SnapshotCodec`` keeps one ``TrainedDictionary`` per ``Platform`` and
+compresses with zstd when the optional ``zstandard`` package is installed
+(``pip install 'atlas-sdk[zstd]'``), or with zlib and a preset dictionary
+otherwise. Both stream: ``iter_compress`` / ``iter_decompress`` work chunk
+by chunk, ``write_graph`` / ``read_graph`` on binary file objects.
+
+Frame format:
+    byte 0     — codec (1 = zlib, 2 = zstd)
+    bytes 1-4  — dictionary id, big-endian (0 = no dictionary)
+    bytes 5..  — compressed body
+
+Input starting with ``{`` is plain JSON and passes through ``decompress``
+unchanged, so existing stores can migrate blob by blob.
+"""
+
+from __future__ import annotations
+
+import re
+import struct
+import zlib
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import chain
+from typing import IO, Any, Literal
+
+from pydantic import BaseModel
+
+from atlas_sdk.enums import Platform
+from atlas_sdk.events import BaseEvent
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.schema_registry import registry
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+Codec = Literal["zlib", "zstd"]
+
+ZSTD_AVAILABLE = zstandard is not None
+DEFAULT_CODEC: Codec = "zstd" if ZSTD_AVAILABLE else "zlib"
+DEFAULT_DICT_SIZE = 32 * 1024
+ZLIB_MAX_DICT_SIZE = 32 * 1024  # deflate's window; zlib ignores anything before the last 32 KiB
+SAMPLE_CHUNK = 4096
+CHUNK_SIZE = 64 * 1024
+
+_CODEC_IDS: dict[str, int] = {"zlib": 1, "zstd": 2}
+_CODEC_NAMES = {v: k for k, v in _CODEC_IDS.items()}
+_DEFAULT_LEVELS = {"zlib": 6, "zstd": 3}
+_HEADER = struct.Struct(">BI")
+_DICT_MAGIC = b"ATDICT1"
+_DECODE_ERRORS: tuple[type[Exception], ...] = (zlib.error,)
+if zstandard is not None:
+    _DECODE_ERRORS += (zstandard.ZstdError,)
+
+# A JSON string, optionally followed by ``:`` and a scalar value or an opening
+# bracket — i.e. key/value pairs such as ``"node_type":"job",``.
+_FRAGMENT = re.compile(
+    rb'"(?:[^"\\\n]|\\.){1,64}"'
+    rb'(?::(?:"(?:[^"\\\n]|\\.){0,64}"|-?\d{1,12}(?:\.\d+)?|true|false|null|\[|\{))?,?'
+)
+
+
+class CompressionError(ValueError):
+    """Raised for malformed frames, unknown dictionaries or unavailable codecs."""
+
+
+@dataclass(frozen=True, slots=True)
+class TrainedDictionary:
+    """Dictionary content for one codec, optionally bound to a platform.
+
+    ``dict_id`` is derived from the content, so every service that loads
+    the same dictionary agrees on it without coordination.
+    """
+
+    codec: Codec
+    data: bytes
+    platform: Platform | None = None
+    dict_id: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        if self.codec not in _CODEC_IDS:
+            raise CompressionError(f"unknown codec {self.codec!r}")
+        object.__setattr__(self, "dict_id", zlib.crc32(self.data) or 1)
+
+    def to_bytes(self) -> bytes:
+        """Serialize for sharing between services (see ``from_bytes``)."""
+        platform = (self.platform or "").encode()
+        return b"".join(
+            (_DICT_MAGIC, bytes((_CODEC_IDS[self.codec], len(platform))), platform, self.data)
+        )
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> TrainedDictionary:
+        if not blob.startswith(_DICT_MAGIC) or len(blob) < len(_DICT_MAGIC) + 2:
+            raise CompressionError("not a serialized TrainedDictionary")
+        offset = len(_DICT_MAGIC)
+        codec_id, platform_len = blob[offset], blob[offset + 1]
+        offset += 2
+        platform = blob[offset : offset + platform_len].decode()
+        codec = _CODEC_NAMES.get(codec_id)
+        if codec is None:
+            raise CompressionError(f"unknown codec id {codec_id}")
+        data = blob[offset + platform_len :]
+        return cls(codec, data, Platform(platform) if platform else None)  # type: ignore[arg-type]
+
+
+def train_dictionary(
+    samples: Iterable[BaseModel | bytes | str],
+    *,
+    codec: Codec = DEFAULT_CODEC,
+    size: int = DEFAULT_DICT_SIZE,
+    platform: Platform | None = None,
+) -> TrainedDictionary:
+    """Train a dictionary on representative payloads.
+
+    Samples are graphs, events or already-serialized JSON; models are
+    serialized exactly as ``SnapshotCodec`` will serialize them. They are
+    cut into ``SAMPLE_CHUNK``-sized pieces so a handful of large graphs
+    trains as well as many small ones. zstd uses its own trainer, falling
+    back to a raw-content dictionary when there are too few samples; zlib
+    always uses the raw-content dictionary (see ``_raw_dictionary``).
+    """
+    payloads = [_serialize(sample) for sample in samples]
+    chunks = [
+        payload[i : i + SAMPLE_CHUNK]
+        for payload in payloads
+        for i in range(0, len(payload), SAMPLE_CHUNK)
+    ]
+    if not chunks:
+        raise CompressionError("cannot train a dictionary without samples")
+    if codec == "zstd":
+        _require_zstd()
+        try:
+            data = zstandard.train_dictionary(size, chunks).as_bytes()
+        except zstandard.ZstdError:
+            data = _raw_dictionary(payloads, chunks, size)
+    elif codec == "zlib":
+        data = _raw_dictionary(payloads, chunks, min(size, ZLIB_MAX_DICT_SIZE))
+    else:
+        raise CompressionError(f"unknown codec {codec!r}")
+    return TrainedDictionary(codec, data, platform)
+
+
+def _raw_dictionary(payloads: list[bytes], chunks: list[bytes], size: int) -> bytes:
+    """The JSON fragments worth the most bytes, after a tail of raw samples.
+
+    A fragment's value is its length times the number of chunks it occurs
+    in (repeats within one chunk are already cheap for LZ77). Fragments
+    seen in a single chunk — ids, timestamps — are dropped. The best ones
+    go last: both codecs encode matches near the end of the dictionary
+    with the shortest distances. Space the fragments leave is filled with
+    the end of the most recent samples, which keeps whole record templates
+    (a finding's rule id, title and description together) that single
+    fragments miss; on ``FindingsEvent`` payloads that is most of the gain.
+    """
+    seen: Counter[bytes] = Counter()
+    for chunk in chunks:
+        seen.update(set(_FRAGMENT.findall(chunk)))
+    ranked = sorted(
+        ((count * len(fragment), fragment) for fragment, count in seen.items() if count > 1),
+        reverse=True,
+    )
+    picked: list[bytes] = []
+    total = 0
+    for _, fragment in ranked:
+        if total + len(fragment) > size:
+            continue
+        picked.append(fragment)
+        total += len(fragment)
+    fragments = b"".join(reversed(picked))
+    tail = b"".join(payloads)[-(size - total) :] if total < size else b""
+    return tail + fragments
+
+
+class SnapshotCodec:
+    """Compresses graphs and events with per-platform trained dictionaries.
+
+    Args:
+        dictionaries: Dictionaries to load. The latest one added for a
+            platform compresses that platform's payloads; a dictionary
+            without a platform covers the rest. Every dictionary added stays
+            available for decompression, so frames written with a retired
+            dictionary remain readable.
+        codec: ``"zstd"`` or ``"zlib"``; defaults to zstd when installed.
+        level: Compression level; defaults to 3 for zstd and 6 for zlib.
+    """
+
+    def __init__(
+        self,
+        dictionaries: Iterable[TrainedDictionary] = (),
+        *,
+        codec: Codec | None = None,
+        level: int | None = None,
+    ) -> None:
+        self.codec: Codec = codec or DEFAULT_CODEC
+        if self.codec not in _CODEC_IDS:
+            raise CompressionError(f"unknown codec {self.codec!r}")
+        if self.codec == "zstd":
+            _require_zstd()
+        self.level = _DEFAULT_LEVELS[self.codec] if level is None else level
+        self._active: dict[Platform | None, TrainedDictionary] = {}
+        self._by_id: dict[tuple[int, int], TrainedDictionary] = {}
+        self._zstd_dicts: dict[int, Any] = {}
+        for dictionary in dictionaries:
+            self.add_dictionary(dictionary)
+
+    # ── Dictionaries ──────────────────────────────────────────────────
+
+    def add_dictionary(self, dictionary: TrainedDictionary) -> None:
+        self._by_id[_CODEC_IDS[dictionary.codec], dictionary.dict_id] = dictionary
+        if dictionary.codec == self.codec:
+            self._active[dictionary.platform] = dictionary
+
+    def train(
+        self,
+        platform: Platform | None,
+        samples: Iterable[BaseModel | bytes | str],
+        *,
+        size: int = DEFAULT_DICT_SIZE,
+    ) -> TrainedDictionary:
+        """Train and activate a dictionary for ``platform`` (``None``: all others)."""
+        dictionary = train_dictionary(samples, codec=self.codec, size=size, platform=platform)
+        self.add_dictionary(dictionary)
+        return dictionary
+
+    def dictionary_for(self, platform: Platform | None) -> TrainedDictionary | None:
+        """The dictionary payloads of ``platform`` are compressed with."""
+        return self._active.get(platform) or self._active.get(None)
+
+    @property
+    def dictionaries(self) -> list[TrainedDictionary]:
+        """Every loaded dictionary, including retired ones."""
+        return list(self._by_id.values())
+
+    # ── Bytes ─────────────────────────────────────────────────────────
+
+    def iter_compress(
+        self, chunks: Iterable[bytes], platform: Platform | None = None
+    ) -> Iterator[bytes]:
+        """Compress a stream of chunks into a stream of frame pieces."""
+        dictionary = self.dictionary_for(platform)
+        yield _HEADER.pack(_CODEC_IDS[self.codec], dictionary.dict_id if dictionary else 0)
+        compressor = self._compressor(dictionary)
+        for chunk in chunks:
+            out = compressor.compress(chunk)
+            if out:
+                yield out
+        yield compressor.flush()
+
+    def iter_decompress(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Decompress a stream of frame pieces (or plain JSON) chunk by chunk."""
+        it = iter(chunks)
+        head = b""
+        for chunk in it:
+            head += chunk
+            if len(head) >= _HEADER.size or head[:1] == b"{":
+                break
+        if head[:1] == b"{":
+            yield head
+            yield from it
+            return
+        if len(head) < _HEADER.size:
+            raise CompressionError("truncated frame header")
+        codec_id, dict_id = _HEADER.unpack_from(head)
+        decompressor = self._decompressor(codec_id, dict_id)
+        try:
+            for chunk in chain((head[_HEADER.size :],), it):
+                out = decompressor.decompress(chunk)
+                if out:
+                    yield out
+            tail = decompressor.flush()
+        except _DECODE_ERRORS as exc:
+            raise CompressionError(f"corrupt frame body: {exc}") from exc
+        if tail:
+            yield tail
+        if not getattr(decompressor, "eof", True):
+            raise CompressionError("truncated frame body")
+
+    def compress(self, data: bytes, platform: Platform | None = None) -> bytes:
+        return b"".join(self.iter_compress((data,), platform))
+
+    def decompress(self, frame: bytes) -> bytes:
+        return b"".join(self.iter_decompress((frame,)))
+
+    # ── Models ────────────────────────────────────────────────────────
+
+    def dump_graph(self, graph: CICDGraph) -> bytes:
+        """Compressed ``model_dump_json`` of ``graph``, using its platform's dictionary."""
+        return self.compress(graph.model_dump_json().encode(), graph.platform)
+
+    def load_graph(self, frame: bytes) -> CICDGraph:
+        return CICDGraph.model_validate_json(self.decompress(frame))
+
+    def write_graph(self, graph: CICDGraph, fp: IO[bytes]) -> int:
+        """Stream a compressed graph to ``fp``; returns the bytes written."""
+        data = memoryview(graph.model_dump_json().encode())
+        chunks = (data[i : i + CHUNK_SIZE] for i in range(0, len(data), CHUNK_SIZE))
+        written = 0
+        for piece in self.iter_compress(chunks, graph.platform):
+            written += fp.write(piece)
+        return written
+
+    def read_graph(self, fp: IO[bytes]) -> CICDGraph:
+        """Read a graph written by ``write_graph`` (or plain JSON) from ``fp``."""
+        chunks = iter(partial(fp.read, CHUNK_SIZE), b"")
+        return CICDGraph.model_validate_json(b"".join(self.iter_decompress(chunks)))
+
+    def dump_event(self, event: BaseEvent, platform: Platform | None = None) -> bytes:
+        """Compressed wire frame of ``event`` (``schema_registry`` header included)."""
+        return self.compress(registry.encode(event), platform)
+
+    def load_event(self, frame: bytes) -> BaseEvent:
+        return registry.decode(self.decompress(frame))
+
+    # ── Codec objects ─────────────────────────────────────────────────
+
+    def _compressor(self, dictionary: TrainedDictionary | None) -> Any:
+        if self.codec == "zstd":
+            zdict = self._zstd_dict(dictionary) if dictionary else None
+            return zstandard.ZstdCompressor(level=self.level, dict_data=zdict).compressobj()
+        if dictionary is None:
+            return zlib.compressobj(self.level)
+        return zlib.compressobj(self.level, zdict=dictionary.data)
+
+    def _decompressor(self, codec_id: int, dict_id: int) -> Any:
+        codec = _CODEC_NAMES.get(codec_id)
+        if codec is None:
+            raise CompressionError(f"unknown codec id {codec_id} in frame header")
+        dictionary = None
+        if dict_id:
+            dictionary = self._by_id.get((codec_id, dict_id))
+            if dictionary is None:
+                raise CompressionError(f"frame needs {codec} dictionary {dict_id:#010x}")
+        if codec == "zstd":
+            _require_zstd()
+            zdict = self._zstd_dict(dictionary) if dictionary else None
+            return zstandard.ZstdDecompressor(dict_data=zdict).decompressobj()
+        if dictionary is None:
+            return zlib.decompressobj()
+        return zlib.decompressobj(zdict=dictionary.data)
+
+    def _zstd_dict(self, dictionary: TrainedDictionary) -> Any:
+        zdict = self._zstd_dicts.get(dictionary.dict_id)
+        if zdict is None:
+            zdict = zstandard.ZstdCompressionDict(dictionary.data)
+            zdict.precompute_compress(level=self.level)
+            self._zstd_dicts[dictionary.dict_id] = zdict
+        return zdict
+
+
+def _serialize(sample: BaseModel | bytes | str) -> bytes:
+    if isinstance(sample, BaseEvent):
+        return registry.encode(sample)
+    if isinstance(sample, BaseModel):
+        return sample.model_dump_json().encode()
+    if isinstance(sample, str):
+        return sample.encode()
+    return sample
+
+
+def _require_zstd() -> None:
+    if zstandard is None:
+        raise CompressionError("zstd needs the zstandard package: pip install 'atlas-sdk[zstd]'")
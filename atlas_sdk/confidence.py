@@ -7,25 +7,51 @@ Rules:
     HIGH   = Static + Runtime match
     MEDIUM = Static only
     LOW    = AI-derived
+
+Scores are immutable. Scores without ``reasoning`` are interned per
+(level, source), so a million findings with default confidence share a
+handful of instances instead of each carrying its own.
 """
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from atlas_sdk.enums import ConfidenceLevel, SourceType
 
+_SHARED: dict[tuple[ConfidenceLevel, SourceType], ConfidenceScore] = {}
+
 
 class ConfidenceScore(BaseModel):
     """Confidence assessment for a finding or structural element."""
 
+    model_config = ConfigDict(frozen=True)
+
     level: ConfidenceLevel = ConfidenceLevel.MEDIUM
     source: SourceType = SourceType.STATIC
     reasoning: str | None = None
 
+    @classmethod
+    def shared(cls, level: ConfidenceLevel, source: SourceType) -> ConfidenceScore:
+        """Return the interned score for (level, source) with no reasoning."""
+        key = (ConfidenceLevel(level), SourceType(source))
+        score = _SHARED.get(key)
+        if score is None:
+            score = _SHARED.setdefault(key, ConfidenceScore(level=key[0], source=key[1]))
+        return score
+
+    @classmethod
+    def intern(cls, score: ConfidenceScore) -> ConfidenceScore:
+        """Swap ``score`` for its interned equivalent when it has no reasoning."""
+        if score.reasoning is None and type(score) is ConfidenceScore:
+            return cls.shared(score.level, score.source)
+        return score
+
     @classmethod
     def high(cls, reasoning: str | None = None) -> ConfidenceScore:
         """Static + Runtime confirmed."""
+        if reasoning is None:
+            return cls.shared(ConfidenceLevel.HIGH, SourceType.STATIC_RUNTIME)
         return cls(
             level=ConfidenceLevel.HIGH,
             source=SourceType.STATIC_RUNTIME,
@@ -35,6 +61,8 @@ class ConfidenceScore(BaseModel):
     @classmethod
     def medium(cls, reasoning: str | None = None) -> ConfidenceScore:
         """Static analysis only."""
+        if reasoning is None:
+            return cls.shared(ConfidenceLevel.MEDIUM, SourceType.STATIC)
         return cls(
             level=ConfidenceLevel.MEDIUM,
             source=SourceType.STATIC,
@@ -44,6 +72,8 @@ class ConfidenceScore(BaseModel):
     @classmethod
     def low(cls, reasoning: str | None = None) -> ConfidenceScore:
         """AI-inferred."""
+        if reasoning is None:
+            return cls.shared(ConfidenceLevel.LOW, SourceType.AI_INFERENCE)
         return cls(
             level=ConfidenceLevel.LOW,
             source=SourceType.AI_INFERENCE,
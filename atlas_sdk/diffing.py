@@ -0,0 +1,254 @@
+"""Batched unified-diff generation for refactor previews.
+
+Builds ``SimulationResult.diff_preview`` / ``Proposal.diff_preview`` text
+from ``RefactorSuggestion.before_snippet`` / ``after_snippet`` pairs.
+Suggestions are grouped by source file and applied to each file in one
+pass with offset tracking, so each file is diffed exactly once no matter
+how many suggestions touch it. Rendered diffs are cached by a hash of the
+file content and snippets, and files can be rendered in parallel.
+
+A suggestion's source file comes from ``metadata["source_file"]`` or,
+failing that, from the first evidence entry of the finding it fixes.
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from atlas_sdk.models.findings import Finding
+from atlas_sdk.models.refactors import RefactorSuggestion
+
+DEFAULT_CACHE_SIZE = 256
+
+Edit = tuple[str, str, str]  # (suggestion id, before snippet, after snippet)
+
+
+class FileDiff(BaseModel):
+    """Unified diff for one source file."""
+
+    path: str
+    diff: str = ""
+    applied_suggestion_ids: list[str] = Field(default_factory=list)
+    skipped_suggestion_ids: list[str] = Field(default_factory=list)
+
+
+def source_file_for(
+    suggestion: RefactorSuggestion, findings_by_id: Mapping[str, Finding] | None = None
+) -> str | None:
+    """Resolve the source file a suggestion edits."""
+    path = suggestion.metadata.get("source_file")
+    if path:
+        return str(path)
+    finding = (findings_by_id or {}).get(suggestion.finding_id)
+    if finding is not None:
+        for evidence in finding.evidence:
+            if evidence.source_file:
+                return evidence.source_file
+    return None
+
+
+def apply_edits(original: str, edits: Sequence[Edit]) -> tuple[str, list[str], list[str]]:
+    """Apply snippet replacements to ``original`` in a single pass.
+
+    Each ``before`` snippet is matched to its first occurrence not already
+    claimed by another edit. Edits whose snippet is empty, missing or
+    overlaps an earlier claim are skipped.
+
+    Returns:
+        (new content, applied suggestion ids, skipped suggestion ids)
+    """
+    spans: list[tuple[int, int, str, str]] = []
+    claimed: list[tuple[int, int]] = []
+    skipped: list[str] = []
+    for suggestion_id, before, after in edits:
+        start = original.find(before) if before else -1
+        while start != -1:
+            end = start + len(before)
+            if not any(start < c_end and c_start < end for c_start, c_end in claimed):
+                break
+            start = original.find(before, start + 1)
+        if start == -1:
+            skipped.append(suggestion_id)
+            continue
+        claimed.append((start, start + len(before)))
+        spans.append((start, start + len(before), after, suggestion_id))
+
+    spans.sort()
+    pieces: list[str] = []
+    cursor = 0
+    for start, end, after, _ in spans:
+        pieces.append(original[cursor:start])
+        pieces.append(after)
+        cursor = end
+    pieces.append(original[cursor:])
+    return "".join(pieces), [s[3] for s in spans], skipped
+
+
+_NO_EOL = "\\ No newline at end of file\n"
+
+
+def _snippet_lines(text: str) -> list[str]:
+    # Snippets are fragments, not whole files: a missing final newline is
+    # not a change worth reporting.
+    lines = text.splitlines(keepends=True)
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+    return lines
+
+
+def _file_diff(before: str, after: str, label: str, context: int) -> str:
+    """Unified diff of two whole files, marking a missing final newline like ``diff -u``."""
+    out: list[str] = []
+    for line in difflib.unified_diff(
+        before.splitlines(keepends=True),
+        after.splitlines(keepends=True),
+        f"a/{label}",
+        f"b/{label}",
+        n=context,
+    ):
+        out.append(line)
+        if not line.endswith("\n"):
+            out.append("\n" + _NO_EOL)
+    return "".join(out)
+
+
+def render_file_diff(
+    path: str, original: str | None, edits: Sequence[Edit], context: int = 3
+) -> FileDiff:
+    """Apply ``edits`` to one file and render its unified diff.
+
+    Without the original content, each edit is diffed snippet-to-snippet.
+    """
+    label = path or "<unknown>"
+    if original is None:
+        chunks = [
+            "".join(
+                difflib.unified_diff(
+                    _snippet_lines(before),
+                    _snippet_lines(after),
+                    f"a/{label}",
+                    f"b/{label}",
+                    n=context,
+                )
+            )
+            for _, before, after in edits
+        ]
+        return FileDiff(
+            path=path, diff="".join(chunks), applied_suggestion_ids=[e[0] for e in edits]
+        )
+    updated, applied, skipped = apply_edits(original, edits)
+    return FileDiff(
+        path=path,
+        diff=_file_diff(original, updated, label, context),
+        applied_suggestion_ids=applied,
+        skipped_suggestion_ids=skipped,
+    )
+
+
+def _cache_key(path: str, original: str | None, edits: Sequence[Edit], context: int) -> str:
+    digest = hashlib.sha256(f"{path}\0{context}\0".encode())
+    digest.update(b"\1" if original is None else hashlib.sha256(original.encode()).digest())
+    for suggestion_id, before, after in edits:
+        for part in (suggestion_id, before, after):
+            digest.update(hashlib.sha256(part.encode()).digest())
+    return digest.hexdigest()
+
+
+class DiffBuilder:
+    """Groups suggestions per file and renders one cached diff per file.
+
+    Args:
+        files: Source file path → current content. Files not listed fall
+            back to snippet-to-snippet diffs.
+        context: Context lines per hunk.
+        cache_size: Number of rendered file diffs kept (LRU).
+    """
+
+    def __init__(
+        self,
+        files: Mapping[str, str] | None = None,
+        *,
+        context: int = 3,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        self.files = dict(files or {})
+        self.context = context
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, FileDiff] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def group(
+        self, suggestions: Iterable[RefactorSuggestion], findings: Iterable[Finding] = ()
+    ) -> dict[str, list[RefactorSuggestion]]:
+        """Group suggestions by source file, in plan order ("" = unknown file)."""
+        findings_by_id = {f.id: f for f in findings}
+        groups: dict[str, list[RefactorSuggestion]] = {}
+        for suggestion in suggestions:
+            path = source_file_for(suggestion, findings_by_id) or ""
+            groups.setdefault(path, []).append(suggestion)
+        return groups
+
+    def render(
+        self,
+        suggestions: Iterable[RefactorSuggestion],
+        findings: Iterable[Finding] = (),
+        *,
+        max_workers: int | None = 1,
+        executor: Executor | None = None,
+    ) -> list[FileDiff]:
+        """Render one ``FileDiff`` per source file, sorted by path.
+
+        Cache misses are rendered inline by default; pass ``max_workers``
+        greater than 1 (or an ``executor``) to render files in parallel.
+        """
+        jobs: list[tuple[str, str, str | None, list[Edit]]] = []
+        results: dict[str, FileDiff] = {}
+        for path, group in sorted(self.group(suggestions, findings).items()):
+            edits = [(s.id, s.before_snippet, s.after_snippet) for s in group]
+            original = self.files.get(path)
+            key = _cache_key(path, original, edits, self.context)
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                results[path] = cached
+            else:
+                self.cache_misses += 1
+                jobs.append((key, path, original, edits))
+
+        if jobs:
+            args = [(path, original, edits, self.context) for _, path, original, edits in jobs]
+            if executor is not None:
+                rendered = list(executor.map(render_file_diff, *zip(*args)))
+            elif max_workers == 1 or len(jobs) == 1:
+                rendered = [render_file_diff(*a) for a in args]
+            else:
+                with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                    rendered = list(pool.map(render_file_diff, *zip(*args)))
+            for (key, path, _, _), file_diff in zip(jobs, rendered):
+                results[path] = file_diff
+                self._remember(key, file_diff)
+
+        return [results[path] for path in sorted(results)]
+
+    def preview(
+        self,
+        suggestions: Iterable[RefactorSuggestion],
+        findings: Iterable[Finding] = (),
+        **options: Any,
+    ) -> str:
+        """Concatenated diff text for all files, for ``diff_preview`` fields."""
+        return "".join(d.diff for d in self.render(suggestions, findings, **options))
+
+    def _remember(self, key: str, file_diff: FileDiff) -> None:
+        self._cache[key] = file_diff
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
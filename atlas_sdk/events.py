@@ -7,12 +7,19 @@ All communication flows through Redis Streams.
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, ClassVar, TypeVar
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
 from atlas_sdk.enums import Platform
+from atlas_sdk.metadata import Metadata
+from atlas_sdk.tracing import Hop, TraceContext, mark_dequeued, mark_enqueued
+
+_E = TypeVar("_E", bound="BaseEvent")
+
+# Fields copied from a parent event to a derived child that declares them.
+_CARRIED_FIELDS = ("scan_request_id", "graph_id", "platform")
 
 
 def _new_id() -> str:
@@ -24,11 +31,52 @@ def _now() -> datetime:
 
 
 class BaseEvent(BaseModel):
-    """Base event — all events carry an ID and timestamp."""
+    """Base event — all events carry an ID and timestamp.
+
+    ``schema_version`` is bumped whenever an event's shape changes
+    incompatibly; see ``atlas_sdk.schema_registry`` for wire framing.
+    ``trace`` follows one scan across services; see ``atlas_sdk.tracing``.
+    """
+
+    schema_version: ClassVar[int] = 1
 
     event_id: str = Field(default_factory=_new_id)
     timestamp: datetime = Field(default_factory=_now)
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: Metadata = Field(default_factory=dict)
+    trace: TraceContext | None = None
+
+    def start_trace(self, producer: str = "", *, trace_id: str | None = None) -> TraceContext:
+        """Make this event the root of a new trace."""
+        hop = Hop(event_type=type(self).__name__, producer=producer)
+        self.trace = TraceContext(hops=[hop])
+        if trace_id is not None:
+            self.trace.trace_id = trace_id
+        return self.trace
+
+    def mark_enqueued(self, producer: str | None = None, at: datetime | None = None) -> None:
+        """Stamp the moment this event is written to its stream."""
+        mark_enqueued(self, producer, at)
+
+    def mark_dequeued(self, consumer: str, at: datetime | None = None) -> None:
+        """Stamp the moment ``consumer`` reads this event."""
+        mark_dequeued(self, consumer, at)
+
+    def derive(self, event_cls: type[_E], *, producer: str | None = None, **fields: Any) -> _E:
+        """Build the next event in the pipeline, carrying this event's trace.
+
+        ``producer`` defaults to the service that consumed this event.
+        ``scan_request_id``, ``graph_id`` and ``platform`` are copied over
+        when ``event_cls`` declares them and they are not given.
+        """
+        trace = self.trace or self.start_trace()
+        for name in _CARRIED_FIELDS:
+            if name in event_cls.model_fields and name not in fields and hasattr(self, name):
+                fields[name] = getattr(self, name)
+        if isinstance(self, ScanRequestEvent) and "scan_request_id" in event_cls.model_fields:
+            fields.setdefault("scan_request_id", self.event_id)
+        child_producer = trace.current.consumer if producer is None else producer
+        fields["trace"] = trace.child(event_cls.__name__, child_producer)
+        return event_cls(**fields)
 
 
 class ScanRequestEvent(BaseEvent):
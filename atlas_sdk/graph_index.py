@@ -0,0 +1,62 @@
+"""Hash indexes over a CICDGraph.
+
+``CICDGraph.get_node`` / ``get_edges_from`` / ``get_edges_to`` scan the
+node and edge lists on every call. ``GraphIndex`` builds id and adjacency
+dictionaries once so the same lookups are O(1) (or O(degree)).
+
+The index is a snapshot: rebuild it after mutating the graph it was built
+from.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from atlas_sdk.models.edges import Edge
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.models.nodes import Node
+
+
+class GraphIndex:
+    """Read-only id and adjacency index of a CICDGraph."""
+
+    def __init__(self, graph: CICDGraph) -> None:
+        self.graph = graph
+        self.nodes_by_id: dict[str, Node] = {n.id: n for n in graph.nodes}
+        self.edges_by_id: dict[str, Edge] = {}
+        self.outgoing: dict[str, list[Edge]] = {}
+        self.incoming: dict[str, list[Edge]] = {}
+        for edge in graph.edges:
+            self.edges_by_id[edge.id] = edge
+            self.outgoing.setdefault(edge.source_node_id, []).append(edge)
+            self.incoming.setdefault(edge.target_node_id, []).append(edge)
+
+    @property
+    def node_count(self) -> int:
+        return len(self.nodes_by_id)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.edges_by_id)
+
+    def iter_nodes(self) -> Iterator[Node]:
+        return iter(self.nodes_by_id.values())
+
+    def iter_edges(self) -> Iterator[Edge]:
+        return iter(self.edges_by_id.values())
+
+    def get_node(self, node_id: str) -> Node | None:
+        """Find a node by its ID."""
+        return self.nodes_by_id.get(node_id)
+
+    def get_edge(self, edge_id: str) -> Edge | None:
+        """Find an edge by its ID."""
+        return self.edges_by_id.get(edge_id)
+
+    def get_edges_from(self, node_id: str) -> list[Edge]:
+        """Get all edges originating from a node."""
+        return list(self.outgoing.get(node_id, ()))
+
+    def get_edges_to(self, node_id: str) -> list[Edge]:
+        """Get all edges pointing to a node."""
+        return list(self.incoming.get(node_id, ()))
@@ -0,0 +1,380 @@
+"""Container image references, pin status and digest resolution.
+
+``parse_image_reference`` normalizes a Docker/OCI reference the way the
+Docker CLI does (``nginx`` → ``docker.io/library/nginx:latest``) and
+derives pin status from it: an image is pinned when its reference names a
+digest. Parsing is pure and memoized, so the thousands of repeated
+references in an estate are parsed once.
+
+Tag → digest lookups go through a ``Resolver`` (a registry client; the SDK
+ships ``StubResolver`` for tests and offline use) behind a ``DigestCache``:
+a thread-safe in-memory LRU with TTLs (shorter for "not found"), optionally
+backed by a ``CacheBackend`` on local disk such as
+``atlas_sdk.storage.SQLiteDigestCache`` so results survive across scans.
+
+``ImageCatalog.apply`` bulk-updates every ``ContainerImageNode`` in a
+graph: each distinct reference is parsed and resolved once, then
+``registry``, ``tag``, ``pinned`` and ``digest`` are written back.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Protocol
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.models.nodes import ContainerImageNode
+
+DEFAULT_REGISTRY = "docker.io"
+DEFAULT_TAG = "latest"
+DEFAULT_TTL_SECONDS = 3600.0
+DEFAULT_NEGATIVE_TTL_SECONDS = 300.0
+DEFAULT_CACHE_SIZE = 4096
+
+_REGISTRY_ALIASES = {"index.docker.io": DEFAULT_REGISTRY, "registry-1.docker.io": DEFAULT_REGISTRY}
+_COMPONENT = re.compile(r"[a-z0-9]+(?:(?:[._]|__|-+)[a-z0-9]+)*")
+_TAG = re.compile(r"[\w][\w.-]{0,127}")
+_DIGEST = re.compile(r"[a-z0-9]+(?:[.+_-][a-z0-9]+)*:[a-zA-Z0-9=_-]{32,}")
+
+
+class ImageReference(BaseModel):
+    """A normalized container image reference."""
+
+    model_config = ConfigDict(frozen=True)
+
+    registry: str = DEFAULT_REGISTRY
+    repository: str
+    tag: str | None = None
+    digest: str | None = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.registry}/{self.repository}"
+
+    @property
+    def pinned(self) -> bool:
+        """Pinned references name an immutable digest."""
+        return self.digest is not None
+
+    @property
+    def tag_reference(self) -> str:
+        """``registry/repository:tag`` — the key digests are resolved by."""
+        return f"{self.name}:{self.tag or DEFAULT_TAG}"
+
+    def __str__(self) -> str:
+        text = self.name if self.tag is None else f"{self.name}:{self.tag}"
+        return text if self.digest is None else f"{text}@{self.digest}"
+
+
+def _has_registry(text: str) -> bool:
+    first, _, rest = text.partition("/")
+    return bool(rest) and ("." in first or ":" in first or first == "localhost")
+
+
+@lru_cache(maxsize=8192)
+def parse_image_reference(reference: str) -> ImageReference:
+    """Parse and normalize an image reference.
+
+    Raises:
+        ValueError: If ``reference`` is not a valid image reference.
+    """
+    text = reference.strip()
+    digest = None
+    if "@" in text:
+        text, digest = text.split("@", 1)
+        if not _DIGEST.fullmatch(digest):
+            raise ValueError(f"invalid digest in image reference {reference!r}")
+    tag = None
+    slash = text.rfind("/")
+    colon = text.rfind(":")
+    if colon > slash:
+        text, tag = text[:colon], text[colon + 1 :]
+        if not _TAG.fullmatch(tag):
+            raise ValueError(f"invalid tag in image reference {reference!r}")
+
+    registry = DEFAULT_REGISTRY
+    if _has_registry(text):
+        first, text = text.split("/", 1)
+        registry = first.lower()
+    registry = _REGISTRY_ALIASES.get(registry, registry)
+    if registry == DEFAULT_REGISTRY and "/" not in text:
+        text = f"library/{text}"
+    if not text or not all(_COMPONENT.fullmatch(part) for part in text.split("/")):
+        raise ValueError(f"invalid repository in image reference {reference!r}")
+    if tag is None and digest is None:
+        tag = DEFAULT_TAG
+    return ImageReference(registry=registry, repository=text, tag=tag, digest=digest)
+
+
+def reference_for_node(node: ContainerImageNode) -> ImageReference:
+    """The reference a ``ContainerImageNode`` was declared with.
+
+    ``name`` may be a full reference or just the repository, with
+    ``registry`` and ``tag`` carried separately. A stored ``digest`` only
+    counts as part of the reference when the node is marked ``pinned``;
+    otherwise it is a previously resolved digest, not a pin.
+    """
+    text = node.name.strip()
+    if node.registry and not _has_registry(text):
+        text = f"{node.registry.rstrip('/')}/{text}"
+    name_part = text.split("@", 1)[0]
+    if node.tag and name_part.rfind(":") <= name_part.rfind("/"):
+        text = f"{name_part}:{node.tag}" + text[len(name_part) :]
+    if node.pinned and node.digest and "@" not in text:
+        text = f"{text}@{node.digest}"
+    return parse_image_reference(text)
+
+
+# ── Resolution ────────────────────────────────────────────────────────
+
+
+class Resolver(Protocol):
+    """Looks up the digest a tag currently points to (``None`` if unknown)."""
+
+    def resolve(self, reference: ImageReference) -> str | None: ...
+
+
+class StubResolver:
+    """Offline resolver with fixed or deterministic digests.
+
+    Args:
+        digests: Digests by ``tag_reference`` (or plain reference, which is
+            normalized first).
+        default: Resolve unknown references to a digest derived from the
+            reference itself; when false they are "not found".
+    """
+
+    def __init__(self, digests: Mapping[str, str] | None = None, *, default: bool = True) -> None:
+        self.digests = {
+            parse_image_reference(ref).tag_reference: digest
+            for ref, digest in (digests or {}).items()
+        }
+        self.default = default
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def resolve(self, reference: ImageReference) -> str | None:
+        key = reference.tag_reference
+        with self._lock:
+            self.calls.append(key)
+        if key in self.digests:
+            return self.digests[key]
+        if self.default:
+            return "sha256:" + hashlib.sha256(key.encode()).hexdigest()
+        return None
+
+
+class CacheBackend(Protocol):
+    """Persistent store behind ``DigestCache``: ``(digest, expires_at)`` by reference."""
+
+    def get(self, reference: str) -> tuple[str | None, float] | None: ...
+
+    def set(self, reference: str, digest: str | None, expires_at: float) -> None: ...
+
+    def delete(self, reference: str) -> None: ...
+
+
+class DigestCache:
+    """Thread-safe LRU/TTL cache of tag reference → digest (or ``None``).
+
+    Args:
+        max_entries: In-memory entries kept (least recently used evicted).
+        ttl_seconds: Lifetime of a resolved digest.
+        negative_ttl_seconds: Lifetime of a "not found" answer.
+        backend: Optional persistent backend consulted on memory misses
+            and written through on every ``put``.
+        clock: Time source (seconds), for tests.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_SIZE,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+        backend: CacheBackend | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.backend = backend
+        self.clock = clock
+        self._entries: OrderedDict[str, tuple[str | None, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.backend_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, reference: str) -> tuple[str | None, float] | None:
+        """``(digest, expires_at)`` for a live entry, else ``None``."""
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(reference)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(reference)
+                self.hits += 1
+                return entry
+            if entry is not None:
+                del self._entries[reference]
+        if self.backend is not None:
+            entry = self.backend.get(reference)
+            if entry is not None and entry[1] > now:
+                with self._lock:
+                    self._store(reference, entry)
+                    self.backend_hits += 1
+                return entry
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, reference: str, digest: str | None) -> None:
+        ttl = self.ttl_seconds if digest is not None else self.negative_ttl_seconds
+        entry = (digest, self.clock() + ttl)
+        with self._lock:
+            self._store(reference, entry)
+        if self.backend is not None:
+            self.backend.set(reference, *entry)
+
+    def invalidate(self, reference: str) -> None:
+        with self._lock:
+            self._entries.pop(reference, None)
+        if self.backend is not None:
+            self.backend.delete(reference)
+
+    def clear(self) -> None:
+        """Drop in-memory entries (the backend is left alone)."""
+        with self._lock:
+            self._entries.clear()
+
+    def _store(self, reference: str, entry: tuple[str | None, float]) -> None:
+        self._entries[reference] = entry
+        self._entries.move_to_end(reference)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+_shared_cache: DigestCache | None = None
+
+
+def shared_cache() -> DigestCache:
+    """The process-wide in-memory ``DigestCache`` used by default."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = DigestCache()
+    return _shared_cache
+
+
+class ImagePinReport(BaseModel):
+    """Outcome of applying pin status and digests to a graph."""
+
+    graph_id: str
+    images: int = 0
+    distinct_references: int = 0
+    pinned: int = 0
+    resolved: int = 0
+    unresolved: int = 0
+    resolver_calls: int = 0
+    updated_node_ids: list[str] = Field(default_factory=list)
+    invalid_node_ids: list[str] = Field(default_factory=list)
+
+
+class ImageCatalog:
+    """Resolves image references through a cache and applies them to graphs."""
+
+    def __init__(self, resolver: Resolver, cache: DigestCache | None = None) -> None:
+        self.resolver = resolver
+        self.cache = cache if cache is not None else shared_cache()
+        self.resolver_calls = 0
+
+    def resolve(self, reference: str | ImageReference) -> str | None:
+        """Digest for ``reference``: its own if pinned, else the cached/resolved one."""
+        if isinstance(reference, str):
+            reference = parse_image_reference(reference)
+        if reference.digest is not None:
+            return reference.digest
+        return self.resolve_many([reference])[reference.tag_reference]
+
+    def resolve_many(
+        self, references: Iterable[ImageReference], *, max_workers: int = 1
+    ) -> dict[str, str | None]:
+        """Digests by ``tag_reference``; each distinct miss hits the resolver once.
+
+        Resolvers usually wait on the network, so ``max_workers > 1``
+        resolves misses in a thread pool.
+        """
+        distinct = {ref.tag_reference: ref for ref in references}
+        results: dict[str, str | None] = {}
+        misses = []
+        for key, ref in distinct.items():
+            entry = self.cache.get(key)
+            if entry is None:
+                misses.append(ref)
+            else:
+                results[key] = entry[0]
+        if max_workers > 1 and len(misses) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                digests = list(pool.map(self.resolver.resolve, misses))
+        else:
+            digests = [self.resolver.resolve(ref) for ref in misses]
+        self.resolver_calls += len(misses)
+        for ref, digest in zip(misses, digests):
+            self.cache.put(ref.tag_reference, digest)
+            results[ref.tag_reference] = digest
+        return results
+
+    def apply(
+        self, graph: CICDGraph, *, resolve: bool = True, max_workers: int = 1
+    ) -> ImagePinReport:
+        """Normalize every ``ContainerImageNode`` in ``graph`` in place.
+
+        ``registry``, ``tag`` and ``pinned`` are re-derived from the
+        reference. Unpinned images get the digest their tag resolves to
+        (kept unchanged when resolution fails); ``resolve=False`` skips
+        lookups. Nodes whose reference does not parse are reported and
+        left untouched.
+        """
+        report = ImagePinReport(graph_id=graph.id)
+        parsed: list[tuple[ContainerImageNode, ImageReference]] = []
+        for node in graph.nodes:
+            if not isinstance(node, ContainerImageNode):
+                continue
+            report.images += 1
+            try:
+                parsed.append((node, reference_for_node(node)))
+            except ValueError:
+                report.invalid_node_ids.append(node.id)
+        report.distinct_references = len({str(ref) for _, ref in parsed})
+
+        digests: dict[str, str | None] = {}
+        if resolve:
+            calls = self.resolver_calls
+            unpinned = (ref for _, ref in parsed if not ref.pinned)
+            digests = self.resolve_many(unpinned, max_workers=max_workers)
+            report.resolver_calls = self.resolver_calls - calls
+
+        for node, ref in parsed:
+            digest = ref.digest or digests.get(ref.tag_reference) or node.digest
+            if ref.pinned:
+                report.pinned += 1
+            elif resolve and digests.get(ref.tag_reference) is not None:
+                report.resolved += 1
+            elif resolve:
+                report.unresolved += 1
+            values = (ref.registry, ref.tag, ref.pinned, digest)
+            if (node.registry, node.tag, node.pinned, node.digest) != values:
+                node.registry, node.tag, node.pinned, node.digest = values
+                report.updated_node_ids.append(node.id)
+        return report
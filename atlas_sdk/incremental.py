@@ -0,0 +1,343 @@
+"""Incremental rule re-evaluation over graph changes.
+
+``IncrementalRuleEngine`` runs rules like ``RuleEngine`` but splits each
+rule's work into *scopes* — one per dispatched node, one per dispatched
+edge, and one for ``finish`` — and records what every scope read through
+its ``RuleContext``:
+
+- node and edge IDs looked up (including misses, so a later addition of
+  that ID is noticed),
+- nodes whose outgoing or incoming edge lists were read,
+- node types enumerated via ``nodes_of_type``,
+- the whole graph, if the rule reached for ``ctx.graph`` or ``ctx.index``.
+
+Given the next version of the graph (and optionally the ``GraphDiff`` that
+produced it; otherwise it is computed with ``diff_graphs``), ``update``
+re-runs only scopes whose dependencies changed plus scopes for new
+subjects, drops scopes whose subject disappeared, and carries every other
+finding forward unchanged. A rescan of an unchanged repository re-runs
+nothing.
+
+Rules must be stateless across calls for this to be sound: whatever
+``finish`` needs must be read from the context, not accumulated in
+``check_node``/``check_edge``.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from atlas_sdk.enums import NodeType
+from atlas_sdk.graph_index import GraphIndex
+from atlas_sdk.models.edges import Edge
+from atlas_sdk.models.findings import Finding
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.models.nodes import Node
+from atlas_sdk.overlay import GraphDiff, diff_graphs
+from atlas_sdk.rules import Rule, RuleContext, RuleEngine, RuleResult, RuleRunReport
+
+ScopeKind = Literal["node", "edge", "finish"]
+ScopeKey = tuple[str, ScopeKind, str]
+
+
+class FindingDependencies(BaseModel):
+    """Everything the rule invocation that produced a finding read."""
+
+    node_ids: list[str] = Field(default_factory=list)
+    edge_ids: list[str] = Field(default_factory=list)
+    outgoing_of: list[str] = Field(default_factory=list)
+    incoming_of: list[str] = Field(default_factory=list)
+    node_types: list[NodeType] = Field(default_factory=list)
+    whole_graph: bool = False
+
+
+class _Scope:
+    __slots__ = ("edges", "everything", "findings", "incoming", "nodes", "outgoing", "types")
+
+    def __init__(self) -> None:
+        self.findings: list[Finding] = []
+        self.nodes: set[str] = set()
+        self.edges: set[str] = set()
+        self.outgoing: set[str] = set()
+        self.incoming: set[str] = set()
+        self.types: set[NodeType] = set()
+        self.everything = False
+
+
+class _TrackingContext(RuleContext):
+    """A ``RuleContext`` that records reads into the active scope."""
+
+    def __init__(self, inner: RuleContext) -> None:
+        self._inner = inner
+        self.scope = _Scope()
+
+    @property
+    def graph(self) -> CICDGraph:  # type: ignore[override]
+        self.scope.everything = True
+        return self._inner.graph
+
+    @property
+    def index(self) -> GraphIndex:  # type: ignore[override]
+        self.scope.everything = True
+        return self._inner.index
+
+    def get_node(self, node_id: str) -> Node | None:
+        self.scope.nodes.add(node_id)
+        return self._inner.get_node(node_id)
+
+    def get_edges_from(self, node_id: str) -> list[Edge]:
+        self.scope.outgoing.add(node_id)
+        return self._inner.get_edges_from(node_id)
+
+    def get_edges_to(self, node_id: str) -> list[Edge]:
+        self.scope.incoming.add(node_id)
+        return self._inner.get_edges_to(node_id)
+
+    def nodes_of_type(self, node_type: NodeType) -> list[Node]:
+        self.scope.types.add(node_type)
+        return self._inner.nodes_of_type(node_type)
+
+
+class IncrementalRunReport(RuleRunReport):
+    """A ``RuleRunReport`` plus how much work the update reused."""
+
+    scopes_rerun: int = 0
+    scopes_reused: int = 0
+    scopes_dropped: int = 0
+
+
+class IncrementalRuleEngine(RuleEngine):
+    """A ``RuleEngine`` that remembers per-scope dependencies between runs.
+
+    The first ``update`` evaluates everything; later calls re-evaluate
+    only what the change set invalidates. ``RuleResult.seconds`` and the
+    ``*_checked`` counts cover the work done in that call, while
+    ``findings`` always hold the rule's full current findings.
+    """
+
+    def __init__(self, rules: Iterable[Rule]) -> None:
+        super().__init__(rules)
+        self._rules_by_id = {rule.rule_id: rule for rule in self.rules}
+        self._reset()
+
+    def _reset(self) -> None:
+        self._index: GraphIndex | None = None
+        self._scopes: dict[str, dict[ScopeKey, _Scope]] = {r.rule_id: {} for r in self.rules}
+        self._failed: dict[ScopeKey, str] = {}
+        self._by_node: dict[str, set[ScopeKey]] = {}
+        self._by_edge: dict[str, set[ScopeKey]] = {}
+        self._by_outgoing: dict[str, set[ScopeKey]] = {}
+        self._by_incoming: dict[str, set[ScopeKey]] = {}
+        self._by_type: dict[NodeType, set[ScopeKey]] = {}
+        self._by_everything: set[ScopeKey] = set()
+
+    def reset(self) -> None:
+        """Forget all recorded state; the next ``update`` runs in full."""
+        self._reset()
+
+    # ── Queries ───────────────────────────────────────────────────────
+
+    @property
+    def findings(self) -> list[Finding]:
+        """Current findings of every rule, in rule order."""
+        return [f for scopes in self._scopes.values() for s in scopes.values() for f in s.findings]
+
+    def dependencies(self, finding_id: str) -> FindingDependencies | None:
+        """What the invocation that produced ``finding_id`` depended on."""
+        for scopes in self._scopes.values():
+            for scope in scopes.values():
+                if any(f.id == finding_id for f in scope.findings):
+                    return FindingDependencies(
+                        node_ids=sorted(scope.nodes),
+                        edge_ids=sorted(scope.edges),
+                        outgoing_of=sorted(scope.outgoing),
+                        incoming_of=sorted(scope.incoming),
+                        node_types=sorted(scope.types),
+                        whole_graph=scope.everything,
+                    )
+        return None
+
+    # ── Evaluation ────────────────────────────────────────────────────
+
+    def update(self, graph: CICDGraph, diff: GraphDiff | None = None) -> IncrementalRunReport:
+        """Bring findings up to date with ``graph``.
+
+        ``diff`` must describe the change from the previously evaluated
+        graph to ``graph``; when omitted it is computed by comparing the
+        two. Without a previous graph everything is evaluated.
+        """
+        started = time.perf_counter()
+        index = GraphIndex(graph)
+        if self._index is None:
+            work = self._full_work(graph)
+            dropped: set[ScopeKey] = set()
+        else:
+            if diff is None:
+                diff = diff_graphs(self._index, index)
+            work, dropped = self._invalidated(diff, index)
+        known = sum(len(scopes) for scopes in self._scopes.values())
+        rerun = sum(len(keys) for keys in work.values())
+        replaced = [k for keys in work.values() for k in keys if k in self._scopes[k[0]]]
+        reused = known - len(replaced) - sum(1 for k in dropped if k in self._scopes[k[0]])
+        for key in dropped:
+            self._forget(key)
+            self._scopes[key[0]].pop(key, None)
+            self._failed.pop(key, None)
+
+        ctx = _TrackingContext(RuleContext(graph, index))
+        results = []
+        for rule in self.rules:
+            keys = work.get(rule.rule_id, [])
+            rule_started = time.perf_counter()
+            for key in keys:
+                self._evaluate(rule, key, ctx)
+            results.append(
+                RuleResult(
+                    rule_id=rule.rule_id,
+                    findings=[f for s in self._scopes[rule.rule_id].values() for f in s.findings],
+                    seconds=time.perf_counter() - rule_started,
+                    nodes_checked=sum(1 for key in keys if key[1] == "node"),
+                    edges_checked=sum(1 for key in keys if key[1] == "edge"),
+                    error=next((e for k, e in self._failed.items() if k[0] == rule.rule_id), None),
+                )
+            )
+        self._index = index
+        return IncrementalRunReport(
+            graph_id=graph.id,
+            results=results,
+            wall_seconds=time.perf_counter() - started,
+            scopes_rerun=rerun,
+            scopes_reused=reused,
+            scopes_dropped=len(dropped),
+        )
+
+    def _full_work(self, graph: CICDGraph) -> dict[str, list[ScopeKey]]:
+        work: dict[str, list[ScopeKey]] = {}
+        for rule, (node_ids, edge_ids) in zip(self.rules, self.dispatch(graph)):
+            keys: list[ScopeKey] = [(rule.rule_id, "node", n) for n in node_ids]
+            keys.extend((rule.rule_id, "edge", e) for e in edge_ids)
+            keys.append((rule.rule_id, "finish", ""))
+            work[rule.rule_id] = keys
+        return work
+
+    def _invalidated(
+        self, diff: GraphDiff, index: GraphIndex
+    ) -> tuple[dict[str, list[ScopeKey]], set[ScopeKey]]:
+        """Scopes to re-run (per rule, in order) and scopes to drop."""
+        old = self._index
+        if old is None:
+            raise RuntimeError("no previous run to invalidate against")
+        node_ids = diff.changed_node_ids
+        edge_ids = diff.changed_edge_ids
+        outgoing: set[str] = set()
+        incoming: set[str] = set()
+        for edge_id in edge_ids:
+            for edge in (old.get_edge(edge_id), index.get_edge(edge_id)):
+                if edge is not None:
+                    outgoing.add(edge.source_node_id)
+                    incoming.add(edge.target_node_id)
+        types: set[NodeType] = set()
+        for node_id in node_ids:
+            for node in (old.get_node(node_id), index.get_node(node_id)):
+                if node is not None:
+                    types.add(node.node_type)
+
+        stale: set[ScopeKey] = set(self._failed)
+        if node_ids or edge_ids:
+            stale |= self._by_everything
+        for ids, reverse in (
+            (node_ids, self._by_node),
+            (edge_ids, self._by_edge),
+            (outgoing, self._by_outgoing),
+            (incoming, self._by_incoming),
+            (types, self._by_type),
+        ):
+            for key in ids:
+                stale |= reverse.get(key, set())
+
+        # Subjects that are new, or whose type may now route them to other rules.
+        for node in (*diff.added_nodes, *diff.modified_nodes):
+            for position in self._by_node_type.get(node.node_type, ()):
+                stale.add((self.rules[position].rule_id, "node", node.id))
+        for edge in (*diff.added_edges, *diff.modified_edges):
+            for position in self._by_edge_type.get(edge.edge_type, ()):
+                stale.add((self.rules[position].rule_id, "edge", edge.id))
+
+        work: dict[str, list[ScopeKey]] = {}
+        dropped: set[ScopeKey] = set()
+        for key in stale:
+            rule_id, kind, subject = key
+            rule = self._rules_by_id[rule_id]
+            if kind == "node":
+                node = index.get_node(subject)
+                live = node is not None and node.node_type in rule.node_types
+            elif kind == "edge":
+                edge = index.get_edge(subject)
+                live = edge is not None and edge.edge_type in rule.edge_types
+            else:
+                live = True
+            if live:
+                work.setdefault(rule_id, []).append(key)
+            elif key in self._scopes[rule_id] or key in self._failed:
+                dropped.add(key)
+        order = {"node": 0, "edge": 1, "finish": 2}
+        for keys in work.values():
+            keys.sort(key=lambda k: (order[k[1]], k[2]))
+        return work, dropped
+
+    def _evaluate(self, rule: Rule, key: ScopeKey, ctx: _TrackingContext) -> None:
+        _, kind, subject = key
+        ctx.scope = scope = _Scope()
+        try:
+            if kind == "node":
+                scope.nodes.add(subject)
+                node = ctx._inner.index.nodes_by_id[subject]
+                scope.findings.extend(rule.check_node(node, ctx))
+            elif kind == "edge":
+                scope.edges.add(subject)
+                edge = ctx._inner.index.edges_by_id[subject]
+                scope.findings.extend(rule.check_edge(edge, ctx))
+            else:
+                scope.findings.extend(rule.finish(ctx))
+        except Exception as exc:  # noqa: BLE001 — one broken rule must not sink the run
+            self._forget(key)
+            self._scopes[rule.rule_id].pop(key, None)
+            self._failed[key] = f"{type(exc).__name__}: {exc}"
+            return
+        self._failed.pop(key, None)
+        self._forget(key)
+        self._scopes[rule.rule_id][key] = scope
+        self._remember(key, scope)
+
+    def _remember(self, key: ScopeKey, scope: _Scope) -> None:
+        for ids, reverse in self._reverse_indexes(scope):
+            for dep in ids:
+                reverse.setdefault(dep, set()).add(key)
+        if scope.everything:
+            self._by_everything.add(key)
+
+    def _forget(self, key: ScopeKey) -> None:
+        scope = self._scopes[key[0]].get(key)
+        if scope is None:
+            return
+        for ids, reverse in self._reverse_indexes(scope):
+            for dep in ids:
+                keys = reverse.get(dep)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del reverse[dep]
+        self._by_everything.discard(key)
+
+    def _reverse_indexes(self, scope: _Scope) -> list[tuple[set, dict]]:
+        return [
+            (scope.nodes, self._by_node),
+            (scope.edges, self._by_edge),
+            (scope.outgoing, self._by_outgoing),
+            (scope.incoming, self._by_incoming),
+            (scope.types, self._by_type),
+        ]
@@ -0,0 +1,373 @@
+"""Opt-in instrumentation for SDK hot paths.
+
+``enable()`` wraps model validation (``__init__``, ``model_validate``,
+``model_validate_json``), ``model_dump_json``, ``SchemaRegistry`` event
+encode/decode and graph lookups (``CICDGraph`` and ``GraphIndex``
+``get_node`` / ``get_edges_from`` / ``get_edges_to``) so every call
+records its duration and, where there is a payload, its size in bytes.
+``disable()`` restores the original methods, so instrumentation costs
+nothing at all while it is off.
+
+Each call produces one ``Measurement`` keyed by operation and target
+(the model or event class name, or ``Class.method`` for lookups) and is
+passed to every sink: a ``MetricsRegistry`` aggregates counts, bytes and
+timing histograms in process and renders them in the Prometheus text
+format; ``OpenTelemetrySink`` forwards values to OpenTelemetry-style
+``record(value, attributes)`` callables such as ``Histogram.record``.
+
+Only calls made from Python are seen: models validated as part of a
+parent model are covered by the parent's measurement.
+"""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import importlib
+import inspect
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+from pydantic import BaseModel
+
+# Upper bounds in seconds, 1 µs … ~10 s.
+DEFAULT_BUCKETS: tuple[float, ...] = tuple(
+    round(base * 10.0**exp, 9) for exp in range(-6, 1) for base in (1.0, 2.5, 5.0)
+) + (10.0,)
+
+_MODEL_MODULES = (
+    "atlas_sdk.confidence",
+    "atlas_sdk.events",
+    "atlas_sdk.models.edges",
+    "atlas_sdk.models.findings",
+    "atlas_sdk.models.graph",
+    "atlas_sdk.models.nodes",
+    "atlas_sdk.models.notifications",
+    "atlas_sdk.models.proposals",
+    "atlas_sdk.models.refactors",
+    "atlas_sdk.models.scan_history",
+    "atlas_sdk.models.simulation",
+)
+_LOOKUPS = ("get_node", "get_edges_from", "get_edges_to")
+
+
+@dataclass(slots=True, frozen=True)
+class Measurement:
+    """One instrumented call."""
+
+    operation: str  # validate, dump_json, encode, decode, lookup
+    target: str
+    seconds: float
+    nbytes: int | None = None
+
+
+class Sink(Protocol):
+    def record(self, measurement: Measurement) -> None: ...
+
+
+@dataclass(slots=True)
+class Histogram:
+    """Cumulative-on-export timing histogram with fixed bucket bounds."""
+
+    bounds: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """(upper bound, observations <= bound) pairs, ending with +Inf."""
+        running, pairs = 0, []
+        for bound, count in zip((*self.bounds, float("inf")), self.counts):
+            running += count
+            pairs.append((bound, running))
+        return pairs
+
+
+@dataclass(slots=True)
+class OperationStats:
+    calls: int = 0
+    bytes: int = 0
+    seconds: Histogram = field(default_factory=Histogram)
+
+
+class MetricsRegistry:
+    """In-process sink aggregating measurements per (operation, target)."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.stats: dict[tuple[str, str], OperationStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, measurement: Measurement) -> None:
+        key = (measurement.operation, measurement.target)
+        with self._lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = OperationStats(seconds=Histogram(self.buckets))
+            stats.calls += 1
+            if measurement.nbytes is not None:
+                stats.bytes += measurement.nbytes
+            stats.seconds.observe(measurement.seconds)
+
+    def get(self, operation: str, target: str) -> OperationStats | None:
+        return self.stats.get((operation, target))
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stats.clear()
+
+    def summary(self) -> list[dict[str, Any]]:
+        """One row per (operation, target), slowest total time first."""
+        rows = [
+            {
+                "operation": operation,
+                "target": target,
+                "calls": s.calls,
+                "bytes": s.bytes,
+                "seconds": s.seconds.total,
+                "mean_seconds": s.seconds.total / s.calls if s.calls else 0.0,
+            }
+            for (operation, target), s in self.stats.items()
+        ]
+        return sorted(rows, key=lambda r: -r["seconds"])
+
+    def to_prometheus(self, prefix: str = "atlas_sdk") -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        seconds, calls, nbytes = (
+            f"{prefix}_operation_{s}" for s in ("seconds", "calls_total", "bytes_total")
+        )
+        lines = [
+            f"# HELP {seconds} Time spent in instrumented SDK operations.",
+            f"# TYPE {seconds} histogram",
+        ]
+        with self._lock:
+            items = [
+                (f'operation="{operation}",target="{_escape(target)}"', s)
+                for (operation, target), s in sorted(self.stats.items())
+            ]
+        for labels, s in items:
+            for bound, count in s.seconds.cumulative():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{seconds}_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{seconds}_sum{{{labels}}} {s.seconds.total!r}")
+            lines.append(f"{seconds}_count{{{labels}}} {s.seconds.count}")
+        lines += [f"# HELP {calls} Instrumented SDK calls.", f"# TYPE {calls} counter"]
+        lines += [f"{calls}{{{labels}}} {s.calls}" for labels, s in items]
+        lines += [f"# HELP {nbytes} Payload bytes seen by SDK calls.", f"# TYPE {nbytes} counter"]
+        lines += [f"{nbytes}{{{labels}}} {s.bytes}" for labels, s in items if s.bytes]
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class OpenTelemetrySink:
+    """Forward measurements to OpenTelemetry-style instruments.
+
+    Args:
+        duration: Called as ``duration(seconds, attributes)``, e.g. the
+            ``record`` method of a ``Histogram`` from an OTel ``Meter``.
+        size: Optional ``size(nbytes, attributes)`` for payload sizes.
+    """
+
+    def __init__(
+        self,
+        duration: Callable[[float, dict[str, str]], object],
+        size: Callable[[int, dict[str, str]], object] | None = None,
+    ) -> None:
+        self.duration = duration
+        self.size = size
+
+    def record(self, measurement: Measurement) -> None:
+        attributes = {"atlas.operation": measurement.operation, "atlas.target": measurement.target}
+        self.duration(measurement.seconds, attributes)
+        if self.size is not None and measurement.nbytes is not None:
+            self.size(measurement.nbytes, attributes)
+
+
+# ── Patching ──────────────────────────────────────────────────────────
+
+_sinks: tuple[Sink, ...] = ()
+_patched: list[tuple[type, str, Any]] = []  # (class, attribute, original or _MISSING)
+_MISSING = object()
+_state_lock = threading.Lock()
+
+
+def _emit(operation: str, target: str, seconds: float, nbytes: int | None) -> None:
+    measurement = Measurement(operation, target, seconds, nbytes)
+    for sink in _sinks:
+        sink.record(measurement)
+
+
+def _sdk_models() -> list[type[BaseModel]]:
+    for module in _MODEL_MODULES:
+        importlib.import_module(module)
+    found, stack = [], [BaseModel]
+    while stack:
+        for sub in stack.pop().__subclasses__():
+            stack.append(sub)
+            if sub.__module__.startswith("atlas_sdk.") and sub not in found:
+                found.append(sub)
+    return found
+
+
+def _patch(cls: type, name: str, replacement: Any) -> None:
+    _patched.append((cls, name, cls.__dict__.get(name, _MISSING)))
+    setattr(cls, name, replacement)
+
+
+def _payload_size(data: Any) -> int | None:
+    return len(data) if isinstance(data, (str, bytes, bytearray)) else None
+
+
+def _model_wrappers(cls: type[BaseModel]) -> dict[str, Any]:
+    # Resolve originals statically so subclasses never wrap a wrapper.
+    init = inspect.getattr_static(cls, "__init__")
+    validate = inspect.getattr_static(cls, "model_validate").__func__
+    validate_json = inspect.getattr_static(cls, "model_validate_json").__func__
+    dump_json = inspect.getattr_static(cls, "model_dump_json")
+    target = cls.__name__
+    clock = time.perf_counter
+
+    @functools.wraps(init)
+    def __init__(self: BaseModel, /, **data: Any) -> None:
+        start = clock()
+        init(self, **data)
+        _emit("validate", target, clock() - start, None)
+
+    @functools.wraps(validate)
+    def model_validate(klass: type[BaseModel], obj: Any, *args: Any, **kwargs: Any) -> Any:
+        start = clock()
+        result = validate(klass, obj, *args, **kwargs)
+        _emit("validate", klass.__name__, clock() - start, None)
+        return result
+
+    @functools.wraps(validate_json)
+    def model_validate_json(klass: type[BaseModel], data: Any, *args: Any, **kwargs: Any) -> Any:
+        start = clock()
+        result = validate_json(klass, data, *args, **kwargs)
+        _emit("validate", klass.__name__, clock() - start, _payload_size(data))
+        return result
+
+    @functools.wraps(dump_json)
+    def model_dump_json(self: BaseModel, *args: Any, **kwargs: Any) -> str:
+        start = clock()
+        result = dump_json(self, *args, **kwargs)
+        _emit("dump_json", type(self).__name__, clock() - start, len(result))
+        return result
+
+    return {
+        "__init__": __init__,
+        "model_validate": classmethod(model_validate),
+        "model_validate_json": classmethod(model_validate_json),
+        "model_dump_json": model_dump_json,
+    }
+
+
+def _registry_wrappers(cls: type) -> dict[str, Any]:
+    encode, decode = cls.encode, cls.decode
+    clock = time.perf_counter
+
+    @functools.wraps(encode)
+    def wrapped_encode(self: Any, event: Any) -> bytes:
+        start = clock()
+        data = encode(self, event)
+        _emit("encode", type(event).__name__, clock() - start, len(data))
+        return data
+
+    @functools.wraps(decode)
+    def wrapped_decode(self: Any, data: bytes) -> Any:
+        start = clock()
+        event = decode(self, data)
+        _emit("decode", type(event).__name__, clock() - start, len(data))
+        return event
+
+    return {"encode": wrapped_encode, "decode": wrapped_decode}
+
+
+def _lookup_wrapper(cls: type, name: str) -> Callable[..., Any]:
+    original = getattr(cls, name)
+    target = f"{cls.__name__}.{name}"
+    clock = time.perf_counter
+
+    @functools.wraps(original)
+    def wrapper(self: Any, key: str) -> Any:
+        start = clock()
+        result = original(self, key)
+        _emit("lookup", target, clock() - start, None)
+        return result
+
+    return wrapper
+
+
+def enable(*sinks: Sink) -> MetricsRegistry | None:
+    """Start instrumenting; with no sinks a fresh ``MetricsRegistry`` is used.
+
+    Calling ``enable`` again replaces the sinks. Returns the registry when
+    one was created here.
+    """
+    global _sinks
+    created = None
+    if not sinks:
+        created = MetricsRegistry()
+        sinks = (created,)
+    with _state_lock:
+        _sinks = tuple(sinks)
+        if _patched:
+            return created
+
+        from atlas_sdk.graph_index import GraphIndex
+        from atlas_sdk.models.graph import CICDGraph
+        from atlas_sdk.schema_registry import SchemaRegistry
+
+        replacements: list[tuple[type, dict[str, Any]]] = [
+            (cls, _model_wrappers(cls)) for cls in _sdk_models()
+        ]
+        replacements.append((SchemaRegistry, _registry_wrappers(SchemaRegistry)))
+        for cls in (CICDGraph, GraphIndex):
+            replacements.append((cls, {name: _lookup_wrapper(cls, name) for name in _LOOKUPS}))
+        for cls, attrs in replacements:
+            for name, replacement in attrs.items():
+                _patch(cls, name, replacement)
+    return created
+
+
+def disable() -> None:
+    """Stop instrumenting and restore every wrapped method."""
+    global _sinks
+    with _state_lock:
+        while _patched:
+            cls, name, original = _patched.pop()
+            if original is _MISSING:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+        _sinks = ()
+
+
+def is_enabled() -> bool:
+    return bool(_patched)
+
+
+@contextmanager
+def instrumented(*sinks: Sink) -> Iterator[MetricsRegistry | None]:
+    """``enable`` for the duration of a ``with`` block."""
+    registry = enable(*sinks)
+    try:
+        yield registry
+    finally:
+        disable()
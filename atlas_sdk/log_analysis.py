@@ -0,0 +1,360 @@
+"""Streaming build-log analysis.
+
+Consumes CI build logs line by line — from an iterable, a file or an async
+stream — and runs every pattern detector in a single pass using one
+combined, precompiled regex. Memory stays bounded regardless of log size:
+only counters and a capped sample of matched patterns are retained.
+
+The result is a populated ``LogAnalysisEvent`` ready to publish on
+``atlas.logs.analyzed``. ``analyze_logs`` fans a batch of logs out across a
+process pool and merges the partial results deterministically.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+from collections.abc import AsyncIterable, Iterable, Mapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Union
+
+from pydantic import BaseModel, Field
+
+from atlas_sdk.events import LogAnalysisEvent, ScanResultEvent
+
+# docker pull/push/run options that take a separate value (``-e FOO=bar``),
+# so the value is not mistaken for the image.
+_DOCKER_VALUE_OPTIONS = (
+    r"-[ehlmpuvw]|--(?:add-host|cap-add|cap-drop|cpus|device|entrypoint|env|env-file"
+    r"|gpus|hostname|label|memory|mount|name|network|platform|publish|pull|restart"
+    r"|tmpfs|ulimit|user|volume|workdir)"
+)
+
+# Detector name → regex source. A detector may define a named group
+# ``<name>_subject`` to capture what it matched on (image, stage, duration).
+DEFAULT_DETECTORS: dict[str, str] = {
+    "error": r"\b(?:error|fatal|failure|failed)\b|traceback \(most recent call last\)",
+    "flaky": r"\b(?:flaky|retrying|retried|re-?running|timed out|intermittent)\b",
+    "cache_hit": r"\bcache hit\b|\brestored cache\b|\bcache restored\b|---> using cache\b",
+    "cache_miss": r"\bcache miss\b|\bcache not found\b|\bno cache found\b",
+    "docker": (
+        rf"\bdocker\s+(?:pull|push|run)\s+(?:(?:{_DOCKER_VALUE_OPTIONS})\s+\S+\s+|-\S+\s+)*"
+        r"(?P<docker_subject>[^\s-]\S*)"
+        r"|\bdocker\s+(?:build|compose|login)\b"
+    ),
+    "duration": (
+        r"\b(?:took|duration|elapsed|finished in|completed in)\b[:\s]*"
+        r"(?P<duration_subject>\d+(?:\.\d+)?\s*(?:ms|s|sec|seconds|min|minutes|m|h)\b)"
+    ),
+    "stage": r"(?:\[Pipeline\] \{ \(|##\[group\](?:Run )?)(?P<stage_subject>[^)\r\n]+)",
+}
+
+# Detector name → LogAnalysisEvent counter field.
+COUNTER_FIELDS: dict[str, str] = {
+    "error": "errors",
+    "flaky": "flaky_signals",
+    "cache_hit": "cache_hits",
+    "cache_miss": "cache_misses",
+    "docker": "docker_steps",
+    "duration": "duration_mentions",
+}
+
+DEFAULT_MAX_PATTERNS = 1000
+DEFAULT_MAX_LINE_CHARS = 64 * 1024
+_MAX_MATCH_CHARS = 200
+
+
+@lru_cache(maxsize=32)
+def _compile(items: tuple[tuple[str, str], ...]) -> re.Pattern[str]:
+    return re.compile(
+        "|".join(f"(?P<{name}>{source})" for name, source in items),
+        re.IGNORECASE,
+    )
+
+
+def compile_detectors(detectors: Mapping[str, str] | None = None) -> re.Pattern[str]:
+    """Combine detectors into one alternation regex (cached per detector set)."""
+    return _compile(tuple((detectors or DEFAULT_DETECTORS).items()))
+
+
+class LogAnalyzer:
+    """Incremental, single-pass analyzer for one or more build logs.
+
+    Args:
+        detectors: Detector name → regex source. Defaults to ``DEFAULT_DETECTORS``.
+        source: Label attached to every recorded pattern (e.g. a build id).
+        max_patterns: Cap on pattern samples kept for ``LogAnalysisEvent.patterns``.
+            Counters keep counting past the cap.
+        max_line_chars: Longer lines are analyzed in pieces of this size.
+    """
+
+    def __init__(
+        self,
+        detectors: Mapping[str, str] | None = None,
+        *,
+        source: str | None = None,
+        max_patterns: int = DEFAULT_MAX_PATTERNS,
+        max_line_chars: int = DEFAULT_MAX_LINE_CHARS,
+    ) -> None:
+        self.detectors = dict(detectors or DEFAULT_DETECTORS)
+        self.source = source
+        self.max_patterns = max_patterns
+        self.max_line_chars = max_line_chars
+        self._matcher = compile_detectors(self.detectors)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all counters and samples."""
+        self.counts: dict[str, int] = dict.fromkeys(self.detectors, 0)
+        self.patterns: list[dict[str, Any]] = []
+        self.lines_read = 0
+        self.chars_read = 0
+
+    @property
+    def total_patterns(self) -> int:
+        return sum(self.counts.values())
+
+    def feed(self, line: str | bytes) -> None:
+        """Analyze a single log line."""
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", errors="replace")
+        self.lines_read += 1
+        self.chars_read += len(line)
+        for start in range(0, max(len(line), 1), self.max_line_chars):
+            self._scan(line[start : start + self.max_line_chars], self.lines_read)
+
+    def _scan(self, text: str, line_no: int) -> None:
+        for match in self._matcher.finditer(text):
+            kind = match.lastgroup
+            if kind is None:
+                continue
+            self.counts[kind] += 1
+            if len(self.patterns) < self.max_patterns:
+                pattern: dict[str, Any] = {
+                    "type": kind,
+                    "line": line_no,
+                    "match": match.group(kind)[:_MAX_MATCH_CHARS],
+                }
+                subject = match.groupdict().get(f"{kind}_subject")
+                if subject:
+                    pattern["subject"] = subject.strip()
+                if self.source is not None:
+                    pattern["source"] = self.source
+                self.patterns.append(pattern)
+
+    def feed_lines(self, lines: Iterable[str | bytes]) -> LogAnalyzer:
+        """Analyze every line of an iterable (e.g. an open file)."""
+        for line in lines:
+            self.feed(line)
+        return self
+
+    def feed_text(self, text: str | bytes) -> LogAnalyzer:
+        """Analyze an in-memory log body without splitting it into a list.
+
+        Bytes are decoded as UTF-8, replacing invalid sequences.
+        """
+        if isinstance(text, bytes):
+            text = text.decode("utf-8", errors="replace")
+        for match in re.finditer(r"[^\n]*\n|[^\n]+$", text):
+            self.feed(match.group())
+        return self
+
+    def feed_file(self, path: str | os.PathLike[str]) -> LogAnalyzer:
+        """Stream a log file from disk, reading at most one line piece at a time."""
+        with open(path, encoding="utf-8", errors="replace") as fh:
+            pending = False
+            piece = fh.readline(self.max_line_chars)
+            while piece:
+                if piece.endswith("\n"):
+                    self.feed(piece)
+                    pending = False
+                else:
+                    # Partial piece of an over-long line (or a last line without
+                    # a newline): scan it without advancing the line counter
+                    # until the newline arrives.
+                    self.chars_read += len(piece)
+                    self._scan(piece, self.lines_read + 1)
+                    pending = True
+                piece = fh.readline(self.max_line_chars)
+            if pending:
+                self.lines_read += 1
+        return self
+
+    async def feed_async(self, lines: AsyncIterable[str | bytes]) -> LogAnalyzer:
+        """Analyze lines as they arrive from an async iterator."""
+        async for line in lines:
+            self.feed(line)
+        return self
+
+    def to_event(self, scan_request_id: str, **fields: Any) -> LogAnalysisEvent:
+        """Build a ``LogAnalysisEvent`` from the current counters."""
+        counters = {field: self.counts.get(kind, 0) for kind, field in COUNTER_FIELDS.items()}
+        return LogAnalysisEvent(
+            scan_request_id=scan_request_id,
+            total_patterns=self.total_patterns,
+            patterns=list(self.patterns),
+            **counters,
+            **fields,
+        )
+
+
+def analyze_lines(
+    lines: Iterable[str | bytes], scan_request_id: str, **options: Any
+) -> LogAnalysisEvent:
+    """Analyze an iterable of log lines in one pass."""
+    return LogAnalyzer(**options).feed_lines(lines).to_event(scan_request_id)
+
+
+def analyze_file(
+    path: str | os.PathLike[str], scan_request_id: str, **options: Any
+) -> LogAnalysisEvent:
+    """Stream-analyze a log file from disk."""
+    return LogAnalyzer(**options).feed_file(path).to_event(scan_request_id)
+
+
+async def analyze_stream(
+    lines: AsyncIterable[str | bytes], scan_request_id: str, **options: Any
+) -> LogAnalysisEvent:
+    """Analyze an async stream of log lines."""
+    analyzer = await LogAnalyzer(**options).feed_async(lines)
+    return analyzer.to_event(scan_request_id)
+
+
+# ── Batch analysis ────────────────────────────────────────────────────
+
+LogInput = Union[str, os.PathLike, Mapping[str, Any]]  # noqa: UP007
+"""A log to analyze: a file path, or a build-log dict as carried by
+``ScanResultEvent.build_logs`` (``content``/``log`` text or a ``path``)."""
+
+_SOURCE_KEYS = ("build_id", "id", "name", "job", "path")
+
+
+class LogTiming(BaseModel):
+    """Per-log statistics from a batch run."""
+
+    index: int
+    source: str
+    seconds: float
+    lines: int = 0
+    chars: int = 0
+    total_patterns: int = 0
+
+
+class LogBatchResult(BaseModel):
+    """Merged outcome of analyzing a batch of logs."""
+
+    event: LogAnalysisEvent
+    timings: list[LogTiming] = Field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def cpu_seconds(self) -> float:
+        return sum(t.seconds for t in self.timings)
+
+
+def _source_label(index: int, log: LogInput) -> str:
+    if not isinstance(log, Mapping):
+        return os.fspath(log)
+    for key in _SOURCE_KEYS:
+        if log.get(key) is not None:
+            return str(log[key])
+    return f"log-{index}"
+
+
+def _analyze_one(
+    index: int,
+    log: LogInput,
+    detectors: tuple[tuple[str, str], ...],
+    max_patterns: int,
+    max_line_chars: int,
+) -> tuple[int, dict[str, int], list[dict[str, Any]], LogTiming]:
+    started = time.perf_counter()
+    source = _source_label(index, log)
+    analyzer = LogAnalyzer(
+        dict(detectors), source=source, max_patterns=max_patterns, max_line_chars=max_line_chars
+    )
+    if isinstance(log, Mapping):
+        text = log.get("content", log.get("log"))
+        if text is not None:
+            analyzer.feed_text(text)
+        elif log.get("path") is not None:
+            analyzer.feed_file(log["path"])
+    else:
+        analyzer.feed_file(log)
+    timing = LogTiming(
+        index=index,
+        source=source,
+        seconds=time.perf_counter() - started,
+        lines=analyzer.lines_read,
+        chars=analyzer.chars_read,
+        total_patterns=analyzer.total_patterns,
+    )
+    return index, analyzer.counts, analyzer.patterns, timing
+
+
+def _warm_worker(detectors: tuple[tuple[str, str], ...]) -> None:
+    # Compile the combined matcher once per worker process; every task in
+    # that worker then hits the ``_compile`` cache.
+    _compile(detectors)
+
+
+def analyze_logs(
+    logs: Sequence[LogInput],
+    scan_request_id: str,
+    *,
+    detectors: Mapping[str, str] | None = None,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    max_patterns: int = DEFAULT_MAX_PATTERNS,
+    max_line_chars: int = DEFAULT_MAX_LINE_CHARS,
+) -> LogBatchResult:
+    """Analyze many logs in parallel and merge them into one event.
+
+    Logs are analyzed in a ``ProcessPoolExecutor`` (or the given
+    ``executor``); ``max_workers=1`` runs inline. Counters are summed and
+    pattern samples concatenated in input order, so the merged event is the
+    same regardless of which worker finished first. ``max_patterns`` caps
+    the merged sample list as well as each log's own.
+    """
+    started = time.perf_counter()
+    items = tuple((detectors or DEFAULT_DETECTORS).items())
+    args = [(i, log, items, max_patterns, max_line_chars) for i, log in enumerate(logs)]
+
+    if executor is not None:
+        results = list(executor.map(_analyze_one, *zip(*args))) if args else []
+    elif max_workers == 1 or len(args) <= 1:
+        results = [_analyze_one(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_warm_worker, initargs=(items,)
+        ) as pool:
+            results = list(pool.map(_analyze_one, *zip(*args)))
+
+    results.sort(key=lambda r: r[0])
+    counts: dict[str, int] = {name: 0 for name, _ in items}
+    patterns: list[dict[str, Any]] = []
+    for _, partial_counts, partial_patterns, _ in results:
+        for kind, n in partial_counts.items():
+            counts[kind] += n
+        room = max_patterns - len(patterns)
+        if room > 0:
+            patterns.extend(partial_patterns[:room])
+
+    event = LogAnalysisEvent(
+        scan_request_id=scan_request_id,
+        total_patterns=sum(counts.values()),
+        patterns=patterns,
+        **{field: counts.get(kind, 0) for kind, field in COUNTER_FIELDS.items()},
+    )
+    return LogBatchResult(
+        event=event,
+        timings=[r[3] for r in results],
+        wall_seconds=time.perf_counter() - started,
+    )
+
+
+def analyze_scan_result(event: ScanResultEvent, **options: Any) -> LogBatchResult:
+    """Analyze every entry of ``event.build_logs`` (see ``analyze_logs``)."""
+    return analyze_logs(event.build_logs, event.scan_request_id, **options)
@@ -0,0 +1,383 @@
+"""Compact ``metadata`` mappings.
+
+Every node, edge, finding, event and snapshot carries a ``metadata`` dict,
+and across an estate the same dozen keys repeat millions of times. This
+module offers an opt-in compact representation:
+
+- ``CompactMetadata`` is a ``MutableMapping`` that stores its values in a
+  tuple laid out by a shared, interned *shape* (the tuple of its keys), the
+  way hidden classes work in JS engines. Shapes are cached per key
+  sequence, so a million nodes with the same keys share one key tuple and
+  each pay only for a small values tuple (a 12-key mapping takes about 190
+  bytes against 464 for the dict). Keys beyond ``MAX_SHAPE_KEYS``, or
+  arriving once ``MAX_SHAPES`` shapes exist, go to a per-instance overflow
+  dict. Shapes live for the whole process.
+- ``compact`` swaps the ``metadata`` of already-validated models (and the
+  models nested in them) for ``CompactMetadata`` in place.
+- ``pack_metadata`` / ``unpack_metadata`` rewrite a dumped payload so each
+  ``metadata`` object becomes ``{"$s": shape id, "$v": [values]}`` against
+  a key dictionary stored once per payload; ``dumps`` / ``loads`` wrap the
+  round trip for a model.
+
+The models declare ``metadata`` as ``Metadata``: validated as a plain
+``dict`` (so nothing changes unless you opt in) but serialized by type, so
+``CompactMetadata`` dumps exactly like the dict it stands for.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from copy import deepcopy
+from typing import Annotated, Any, TypeVar
+
+from pydantic import BaseModel, GetCoreSchemaHandler
+from pydantic_core import SchemaSerializer, core_schema, from_json, to_json
+
+MAX_SHAPE_KEYS = 32
+MAX_SHAPES = 4096
+PACKED_KEYS_FIELD = "_metadata_keys"
+PACKED_BODY_FIELD = "_metadata_body"
+PACKED_SHAPE_FIELD = "$s"
+PACKED_VALUES_FIELD = "$v"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class _Missing:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<deleted>"
+
+
+_MISSING: Any = _Missing()
+
+
+class _Shape:
+    """An ordered, interned key layout shared by many ``CompactMetadata``."""
+
+    __slots__ = ("index", "keys", "transitions")
+
+    def __init__(self, keys: tuple[str, ...]) -> None:
+        self.keys = keys
+        self.index = {key: i for i, key in enumerate(keys)}
+        self.transitions: dict[str, _Shape] = {}
+
+    def extend(self, key: str) -> _Shape | None:
+        """The shape with ``key`` appended, or ``None`` when shapes are capped."""
+        child = self.transitions.get(key)
+        if child is not None:
+            return child
+        with _shape_lock:
+            child = self.transitions.get(key)
+            if child is None:
+                global _shape_count
+                if len(self.keys) >= MAX_SHAPE_KEYS or _shape_count >= MAX_SHAPES:
+                    return None
+                child = _Shape((*self.keys, sys.intern(key)))
+                self.transitions[key] = child
+                _shape_count += 1
+        return child
+
+
+_EMPTY = _Shape(())
+_shape_count = 1
+_shape_lock = threading.Lock()
+
+
+def _shape_for(keys: Iterable[str]) -> tuple[_Shape, list[str]]:
+    """Shape for a key sequence, plus the keys that did not fit in it."""
+    shape = _EMPTY
+    overflow: list[str] = []
+    for key in keys:
+        child = None if overflow else shape.extend(key)
+        if child is None:
+            overflow.append(key)
+        else:
+            shape = child
+    return shape, overflow
+
+
+def shape_count() -> int:
+    """Number of distinct key layouts created so far in this process."""
+    return _shape_count
+
+
+class CompactMetadata(MutableMapping[str, Any]):
+    """A ``dict``-like mapping with shared key layout and interned keys.
+
+    Behaves like the dict it was built from (equality, iteration order,
+    ``get``/``setdefault``/``update``...), except that deleting a key and
+    setting it again keeps its original position.
+    """
+
+    __slots__ = ("_extra", "_shape", "_values")
+
+    def __init__(self, data: Mapping[str, Any] | Iterable[tuple[str, Any]] = (), /) -> None:
+        items = dict(data)
+        self._init(items, *_shape_for(items))
+
+    def _init(self, items: dict[str, Any], shape: _Shape, overflow: list[str]) -> None:
+        self._shape = shape
+        self._values: tuple[Any, ...] = tuple(map(items.__getitem__, shape.keys))
+        self._extra = {sys.intern(key): items[key] for key in overflow} or None
+
+    # ── Mapping protocol ──────────────────────────────────────────────
+
+    def __getitem__(self, key: str) -> Any:
+        position = self._shape.index.get(key)
+        if position is not None:
+            value = self._values[position]
+            if value is not _MISSING:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        # Values are an immutable tuple: writes rebuild it (metadata is small
+        # and read far more often than written), copies share it.
+        position = self._shape.index.get(key)
+        if position is not None:
+            self._values = (*self._values[:position], value, *self._values[position + 1 :])
+            return
+        child = None if self._extra else self._shape.extend(key)
+        if child is None:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[sys.intern(key)] = value
+        else:
+            self._shape = child
+            self._values = (*self._values, value)
+
+    def __delitem__(self, key: str) -> None:
+        position = self._shape.index.get(key)
+        if position is not None and self._values[position] is not _MISSING:
+            values = self._values
+            self._values = (*values[:position], _MISSING, *values[position + 1 :])
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for key, value in zip(self._shape.keys, self._values):
+            if value is not _MISSING:
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        size = len(self._values) - self._values.count(_MISSING)
+        return size + (len(self._extra) if self._extra else 0)
+
+    def __contains__(self, key: object) -> bool:
+        position = self._shape.index.get(key)  # type: ignore[arg-type]
+        if position is not None:
+            return self._values[position] is not _MISSING
+        return self._extra is not None and key in self._extra
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __or__(self, other: Mapping[str, Any]) -> dict[str, Any]:
+        return {**self, **other}
+
+    def __repr__(self) -> str:
+        return f"CompactMetadata({dict(self)!r})"
+
+    # ── Copying and pickling ──────────────────────────────────────────
+
+    def copy(self) -> CompactMetadata:
+        clone = CompactMetadata.__new__(CompactMetadata)
+        clone._shape = self._shape
+        clone._values = self._values
+        clone._extra = dict(self._extra) if self._extra else None
+        return clone
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> CompactMetadata:
+        clone = self.copy()
+        clone._values = tuple(v if v is _MISSING else deepcopy(v, memo) for v in self._values)
+        if clone._extra:
+            clone._extra = deepcopy(clone._extra, memo)
+        return clone
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Shapes are process-local; re-intern on the receiving side.
+        return CompactMetadata, (dict(self),)
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(self.items())
+
+    @property
+    def shape(self) -> tuple[str, ...]:
+        """The key layout this mapping's values are stored against."""
+        return self._shape.keys
+
+
+CompactMetadata.__pydantic_serializer__ = SchemaSerializer(  # type: ignore[attr-defined]
+    core_schema.any_schema(
+        serialization=core_schema.plain_serializer_function_ser_schema(CompactMetadata.to_dict)
+    )
+)
+
+
+class _MetadataSchema:
+    """Validate as ``dict[str, Any]``; serialize by type so ``CompactMetadata`` dumps too."""
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.dict_schema(
+            core_schema.str_schema(),
+            core_schema.any_schema(),
+            serialization=core_schema.simple_ser_schema("any"),
+        )
+
+
+Metadata = Annotated[dict[str, Any], _MetadataSchema]
+"""Type of every model's ``metadata`` field."""
+
+
+# ── Compacting models ─────────────────────────────────────────────────
+
+
+def compact(obj: Any) -> int:
+    """Replace ``metadata`` dicts with ``CompactMetadata`` in place.
+
+    Walks models, lists, tuples and dict values, descending into every
+    model field. Returns the number of mappings compacted.
+
+    Once ``MAX_SHAPES`` is reached, a mapping whose key layout has no shape
+    would keep its keys in the overflow dict and end up larger than the
+    plain dict, so it is left as it is.
+    """
+    count = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, BaseModel):
+            values = item.__dict__
+            metadata = values.get("metadata")
+            if type(metadata) is dict and metadata:  # an empty dict is smaller already
+                shape, overflow = _shape_for(metadata)
+                if not overflow or len(shape.keys) == MAX_SHAPE_KEYS:
+                    mapping = CompactMetadata.__new__(CompactMetadata)
+                    mapping._init(metadata, shape, overflow)
+                    values["metadata"] = mapping
+                    count += 1
+            stack.extend(v for k, v in values.items() if k != "metadata" and _walkable(v))
+        elif isinstance(item, (list, tuple)):
+            stack.extend(v for v in item if _walkable(v))
+        elif isinstance(item, dict):
+            stack.extend(v for v in item.values() if _walkable(v))
+    return count
+
+
+def _walkable(value: Any) -> bool:
+    return isinstance(value, (BaseModel, list, tuple, dict))
+
+
+# ── Key-dictionary serialization ──────────────────────────────────────
+
+
+def pack_metadata(payload: Any) -> Any:
+    """Rewrite every non-empty ``metadata`` object as a packed shape reference.
+
+    ``payload`` is JSON-compatible data (e.g. ``model_dump(mode="json")``).
+    Each ``metadata`` object becomes ``{PACKED_SHAPE_FIELD: shape id,
+    PACKED_VALUES_FIELD: [values]}``; the values themselves are user data and
+    are written as they are. For a dict payload the key dictionary is stored
+    under ``PACKED_KEYS_FIELD``; other payloads are wrapped as
+    ``{PACKED_KEYS_FIELD: ..., PACKED_BODY_FIELD: ...}``.
+    """
+    shapes: dict[tuple[str, ...], int] = {}
+
+    def visit(value: Any) -> Any:
+        if isinstance(value, dict):
+            out = {}
+            for key, item in value.items():
+                if key == "metadata" and isinstance(item, Mapping) and item:
+                    keys = tuple(item)
+                    shape_id = shapes.setdefault(keys, len(shapes))
+                    out[key] = {
+                        PACKED_SHAPE_FIELD: shape_id,
+                        PACKED_VALUES_FIELD: [item[k] for k in keys],
+                    }
+                else:
+                    out[key] = visit(item)
+            return out
+        if isinstance(value, list):
+            return [visit(item) for item in value]
+        return value
+
+    packed = visit(payload)
+    table = [list(keys) for keys in shapes]
+    if isinstance(packed, dict):
+        packed[PACKED_KEYS_FIELD] = table
+        return packed
+    return {PACKED_KEYS_FIELD: table, PACKED_BODY_FIELD: packed}
+
+
+def unpack_metadata(payload: Any, *, compact_mappings: bool = False) -> Any:
+    """Inverse of ``pack_metadata``.
+
+    With ``compact_mappings`` the restored mappings are ``CompactMetadata``
+    (for callers working on raw data; model validation turns them back
+    into dicts — use ``compact`` after validating instead).
+    """
+    if not isinstance(payload, dict) or PACKED_KEYS_FIELD not in payload:
+        return payload
+    table = [tuple(sys.intern(key) for key in keys) for keys in payload[PACKED_KEYS_FIELD]]
+    factory = CompactMetadata if compact_mappings else dict
+
+    def visit(value: Any) -> Any:
+        if isinstance(value, dict):
+            out = {}
+            for key, item in value.items():
+                if key == "metadata" and _is_packed(item):
+                    keys = table[item[PACKED_SHAPE_FIELD]]
+                    out[key] = factory(zip(keys, item[PACKED_VALUES_FIELD], strict=True))
+                else:
+                    out[key] = visit(item)
+            return out
+        if isinstance(value, list):
+            return [visit(item) for item in value]
+        return value
+
+    if PACKED_BODY_FIELD in payload:
+        return visit(payload[PACKED_BODY_FIELD])
+    return visit({k: v for k, v in payload.items() if k != PACKED_KEYS_FIELD})
+
+
+def _is_packed(value: Any) -> bool:
+    # Only the packer writes this exact two-key object under "metadata";
+    # anything else there (empty, or not a mapping) was left unpacked.
+    return (
+        isinstance(value, dict)
+        and len(value) == 2
+        and PACKED_SHAPE_FIELD in value
+        and PACKED_VALUES_FIELD in value
+    )
+
+
+def dumps(model: BaseModel) -> bytes:
+    """JSON for ``model`` with metadata keys written once per distinct shape."""
+    return to_json(pack_metadata(model.model_dump(mode="json")))
+
+
+def loads(model_cls: type[ModelT], data: bytes | str, *, compact_metadata: bool = True) -> ModelT:
+    """Validate ``dumps`` output into ``model_cls`` (compacting metadata by default)."""
+    model = model_cls.model_validate(unpack_metadata(from_json(data)))
+    if compact_metadata:
+        compact(model)
+    return model
@@ -1,20 +1,84 @@
-"""atlas_sdk.models — Graph node, edge, finding, and graph container models."""
-
-from atlas_sdk.models.edges import Edge  # noqa: F401
-from atlas_sdk.models.findings import Evidence, Finding  # noqa: F401
-from atlas_sdk.models.graph import CICDGraph  # noqa: F401
-from atlas_sdk.models.nodes import (  # noqa: F401
-    ArtifactNode,
-    ContainerImageNode,
-    DocFileNode,
-    EnvironmentNode,
-    ExternalServiceNode,
-    JobNode,
-    Node,
-    PipelineNode,
-    RepositoryNode,
-    RunnerNode,
-    SecretRefNode,
-    StageNode,
-    StepNode,
-)
+"""atlas_sdk.models — Graph node, edge, finding, and graph container models.
+
+Names are re-exported lazily so that importing one model module (e.g.
+``atlas_sdk.models.nodes``) does not build the schemas of all the others.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "Edge": "atlas_sdk.models.edges",
+    "Evidence": "atlas_sdk.models.findings",
+    "Finding": "atlas_sdk.models.findings",
+    "CICDGraph": "atlas_sdk.models.graph",
+    "ArtifactNode": "atlas_sdk.models.nodes",
+    "ContainerImageNode": "atlas_sdk.models.nodes",
+    "DocFileNode": "atlas_sdk.models.nodes",
+    "EnvironmentNode": "atlas_sdk.models.nodes",
+    "ExternalServiceNode": "atlas_sdk.models.nodes",
+    "JobNode": "atlas_sdk.models.nodes",
+    "Node": "atlas_sdk.models.nodes",
+    "PipelineNode": "atlas_sdk.models.nodes",
+    "RepositoryNode": "atlas_sdk.models.nodes",
+    "RunnerNode": "atlas_sdk.models.nodes",
+    "SecretRefNode": "atlas_sdk.models.nodes",
+    "StageNode": "atlas_sdk.models.nodes",
+    "StepNode": "atlas_sdk.models.nodes",
+}
+
+__all__ = [
+    "ArtifactNode",
+    "CICDGraph",
+    "ContainerImageNode",
+    "DocFileNode",
+    "Edge",
+    "EnvironmentNode",
+    "Evidence",
+    "ExternalServiceNode",
+    "Finding",
+    "JobNode",
+    "Node",
+    "PipelineNode",
+    "RepositoryNode",
+    "RunnerNode",
+    "SecretRefNode",
+    "StageNode",
+    "StepNode",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
+
+if TYPE_CHECKING:
+    from atlas_sdk.models.edges import Edge
+    from atlas_sdk.models.findings import Evidence, Finding
+    from atlas_sdk.models.graph import CICDGraph
+    from atlas_sdk.models.nodes import (
+        ArtifactNode,
+        ContainerImageNode,
+        DocFileNode,
+        EnvironmentNode,
+        ExternalServiceNode,
+        JobNode,
+        Node,
+        PipelineNode,
+        RepositoryNode,
+        RunnerNode,
+        SecretRefNode,
+        StageNode,
+        StepNode,
+    )
@@ -6,12 +6,12 @@ defined from docs/README.md §4.4.
 
 from __future__ import annotations
 
-from typing import Any
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
 from atlas_sdk.enums import ConfidenceLevel, EdgeType, SourceType
+from atlas_sdk.metadata import Metadata
 
 
 def _new_id() -> str:
@@ -25,7 +25,7 @@ class Edge(BaseModel):
     edge_type: EdgeType
     source_node_id: str
     target_node_id: str
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: Metadata = Field(default_factory=dict)
     source: SourceType = SourceType.STATIC
     confidence: ConfidenceLevel = ConfidenceLevel.MEDIUM
     label: str | None = None
@@ -6,13 +6,13 @@ title, description, severity, evidence, confidence, recommendation, and impact.
 
 from __future__ import annotations
 
-from typing import Any
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from atlas_sdk.confidence import ConfidenceScore
 from atlas_sdk.enums import Severity
+from atlas_sdk.metadata import Metadata
 
 
 def _new_id() -> str:
@@ -47,4 +47,11 @@ class Finding(BaseModel):
     recommendation: str = ""
     impact_category: str = ""
     affected_node_ids: list[str] = Field(default_factory=list)
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: Metadata = Field(default_factory=dict)
+
+    @field_validator("confidence")
+    @classmethod
+    def _share_confidence(cls, value: ConfidenceScore) -> ConfidenceScore:
+        # Findings validated from JSON share interned scores instead of
+        # keeping one identical ConfidenceScore per finding.
+        return ConfidenceScore.intern(value)
@@ -7,12 +7,12 @@ for a scanned CI/CD system.
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
 from atlas_sdk.enums import Platform
+from atlas_sdk.metadata import Metadata
 from atlas_sdk.models.edges import Edge
 from atlas_sdk.models.nodes import Node
 
@@ -34,7 +34,7 @@ class CICDGraph(BaseModel):
     edges: list[Edge] = Field(default_factory=list)
     platform: Platform | None = None
     scanned_at: datetime = Field(default_factory=_now)
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: Metadata = Field(default_factory=dict)
 
     def add_node(self, node: Node) -> None:
         """Add a node to the graph."""
@@ -70,7 +70,7 @@ class CrossProjectEdge(BaseModel):
     target_node_id: str
     link_type: str  # "shared_artifact", "shared_secret", "shared_env", "cross_trigger"
     confidence: float = 0.8
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: Metadata = Field(default_factory=dict)
 
 
 class MultiProjectGraph(BaseModel):
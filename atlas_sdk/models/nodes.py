@@ -19,6 +19,7 @@ from atlas_sdk.enums import (
     Platform,
     SourceType,
 )
+from atlas_sdk.metadata import Metadata
 
 
 def _new_id() -> str:
@@ -32,7 +33,7 @@ class Node(BaseModel):
     node_type: NodeType
     name: str
     platform: Platform | None = None
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: Metadata = Field(default_factory=dict)
     source: SourceType = SourceType.STATIC
     confidence: ConfidenceLevel = ConfidenceLevel.MEDIUM
 
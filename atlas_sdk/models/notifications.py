@@ -7,11 +7,12 @@ when pipeline health scores change.
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+from atlas_sdk.metadata import Metadata
+
 
 def _new_id() -> str:
     return str(uuid4())
@@ -58,4 +59,4 @@ class AlertEvent(BaseModel):
     scores: dict[str, float] = Field(default_factory=dict)
     triggered_at: datetime = Field(default_factory=_now)
     delivered: bool = False
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: Metadata = Field(default_factory=dict)
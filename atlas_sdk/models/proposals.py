@@ -7,11 +7,12 @@ with audit trail and comments.
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+from atlas_sdk.metadata import Metadata
+
 
 def _new_id() -> str:
     return str(uuid4())
@@ -49,7 +50,7 @@ class Proposal(BaseModel):
     comments: list[ProposalComment] = Field(default_factory=list)
     created_at: datetime = Field(default_factory=_now)
     updated_at: datetime = Field(default_factory=_now)
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: Metadata = Field(default_factory=dict)
 
     def approve(self, reviewer: str, comment: str = "") -> None:
         self.status = "approved"
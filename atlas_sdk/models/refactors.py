@@ -6,11 +6,12 @@ fix suggestions with before/after code snippets.
 
 from __future__ import annotations
 
-from typing import Any
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+from atlas_sdk.metadata import Metadata
+
 
 def _new_id() -> str:
     return str(uuid4())
@@ -37,7 +38,7 @@ class RefactorSuggestion(BaseModel):
     effort_estimate: str = "5 minutes"
     risk_level: str = "low"  # low, medium, high
     affected_node_ids: list[str] = Field(default_factory=list)
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: Metadata = Field(default_factory=dict)
 
 
 class RefactorPlan(BaseModel):
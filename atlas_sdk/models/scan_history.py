@@ -12,6 +12,8 @@ from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+from atlas_sdk.metadata import Metadata
+
 
 def _new_id() -> str:
     return str(uuid4())
@@ -34,7 +36,7 @@ class ScanSnapshot(BaseModel):
     node_count: int = 0
     edge_count: int = 0
     scanned_at: datetime = Field(default_factory=_now)
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: Metadata = Field(default_factory=dict)
 
 
 class ScoreTrend(BaseModel):
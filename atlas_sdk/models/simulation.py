@@ -5,11 +5,12 @@ Represents the projected outcome of applying a RefactorPlan to a graph.
 
 from __future__ import annotations
 
-from typing import Any
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+from atlas_sdk.metadata import Metadata
+
 
 def _new_id() -> str:
     return str(uuid4())
@@ -34,10 +35,22 @@ class ScoreDelta(BaseModel):
         return self.after < self.before
 
 
+class SuggestionImpact(BaseModel):
+    """Projected effect of applying one suggestion on top of the previous ones."""
+
+    suggestion_id: str
+    findings_removed: int = 0
+    findings_added: int = 0
+    touched_node_ids: list[str] = Field(default_factory=list)
+    score_deltas: list[ScoreDelta] = Field(default_factory=list)
+
+
 class SimulationResult(BaseModel):
     """Result of simulating a refactor plan on a graph.
 
     Contains the projected changes, score deltas, and a unified diff preview.
+    ``score_deltas`` are cumulative over the whole plan; ``suggestion_impacts``
+    break them down per suggestion, in plan order.
     """
 
     id: str = Field(default_factory=_new_id)
@@ -49,7 +62,8 @@ class SimulationResult(BaseModel):
     diff_preview: str = ""
     projected_node_count: int = 0
     projected_edge_count: int = 0
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    suggestion_impacts: list[SuggestionImpact] = Field(default_factory=list)
+    metadata: Metadata = Field(default_factory=dict)
 
     @property
     def total_improvements(self) -> int:
@@ -0,0 +1,411 @@
+"""Copy-on-write graph overlays.
+
+A ``GraphOverlay`` wraps a base graph and records only the nodes and edges
+that were added, modified or removed. Reads fall through to the base for
+everything the overlay has not touched, so a what-if change costs memory
+proportional to the change rather than to the graph.
+
+Overlays stack — an overlay can wrap another overlay — and can be diffed
+against their base or materialized into a plain ``CICDGraph`` in time
+proportional to the change (plus one pass over the base for
+materialization).
+
+Suggestions describe their structural effect as a ``GraphPatch``, which an
+overlay applies in one call.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any, Protocol, TypeVar
+
+from pydantic import BaseModel, Field
+
+from atlas_sdk.adapters import AnyNode
+from atlas_sdk.graph_index import GraphIndex
+from atlas_sdk.models.edges import Edge
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.models.nodes import Node
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _with_changes(model: ModelT, changes: dict[str, Any]) -> ModelT:
+    """A validated copy of ``model`` with ``changes`` applied.
+
+    Raises:
+        ValueError: ``changes`` names a field the model does not have, or a
+            value fails validation (``pydantic.ValidationError``).
+    """
+    unknown = changes.keys() - type(model).model_fields.keys()
+    if unknown:
+        raise ValueError(f"unknown {type(model).__name__} fields: {', '.join(sorted(unknown))}")
+    return type(model).model_validate({**model.model_dump(), **changes})
+
+
+class GraphPatch(BaseModel):
+    """A structural change to a graph.
+
+    Refactor suggestions carry their patch under
+    ``RefactorSuggestion.metadata["graph_patch"]``.
+    """
+
+    add_nodes: list[AnyNode] = Field(default_factory=list)
+    update_nodes: dict[str, dict[str, Any]] = Field(default_factory=dict)
+    remove_node_ids: list[str] = Field(default_factory=list)
+    add_edges: list[Edge] = Field(default_factory=list)
+    remove_edge_ids: list[str] = Field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.add_nodes
+            or self.update_nodes
+            or self.remove_node_ids
+            or self.add_edges
+            or self.remove_edge_ids
+        )
+
+
+class GraphDiff(BaseModel):
+    """Changes recorded by an overlay relative to its immediate base."""
+
+    added_nodes: list[AnyNode] = Field(default_factory=list)
+    modified_nodes: list[AnyNode] = Field(default_factory=list)
+    removed_node_ids: list[str] = Field(default_factory=list)
+    added_edges: list[Edge] = Field(default_factory=list)
+    modified_edges: list[Edge] = Field(default_factory=list)
+    removed_edge_ids: list[str] = Field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.added_nodes
+            or self.modified_nodes
+            or self.removed_node_ids
+            or self.added_edges
+            or self.modified_edges
+            or self.removed_edge_ids
+        )
+
+    @property
+    def changed_node_ids(self) -> set[str]:
+        """IDs of nodes added, modified or removed."""
+        ids = {n.id for n in self.added_nodes}
+        ids.update(n.id for n in self.modified_nodes)
+        ids.update(self.removed_node_ids)
+        return ids
+
+    @property
+    def changed_edge_ids(self) -> set[str]:
+        """IDs of edges added, modified or removed."""
+        ids = {e.id for e in self.added_edges}
+        ids.update(e.id for e in self.modified_edges)
+        ids.update(self.removed_edge_ids)
+        return ids
+
+    def to_patch(self) -> GraphPatch:
+        """A patch that replays this diff on top of the same base."""
+        return GraphPatch(
+            add_nodes=[*self.added_nodes, *self.modified_nodes],
+            remove_node_ids=list(self.removed_node_ids),
+            add_edges=[*self.added_edges, *self.modified_edges],
+            remove_edge_ids=list(self.removed_edge_ids),
+        )
+
+
+def diff_graphs(old: CICDGraph | GraphView, new: CICDGraph | GraphView) -> GraphDiff:
+    """Changes that turn ``old`` into ``new``, matched by node and edge ID.
+
+    Use this when a rescan produces a fresh graph rather than an overlay.
+    """
+    before = GraphIndex(old) if isinstance(old, CICDGraph) else old
+    after = GraphIndex(new) if isinstance(new, CICDGraph) else new
+    diff = GraphDiff()
+    for node in after.iter_nodes():
+        original = before.get_node(node.id)
+        if original is None:
+            diff.added_nodes.append(node)
+        elif node != original:
+            diff.modified_nodes.append(node)
+    diff.removed_node_ids = [n.id for n in before.iter_nodes() if after.get_node(n.id) is None]
+    for edge in after.iter_edges():
+        original = before.get_edge(edge.id)
+        if original is None:
+            diff.added_edges.append(edge)
+        elif edge != original:
+            diff.modified_edges.append(edge)
+    diff.removed_edge_ids = [e.id for e in before.iter_edges() if after.get_edge(e.id) is None]
+    return diff
+
+
+class GraphView(Protocol):
+    """Read API shared by ``GraphIndex`` and ``GraphOverlay``."""
+
+    @property
+    def node_count(self) -> int: ...
+
+    @property
+    def edge_count(self) -> int: ...
+
+    def iter_nodes(self) -> Iterator[Node]: ...
+
+    def iter_edges(self) -> Iterator[Edge]: ...
+
+    def get_node(self, node_id: str) -> Node | None: ...
+
+    def get_edge(self, edge_id: str) -> Edge | None: ...
+
+    def get_edges_from(self, node_id: str) -> list[Edge]: ...
+
+    def get_edges_to(self, node_id: str) -> list[Edge]: ...
+
+
+class GraphOverlay:
+    """Copy-on-write view over a base graph.
+
+    Nodes are never mutated in place: ``update_node`` stores a modified copy
+    in the overlay and leaves the base untouched. The base may itself be an
+    overlay; use ``push()`` to stack a new layer and ``commit()`` to fold a
+    layer into the overlay beneath it.
+    """
+
+    def __init__(self, base: CICDGraph | GraphView) -> None:
+        self.base: GraphView = GraphIndex(base) if isinstance(base, CICDGraph) else base
+        self._nodes: dict[str, Node] = {}
+        self._removed_nodes: set[str] = set()
+        self._edges: dict[str, Edge] = {}
+        self._removed_edges: set[str] = set()
+        self._outgoing: dict[str, dict[str, Edge]] = {}
+        self._incoming: dict[str, dict[str, Edge]] = {}
+        self._node_delta = 0
+        self._edge_delta = 0
+        self._recording: set[str] | None = None
+        self.touched_node_ids: set[str] = set()
+
+    def _touch(self, *node_ids: str) -> None:
+        self.touched_node_ids.update(node_ids)
+        if self._recording is not None:
+            self._recording.update(node_ids)
+
+    # ── Stacking ──────────────────────────────────────────────────────
+
+    @property
+    def depth(self) -> int:
+        """Number of overlay layers, including this one."""
+        return self.base.depth + 1 if isinstance(self.base, GraphOverlay) else 1
+
+    @property
+    def root(self) -> CICDGraph | None:
+        """The ``CICDGraph`` at the bottom of the stack, if any."""
+        base = self.base
+        while isinstance(base, GraphOverlay):
+            base = base.base
+        return base.graph if isinstance(base, GraphIndex) else None
+
+    def push(self) -> GraphOverlay:
+        """Stack a new, empty overlay on top of this one."""
+        return GraphOverlay(self)
+
+    def commit(self) -> GraphOverlay:
+        """Fold this layer's changes into the overlay beneath it and return that."""
+        if not isinstance(self.base, GraphOverlay):
+            raise TypeError("commit() needs an overlay as base")
+        self.base.apply(self.diff().to_patch())
+        return self.base
+
+    # ── Queries ───────────────────────────────────────────────────────
+
+    @property
+    def nodes(self) -> list[Node]:
+        """All visible nodes (O(N) — prefer ``iter_nodes`` or ``get_node``)."""
+        return list(self.iter_nodes())
+
+    @property
+    def edges(self) -> list[Edge]:
+        """All visible edges (O(E) — prefer ``iter_edges`` or adjacency lookups)."""
+        return list(self.iter_edges())
+
+    def iter_nodes(self) -> Iterator[Node]:
+        """Visible nodes: base order with modifications applied, then additions."""
+        for node in self.base.iter_nodes():
+            if node.id in self._removed_nodes:
+                continue
+            yield self._nodes.get(node.id, node)
+        for node_id, node in self._nodes.items():
+            if self.base.get_node(node_id) is None:
+                yield node
+
+    def iter_edges(self) -> Iterator[Edge]:
+        """Visible edges: base order with modifications applied, then additions."""
+        for edge in self.base.iter_edges():
+            if edge.id in self._removed_edges:
+                continue
+            yield self._edges.get(edge.id, edge)
+        for edge_id, edge in self._edges.items():
+            if self.base.get_edge(edge_id) is None:
+                yield edge
+
+    @property
+    def node_count(self) -> int:
+        return self.base.node_count + self._node_delta
+
+    @property
+    def edge_count(self) -> int:
+        return self.base.edge_count + self._edge_delta
+
+    def get_node(self, node_id: str) -> Node | None:
+        """Find a node by its ID."""
+        if node_id in self._removed_nodes:
+            return None
+        node = self._nodes.get(node_id)
+        return node if node is not None else self.base.get_node(node_id)
+
+    def get_edge(self, edge_id: str) -> Edge | None:
+        """Find an edge by its ID."""
+        if edge_id in self._removed_edges:
+            return None
+        edge = self._edges.get(edge_id)
+        return edge if edge is not None else self.base.get_edge(edge_id)
+
+    def get_edges_from(self, node_id: str) -> list[Edge]:
+        """Get all edges originating from a node."""
+        edges = [e for e in self.base.get_edges_from(node_id) if self._visible_base_edge(e)]
+        edges.extend(self._outgoing.get(node_id, {}).values())
+        return edges
+
+    def get_edges_to(self, node_id: str) -> list[Edge]:
+        """Get all edges pointing to a node."""
+        edges = [e for e in self.base.get_edges_to(node_id) if self._visible_base_edge(e)]
+        edges.extend(self._incoming.get(node_id, {}).values())
+        return edges
+
+    def _visible_base_edge(self, edge: Edge) -> bool:
+        return edge.id not in self._edges and edge.id not in self._removed_edges
+
+    # ── Mutations ─────────────────────────────────────────────────────
+
+    def add_node(self, node: Node) -> None:
+        """Add a node, replacing any node with the same ID."""
+        if self.get_node(node.id) is None:
+            self._node_delta += 1
+        self._removed_nodes.discard(node.id)
+        self._nodes[node.id] = node
+        self._touch(node.id)
+
+    def update_node(self, node_id: str, **changes: Any) -> Node:
+        """Store a validated copy of a node with ``changes`` applied and return it."""
+        node = self.get_node(node_id)
+        if node is None:
+            raise KeyError(node_id)
+        updated = _with_changes(node, changes)
+        self._nodes[node_id] = updated
+        self._touch(node_id)
+        return updated
+
+    def remove_node(self, node_id: str) -> None:
+        """Remove a node and every edge incident to it."""
+        if self.get_node(node_id) is None:
+            return
+        for edge in self.get_edges_from(node_id) + self.get_edges_to(node_id):
+            self.remove_edge(edge.id)
+        self._nodes.pop(node_id, None)
+        if self.base.get_node(node_id) is not None:
+            self._removed_nodes.add(node_id)
+        self._node_delta -= 1
+        self._touch(node_id)
+
+    def add_edge(self, edge: Edge) -> None:
+        """Add an edge, replacing any edge with the same ID."""
+        previous = self.get_edge(edge.id)
+        if previous is None:
+            self._edge_delta += 1
+        else:
+            self._unlink(edge.id)
+            self._touch(previous.source_node_id, previous.target_node_id)
+        self._removed_edges.discard(edge.id)
+        self._edges[edge.id] = edge
+        self._outgoing.setdefault(edge.source_node_id, {})[edge.id] = edge
+        self._incoming.setdefault(edge.target_node_id, {})[edge.id] = edge
+        self._touch(edge.source_node_id, edge.target_node_id)
+
+    def remove_edge(self, edge_id: str) -> None:
+        """Remove an edge by its ID."""
+        edge = self.get_edge(edge_id)
+        if edge is None:
+            return
+        self._unlink(edge_id)
+        if self.base.get_edge(edge_id) is not None:
+            self._removed_edges.add(edge_id)
+        self._edge_delta -= 1
+        self._touch(edge.source_node_id, edge.target_node_id)
+
+    def _unlink(self, edge_id: str) -> None:
+        edge = self._edges.pop(edge_id, None)
+        if edge is not None:
+            self._outgoing.get(edge.source_node_id, {}).pop(edge_id, None)
+            self._incoming.get(edge.target_node_id, {}).pop(edge_id, None)
+
+    def update_edge(self, edge_id: str, **changes: Any) -> Edge:
+        """Store a validated copy of an edge with ``changes`` applied and return it."""
+        edge = self.get_edge(edge_id)
+        if edge is None:
+            raise KeyError(edge_id)
+        updated = _with_changes(edge, changes)
+        self.add_edge(updated)
+        return updated
+
+    # ── Diff / materialize ────────────────────────────────────────────
+
+    def diff(self) -> GraphDiff:
+        """Changes relative to the immediate base, in O(changes)."""
+        diff = GraphDiff(
+            removed_node_ids=sorted(self._removed_nodes),
+            removed_edge_ids=sorted(self._removed_edges),
+        )
+        for node_id, node in self._nodes.items():
+            original = self.base.get_node(node_id)
+            if original is None:
+                diff.added_nodes.append(node)
+            elif node != original:
+                diff.modified_nodes.append(node)
+        for edge_id, edge in self._edges.items():
+            original = self.base.get_edge(edge_id)
+            if original is None:
+                diff.added_edges.append(edge)
+            elif edge != original:
+                diff.modified_edges.append(edge)
+        return diff
+
+    def materialize(self, *, name: str | None = None, deep: bool = False) -> CICDGraph:
+        """Build a standalone ``CICDGraph`` of the current view.
+
+        Graph-level fields (id, name, platform, ...) come from the root graph.
+        Unchanged nodes and edges are shared with the base unless ``deep``.
+        """
+        root = self.root
+        if root is None:
+            root = CICDGraph(name=name or "overlay")
+        update: dict[str, Any] = {"nodes": self.nodes, "edges": self.edges}
+        if name is not None:
+            update["name"] = name
+        graph = root.model_copy(update=update)
+        return graph.model_copy(deep=True) if deep else graph
+
+    def apply(self, patch: GraphPatch) -> set[str]:
+        """Apply a patch and return the IDs of the nodes it touched."""
+        self._recording = touched = set()
+        try:
+            for edge_id in patch.remove_edge_ids:
+                self.remove_edge(edge_id)
+            for node_id in patch.remove_node_ids:
+                self.remove_node(node_id)
+            for node in patch.add_nodes:
+                self.add_node(node)
+            for node_id, changes in patch.update_nodes.items():
+                self.update_node(node_id, **changes)
+            for edge in patch.add_edges:
+                self.add_edge(edge)
+        finally:
+            self._recording = None
+        return touched
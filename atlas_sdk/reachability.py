@@ -0,0 +1,427 @@
+"""Secret exposure reachability index.
+
+Answers "which environments, external services and artifacts can this
+secret reach, and through which jobs and steps" without a traversal per
+query. Edges are read as data flow:
+
+- ``CONSUMES`` flows from the consumed node into the consumer (a job that
+  consumes a secret or an artifact receives it), except that consuming an
+  environment or external service is contact with it;
+- ``CALLS``, ``PRODUCES``, ``DEPLOYS_TO`` and ``IMPORTS`` flow from source
+  to target (a step runs with its job's secrets);
+- any other edge into an environment, external service or artifact is
+  contact with that sink;
+- nothing flows out of environments and external services. Artifacts keep
+  flowing to the jobs that consume them.
+
+Every sink gets a bit; every node that reaches a sink holds an ``int``
+bitset of the sinks it reaches, computed once with a worklist. Exposure
+checks are then a bit test. Adding an edge propagates the new bits to the
+edge's upstream nodes only; removing one recomputes just the nodes that
+could reach it. Indexes span graphs: ``from_estate`` (or ``add_graph`` per
+project) follows ``shared_*`` cross-project links in both directions, as
+the linked nodes stand for the same secret, artifact or environment.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+from pydantic import BaseModel, Field
+
+from atlas_sdk.enums import EdgeType, NodeType
+from atlas_sdk.models.edges import Edge
+from atlas_sdk.models.graph import CICDGraph, CrossProjectEdge, MultiProjectGraph
+from atlas_sdk.models.nodes import Node
+from atlas_sdk.overlay import GraphDiff
+
+SINK_TYPES = frozenset({NodeType.ENVIRONMENT, NodeType.EXTERNAL_SERVICE, NodeType.ARTIFACT})
+TERMINAL_TYPES = frozenset({NodeType.ENVIRONMENT, NodeType.EXTERNAL_SERVICE})
+CARRIER_TYPES = frozenset({NodeType.PIPELINE, NodeType.STAGE, NodeType.JOB, NodeType.STEP})
+FORWARD_EDGES = frozenset(
+    {EdgeType.CALLS, EdgeType.PRODUCES, EdgeType.DEPLOYS_TO, EdgeType.IMPORTS}
+)
+
+
+class SecretExposure(BaseModel):
+    """Where one secret can end up."""
+
+    secret_id: str
+    key: str = ""
+    scope: str | None = None
+    environment_ids: list[str] = Field(default_factory=list)
+    external_service_ids: list[str] = Field(default_factory=list)
+    artifact_ids: list[str] = Field(default_factory=list)
+
+    @property
+    def is_exposed(self) -> bool:
+        return bool(self.environment_ids or self.external_service_ids or self.artifact_ids)
+
+
+class ReachabilityIndex:
+    """Incrementally maintained secret → sink reachability over one or more graphs."""
+
+    def __init__(self) -> None:
+        self._pos: dict[str, int] = {}
+        self._ids: list[str | None] = []
+        self._nodes: list[Node | None] = []
+        self._bit: dict[int, int] = {}
+        self._sinks: list[int] = []  # bit -> node position, -1 once removed
+        self._edges: dict[str, tuple[EdgeType, str, str]] = {}
+        self._incident: dict[str, set[str]] = {}
+        self._cross: dict[str, tuple[str, str]] = {}
+        self._flows: dict[str, tuple[int, int]] = {}
+        self._succ: dict[int, dict[int, int]] = {}
+        self._pred: dict[int, dict[int, int]] = {}
+        self._reach: dict[int, int] = {}
+        self._secrets: set[int] = set()
+
+    @classmethod
+    def from_graph(cls, graph: CICDGraph) -> ReachabilityIndex:
+        index = cls()
+        index.add_graph(graph)
+        return index
+
+    @classmethod
+    def from_estate(cls, estate: MultiProjectGraph) -> ReachabilityIndex:
+        index = cls()
+        for graph in estate.graphs:
+            index.add_graph(graph)
+        for edge in estate.cross_edges:
+            index.add_edge(edge)
+        return index
+
+    # ── Building ──────────────────────────────────────────────────────
+
+    def add_graph(self, graph: CICDGraph, cross_edges: Iterable[CrossProjectEdge] = ()) -> None:
+        """Add a graph's nodes and edges, propagating once at the end.
+
+        ``cross_edges`` may link the graph to graphs added earlier, so an
+        estate can be indexed one streamed project at a time.
+        """
+        seeds = []
+        for node in graph.nodes:
+            if node.id in self._pos:
+                self.add_node(node)
+            else:
+                seeds.append(self._insert_node(node))
+        for edge in (*graph.edges, *cross_edges):
+            if edge.id in self._edges or edge.id in self._cross:
+                self.remove_edge(edge.id)
+            for half in self._halves(edge):
+                flow = self._insert_edge(half)
+                if flow is not None:
+                    seeds.append(flow[1])
+        self._propagate(p for p in seeds if self._reach.get(p))
+
+    def add_node(self, node: Node) -> None:
+        """Add a node, or replace the node with the same ID (re-linking its edges)."""
+        if node.id in self._pos:
+            self.remove_node(node.id, keep_edges=True)
+        position = self._insert_node(node)
+        for edge_id in list(self._incident.get(node.id, ())):
+            if edge_id not in self._flows:
+                self._link(edge_id)
+        self._propagate([position, *self._succ.get(position, ())])
+
+    def remove_node(self, node_id: str, *, keep_edges: bool = False) -> None:
+        """Remove a node and its incident edges.
+
+        With ``keep_edges`` the edges are only unlinked, so that re-adding
+        the node (e.g. with a changed type) restores them.
+        """
+        position = self._pos.get(node_id)
+        if position is None:
+            return
+        upstream = set(self._pred.get(position, ()))
+        for edge_id in list(self._incident.get(node_id, ())):
+            if keep_edges:
+                self._unlink(edge_id)
+            else:
+                self.remove_edge(edge_id)
+        del self._pos[node_id]
+        self._ids[position] = None
+        self._nodes[position] = None
+        self._reach.pop(position, None)
+        self._secrets.discard(position)
+        bit = self._bit.pop(position, None)
+        if bit is not None:
+            self._sinks[bit] = -1
+        upstream.discard(position)
+        if keep_edges and upstream:
+            self._recompute_upstream(upstream)
+
+    def add_edge(self, edge: Edge | CrossProjectEdge) -> None:
+        """Add (or replace) an edge, propagating any newly reachable sinks."""
+        if edge.id in self._edges or edge.id in self._cross:
+            self.remove_edge(edge.id)
+        for half in self._halves(edge):
+            flow = self._insert_edge(half)
+            if flow is not None:
+                self._propagate([flow[1]])
+
+    def remove_edge(self, edge_id: str) -> None:
+        """Remove an edge, recomputing only the nodes upstream of it."""
+        for half_id in self._cross.pop(edge_id, ()):
+            self.remove_edge(half_id)
+        flow = self._unlink(edge_id)
+        _, source_id, target_id = self._edges.pop(edge_id, (None, "", ""))
+        for node_id in (source_id, target_id):
+            incident = self._incident.get(node_id)
+            if incident is not None:
+                incident.discard(edge_id)
+        if flow is not None:
+            self._recompute_upstream([flow[0]])
+
+    def apply_diff(self, diff: GraphDiff) -> None:
+        """Apply an overlay or store ``GraphDiff``."""
+        for edge_id in diff.removed_edge_ids:
+            self.remove_edge(edge_id)
+        for node_id in diff.removed_node_ids:
+            self.remove_node(node_id)
+        for node in (*diff.added_nodes, *diff.modified_nodes):
+            self.add_node(node)
+        for edge in (*diff.added_edges, *diff.modified_edges):
+            self.add_edge(edge)
+
+    # ── Queries ───────────────────────────────────────────────────────
+
+    def reaches(self, source_id: str, target_id: str) -> bool:
+        """Whether ``source_id`` can reach the sink ``target_id`` (O(1))."""
+        source = self._pos.get(source_id)
+        target = self._pos.get(target_id)
+        if source is None or target is None or target not in self._bit:
+            return False
+        return bool(self._reach.get(source, 0) >> self._bit[target] & 1)
+
+    def reachable_sinks(self, node_id: str) -> list[str]:
+        """IDs of every sink ``node_id`` reaches, in insertion order."""
+        position = self._pos.get(node_id)
+        return [] if position is None else [self._node_id(p) for p in self._decode(position)]
+
+    def exposure(self, secret_id: str) -> SecretExposure:
+        """Environments, external services and artifacts a secret can reach."""
+        position = self._pos.get(secret_id)
+        node = self._nodes[position] if position is not None else None
+        exposure = SecretExposure(
+            secret_id=secret_id,
+            key=getattr(node, "key", ""),
+            scope=getattr(node, "scope", None),
+        )
+        if position is None:
+            return exposure
+        buckets = {
+            NodeType.ENVIRONMENT: exposure.environment_ids,
+            NodeType.EXTERNAL_SERVICE: exposure.external_service_ids,
+            NodeType.ARTIFACT: exposure.artifact_ids,
+        }
+        for sink in self._decode(position):
+            sink_node = self._nodes[sink]
+            assert sink_node is not None
+            buckets[sink_node.node_type].append(sink_node.id)
+        return exposure
+
+    def exposures(self) -> list[SecretExposure]:
+        """Exposure of every secret in the index."""
+        return [self.exposure(self._node_id(p)) for p in sorted(self._secrets)]
+
+    def secrets_reaching(self, target_id: str) -> list[str]:
+        """IDs of the secrets that can reach ``target_id``."""
+        target = self._pos.get(target_id)
+        bit = self._bit.get(target) if target is not None else None
+        if bit is None:
+            return []
+        mask = 1 << bit
+        return [self._node_id(p) for p in sorted(self._secrets) if self._reach.get(p, 0) & mask]
+
+    def path(self, secret_id: str, target_id: str) -> list[str] | None:
+        """One shortest flow path from a secret to a sink, as node IDs.
+
+        The search only enters nodes that still reach the target, so it
+        walks the exposure path rather than the secret's whole closure.
+        """
+        if not self.reaches(secret_id, target_id):
+            return None
+        start = self._pos[secret_id]
+        goal = self._pos[target_id]
+        mask = 1 << self._bit[goal]
+        parent: dict[int, int] = {start: start}
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            if current == goal:
+                break
+            for successor in self._succ.get(current, ()):
+                if successor not in parent and self._reach.get(successor, 0) & mask:
+                    parent[successor] = current
+                    queue.append(successor)
+        path = [goal]
+        while path[-1] != start:
+            path.append(parent[path[-1]])
+        return [self._node_id(p) for p in reversed(path)]
+
+    def carriers(self, secret_id: str) -> list[str]:
+        """Pipelines, stages, jobs and steps a secret flows through."""
+        start = self._pos.get(secret_id)
+        if start is None:
+            return []
+        seen = {start}
+        queue = deque([start])
+        carriers = []
+        while queue:
+            current = queue.popleft()
+            for successor in self._succ.get(current, ()):
+                if successor in seen:
+                    continue
+                seen.add(successor)
+                node = self._nodes[successor]
+                assert node is not None
+                if node.node_type in CARRIER_TYPES:
+                    carriers.append(node.id)
+                queue.append(successor)
+        return carriers
+
+    # ── Internals ─────────────────────────────────────────────────────
+
+    def _node_id(self, position: int) -> str:
+        node_id = self._ids[position]
+        assert node_id is not None
+        return node_id
+
+    def _decode(self, position: int) -> Iterator[int]:
+        bits = self._reach.get(position, 0)
+        while bits:
+            low = bits & -bits
+            sink = self._sinks[low.bit_length() - 1]
+            if sink >= 0:
+                yield sink
+            bits ^= low
+
+    def _base(self, position: int) -> int:
+        bit = self._bit.get(position)
+        return 0 if bit is None else 1 << bit
+
+    def _insert_node(self, node: Node) -> int:
+        position = len(self._ids)
+        self._pos[node.id] = position
+        self._ids.append(node.id)
+        self._nodes.append(node)
+        if node.node_type in SINK_TYPES:
+            self._bit[position] = len(self._sinks)
+            self._sinks.append(position)
+            self._reach[position] = self._base(position)
+        elif node.node_type == NodeType.SECRET_REF:
+            self._secrets.add(position)
+        return position
+
+    def _halves(self, edge: Edge | CrossProjectEdge) -> list[Edge]:
+        if isinstance(edge, Edge):
+            return [edge]
+        if not edge.link_type.startswith("shared_"):
+            return []  # e.g. cross_trigger: a trigger does not hand over secrets
+        ids = (f"{edge.id}:forward", f"{edge.id}:backward")
+        self._cross[edge.id] = ids
+        ends = (edge.source_node_id, edge.target_node_id)
+        return [
+            Edge(
+                id=ids[0],
+                edge_type=EdgeType.CONSUMES,
+                source_node_id=ends[0],
+                target_node_id=ends[1],
+            ),
+            Edge(
+                id=ids[1],
+                edge_type=EdgeType.CONSUMES,
+                source_node_id=ends[1],
+                target_node_id=ends[0],
+            ),
+        ]
+
+    def _insert_edge(self, edge: Edge) -> tuple[int, int] | None:
+        self._edges[edge.id] = (edge.edge_type, edge.source_node_id, edge.target_node_id)
+        self._incident.setdefault(edge.source_node_id, set()).add(edge.id)
+        self._incident.setdefault(edge.target_node_id, set()).add(edge.id)
+        return self._link(edge.id)
+
+    def _flow(self, edge_id: str) -> tuple[int, int] | None:
+        edge_type, source_id, target_id = self._edges[edge_id]
+        source = self._pos.get(source_id)
+        target = self._pos.get(target_id)
+        if source is None or target is None:
+            return None
+        source_node = self._nodes[source]
+        target_node = self._nodes[target]
+        assert source_node is not None and target_node is not None
+        if edge_type == EdgeType.CONSUMES and target_node.node_type not in TERMINAL_TYPES:
+            source, target, source_node = target, source, target_node
+        elif (
+            edge_type not in FORWARD_EDGES
+            and edge_type != EdgeType.CONSUMES
+            and target_node.node_type not in SINK_TYPES
+        ):
+            return None
+        if source_node.node_type in TERMINAL_TYPES:
+            return None
+        return source, target
+
+    def _link(self, edge_id: str) -> tuple[int, int] | None:
+        flow = self._flow(edge_id)
+        if flow is None:
+            return None
+        source, target = flow
+        self._flows[edge_id] = flow
+        successors = self._succ.setdefault(source, {})
+        successors[target] = successors.get(target, 0) + 1
+        predecessors = self._pred.setdefault(target, {})
+        predecessors[source] = predecessors.get(source, 0) + 1
+        return flow
+
+    def _unlink(self, edge_id: str) -> tuple[int, int] | None:
+        flow = self._flows.pop(edge_id, None)
+        if flow is None:
+            return None
+        source, target = flow
+        for table, key, other in ((self._succ, source, target), (self._pred, target, source)):
+            counts = table[key]
+            counts[other] -= 1
+            if not counts[other]:
+                del counts[other]
+                if not counts:
+                    del table[key]
+        return flow
+
+    def _propagate(self, seeds: Iterable[int]) -> None:
+        """Push each seed's bits to its upstream nodes until nothing changes."""
+        queue = deque(seeds)
+        reach = self._reach
+        while queue:
+            current = queue.popleft()
+            bits = reach.get(current, 0)
+            if not bits:
+                continue
+            for predecessor in self._pred.get(current, ()):
+                merged = reach.get(predecessor, 0) | bits
+                if merged != reach.get(predecessor, 0):
+                    reach[predecessor] = merged
+                    queue.append(predecessor)
+
+    def _recompute_upstream(self, starts: Iterable[int]) -> None:
+        """Rebuild the bitsets of ``starts`` and everything that reaches them."""
+        affected = set(starts)
+        queue = deque(affected)
+        while queue:
+            for predecessor in self._pred.get(queue.popleft(), ()):
+                if predecessor not in affected:
+                    affected.add(predecessor)
+                    queue.append(predecessor)
+        for position in affected:
+            bits = self._base(position)
+            for successor in self._succ.get(position, ()):
+                if successor not in affected:
+                    bits |= self._reach.get(successor, 0)
+            if bits:
+                self._reach[position] = bits
+            else:
+                self._reach.pop(position, None)
+        self._propagate(affected)
@@ -0,0 +1,216 @@
+"""Runtime/static confidence reconciliation.
+
+Applies the confidence rules from docs/README.md §5 in bulk: once runtime
+evidence (e.g. ``LogAnalysisEvent.patterns``) confirms a statically
+discovered element, it becomes ``STATIC_RUNTIME`` / HIGH.
+
+Observations are joined to the graph through hash indexes on node id, name
+and path, so reconciling a whole graph is one pass over the observations
+plus one pass over nodes, edges and findings.
+
+Rules:
+    STATIC         + observed   → STATIC_RUNTIME, HIGH
+    AI_INFERENCE   + observed   → RUNTIME, MEDIUM
+    STATIC_RUNTIME + unobserved → STATIC, MEDIUM   (only with downgrade_unobserved)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+from atlas_sdk.confidence import ConfidenceScore
+from atlas_sdk.enums import ConfidenceLevel, SourceType
+from atlas_sdk.events import LogAnalysisEvent
+from atlas_sdk.models.findings import Finding
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.models.nodes import Node
+
+# Observation keys tried, in order, when joining to graph nodes.
+_ID_KEYS = ("node_id",)
+_NAME_KEYS = ("subject", "name", "node_name")
+_PATH_KEYS = ("path",)
+
+_LEVEL_RANK = {ConfidenceLevel.LOW: 0, ConfidenceLevel.MEDIUM: 1, ConfidenceLevel.HIGH: 2}
+_RUNTIME_SOURCES = frozenset({SourceType.RUNTIME, SourceType.STATIC_RUNTIME})
+
+# (source, level) after runtime confirmation, keyed by the current source.
+_UPGRADES: dict[SourceType, tuple[SourceType, ConfidenceLevel]] = {
+    SourceType.STATIC: (SourceType.STATIC_RUNTIME, ConfidenceLevel.HIGH),
+    SourceType.AI_INFERENCE: (SourceType.RUNTIME, ConfidenceLevel.MEDIUM),
+}
+_DOWNGRADES: dict[SourceType, tuple[SourceType, ConfidenceLevel]] = {
+    SourceType.STATIC_RUNTIME: (SourceType.STATIC, ConfidenceLevel.MEDIUM),
+}
+
+Observation = Mapping[str, Any]
+
+
+class ConfidenceChange(BaseModel):
+    """A single source/confidence change applied by the reconciler."""
+
+    element_kind: Literal["node", "edge", "finding"]
+    element_id: str
+    before_source: SourceType
+    after_source: SourceType
+    before_level: ConfidenceLevel
+    after_level: ConfidenceLevel
+
+    @property
+    def upgraded(self) -> bool:
+        return _LEVEL_RANK[self.after_level] > _LEVEL_RANK[self.before_level]
+
+    @property
+    def downgraded(self) -> bool:
+        return _LEVEL_RANK[self.after_level] < _LEVEL_RANK[self.before_level]
+
+
+class ReconciliationReport(BaseModel):
+    """Summary of a reconciliation pass."""
+
+    graph_id: str
+    observations: int = 0
+    unmatched_observations: int = 0
+    observed_node_ids: list[str] = Field(default_factory=list)
+    changes: list[ConfidenceChange] = Field(default_factory=list)
+
+    @property
+    def upgraded(self) -> int:
+        return sum(1 for c in self.changes if c.upgraded)
+
+    @property
+    def downgraded(self) -> int:
+        return sum(1 for c in self.changes if c.downgraded)
+
+
+class _NodeIndex:
+    """Hash indexes for joining observations to nodes."""
+
+    def __init__(self, nodes: Iterable[Node]) -> None:
+        self.by_id: dict[str, Node] = {}
+        self.by_name: dict[str, list[Node]] = {}
+        self.by_path: dict[str, list[Node]] = {}
+        for node in nodes:
+            self.by_id[node.id] = node
+            self.by_name.setdefault(node.name.casefold(), []).append(node)
+            path = getattr(node, "path", None)
+            if path:
+                self.by_path.setdefault(path, []).append(node)
+
+    def match(self, observation: Observation) -> list[Node]:
+        for key in _ID_KEYS:
+            node = self.by_id.get(observation.get(key) or "")
+            if node is not None:
+                return [node]
+        for key in _PATH_KEYS:
+            nodes = self.by_path.get(observation.get(key) or "")
+            if nodes:
+                return nodes
+        for key in _NAME_KEYS:
+            value = observation.get(key)
+            if isinstance(value, str):
+                nodes = self.by_name.get(value.casefold())
+                if nodes:
+                    return nodes
+        return []
+
+
+def _flatten(
+    observations: Iterable[Observation | LogAnalysisEvent],
+) -> Iterable[Observation]:
+    for item in observations:
+        if isinstance(item, LogAnalysisEvent):
+            yield from item.patterns
+        else:
+            yield item
+
+
+def _transition(
+    source: SourceType, observed: bool, downgrade: bool
+) -> tuple[SourceType, ConfidenceLevel] | None:
+    if observed:
+        return _UPGRADES.get(source)
+    if downgrade:
+        return _DOWNGRADES.get(source)
+    return None
+
+
+def reconcile_confidence(
+    graph: CICDGraph,
+    observations: Iterable[Observation | LogAnalysisEvent],
+    findings: Iterable[Finding] = (),
+    *,
+    downgrade_unobserved: bool = False,
+) -> ReconciliationReport:
+    """Reconcile node, edge and finding confidence against runtime evidence.
+
+    Nodes, edges and findings are updated in place. An edge counts as
+    observed when both of its endpoints are; a finding when any of its
+    ``affected_node_ids`` (or evidence nodes) is.
+
+    Args:
+        graph: Graph whose nodes and edges are reconciled.
+        observations: Runtime observations — pattern dicts carrying a
+            ``node_id``, ``path`` or ``subject``/``name`` — or whole
+            ``LogAnalysisEvent``s.
+        findings: Findings to reconcile alongside the graph.
+        downgrade_unobserved: Also demote ``STATIC_RUNTIME`` elements that
+            this batch of observations did not confirm.
+    """
+    index = _NodeIndex(graph.nodes)
+    report = ReconciliationReport(graph_id=graph.id)
+
+    observed: set[str] = set()
+    for observation in _flatten(observations):
+        report.observations += 1
+        matched = index.match(observation)
+        if not matched:
+            report.unmatched_observations += 1
+        observed.update(node.id for node in matched)
+    report.observed_node_ids = sorted(observed)
+
+    def record(kind: str, element_id: str, before: tuple, after: tuple) -> None:
+        report.changes.append(
+            ConfidenceChange(
+                element_kind=kind,
+                element_id=element_id,
+                before_source=before[0],
+                after_source=after[0],
+                before_level=before[1],
+                after_level=after[1],
+            )
+        )
+
+    for node in graph.nodes:
+        target = _transition(node.source, node.id in observed, downgrade_unobserved)
+        if target is not None:
+            record("node", node.id, (node.source, node.confidence), target)
+            node.source, node.confidence = target
+
+    for edge in graph.edges:
+        seen = edge.source_node_id in observed and edge.target_node_id in observed
+        target = _transition(edge.source, seen, downgrade_unobserved)
+        if target is not None:
+            record("edge", edge.id, (edge.source, edge.confidence), target)
+            edge.source, edge.confidence = target
+
+    for finding in findings:
+        node_ids = set(finding.affected_node_ids)
+        node_ids.update(e.node_id for e in finding.evidence if e.node_id)
+        hits = len(node_ids & observed)
+        current = finding.confidence
+        target = _transition(current.source, hits > 0, downgrade_unobserved)
+        if target is None:
+            continue
+        source, level = target
+        record("finding", finding.id, (current.source, current.level), target)
+        reasoning = (
+            f"Confirmed at runtime for {hits} of {len(node_ids)} affected node(s)"
+            if hits
+            else "No runtime evidence in latest observations"
+        )
+        finding.confidence = ConfidenceScore(level=level, source=source, reasoning=reasoning)
+
+    return report
@@ -0,0 +1,297 @@
+"""Rule execution framework for CICDGraph analysis.
+
+Rules declare the ``NodeType``s and ``EdgeType``s they inspect. The
+engine walks the graph once, dispatching each node and edge only to the
+rules interested in its type, then runs every rule over its share of the
+graph — inline, in a thread pool, or in a process pool — timing each rule
+separately. Results are merged in rule order into a ``RuleRunReport``,
+which converts to the ``FindingsEvent`` the rule engine publishes.
+
+A rule is a ``Rule`` subclass::
+
+    class NoTimeout(Rule):
+        rule_id = "job-no-timeout"
+        node_types = frozenset({NodeType.JOB})
+
+        def check_node(self, node, ctx):
+            if node.timeout_minutes is None:
+                yield self.finding(node, "Job has no timeout", Severity.MEDIUM)
+
+``RuleContext`` gives rules O(1) graph lookups. For process pools, rules
+must be picklable (module-level classes); the graph is shipped to each
+worker once.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, ClassVar, Literal
+
+from pydantic import BaseModel, Field
+
+from atlas_sdk.enums import EdgeType, NodeType, Severity
+from atlas_sdk.events import FindingsEvent
+from atlas_sdk.graph_index import GraphIndex
+from atlas_sdk.models.edges import Edge
+from atlas_sdk.models.findings import Evidence, Finding
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.models.nodes import Node
+
+Mode = Literal["inline", "thread", "process"]
+
+
+class RuleContext:
+    """Read access to the graph under analysis."""
+
+    def __init__(self, graph: CICDGraph, index: GraphIndex | None = None) -> None:
+        self.graph = graph
+        self.index = index or GraphIndex(graph)
+        self._by_type: dict[NodeType, list[Node]] | None = None
+
+    def get_node(self, node_id: str) -> Node | None:
+        return self.index.get_node(node_id)
+
+    def get_edges_from(self, node_id: str) -> list[Edge]:
+        return self.index.get_edges_from(node_id)
+
+    def get_edges_to(self, node_id: str) -> list[Edge]:
+        return self.index.get_edges_to(node_id)
+
+    def nodes_of_type(self, node_type: NodeType) -> list[Node]:
+        by_type = self._by_type
+        if by_type is None:
+            # Built locally and published in one assignment: threaded rules share
+            # this context and must never see a half-filled index.
+            by_type = {}
+            for node in self.graph.nodes:
+                by_type.setdefault(node.node_type, []).append(node)
+            self._by_type = by_type
+        return by_type.get(node_type, [])
+
+    def successors(self, node_id: str, edge_type: EdgeType | None = None) -> list[Node]:
+        """Targets of ``node_id``'s outgoing edges, optionally of one type."""
+        return [
+            node
+            for edge in self.get_edges_from(node_id)
+            if edge_type is None or edge.edge_type == edge_type
+            if (node := self.get_node(edge.target_node_id)) is not None
+        ]
+
+    def predecessors(self, node_id: str, edge_type: EdgeType | None = None) -> list[Node]:
+        """Sources of ``node_id``'s incoming edges, optionally of one type."""
+        return [
+            node
+            for edge in self.get_edges_to(node_id)
+            if edge_type is None or edge.edge_type == edge_type
+            if (node := self.get_node(edge.source_node_id)) is not None
+        ]
+
+
+class Rule:
+    """Base class for graph rules.
+
+    Subclasses set ``rule_id`` and the node/edge types they inspect, and
+    override any of ``check_node``, ``check_edge`` and ``finish``.
+    """
+
+    rule_id: ClassVar[str] = ""
+    node_types: ClassVar[frozenset[NodeType]] = frozenset()
+    edge_types: ClassVar[frozenset[EdgeType]] = frozenset()
+
+    def check_node(self, node: Node, ctx: RuleContext) -> Iterable[Finding]:
+        return ()
+
+    def check_edge(self, edge: Edge, ctx: RuleContext) -> Iterable[Finding]:
+        return ()
+
+    def finish(self, ctx: RuleContext) -> Iterable[Finding]:
+        """Called once after all dispatched nodes and edges (graph-level checks)."""
+        return ()
+
+    def finding(
+        self,
+        subject: Node | Edge,
+        title: str,
+        severity: Severity,
+        *,
+        description: str = "",
+        affected_node_ids: Sequence[str] | None = None,
+        **fields: Any,
+    ) -> Finding:
+        """A ``Finding`` for this rule about ``subject``.
+
+        The ID is derived from the rule and subject, so re-running a rule
+        on an unchanged graph yields the same finding IDs.
+        """
+        if isinstance(subject, Edge):
+            affected = [subject.source_node_id, subject.target_node_id]
+        else:
+            affected = [subject.id]
+        fields.setdefault("evidence", [Evidence(node_id=affected[0])])
+        return Finding(
+            id=f"{self.rule_id}:{subject.id}",
+            rule_id=self.rule_id,
+            title=title,
+            description=description or title,
+            severity=severity,
+            affected_node_ids=list(affected_node_ids or affected),
+            **fields,
+        )
+
+
+class RuleResult(BaseModel):
+    """Outcome of one rule over one graph."""
+
+    rule_id: str
+    findings: list[Finding] = Field(default_factory=list)
+    seconds: float = 0.0
+    nodes_checked: int = 0
+    edges_checked: int = 0
+    error: str | None = None
+
+
+class RuleRunReport(BaseModel):
+    """All rule results for one graph, in rule order."""
+
+    graph_id: str
+    results: list[RuleResult] = Field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def findings(self) -> list[Finding]:
+        return [f for r in self.results for f in r.findings]
+
+    @property
+    def errors(self) -> dict[str, str]:
+        return {r.rule_id: r.error for r in self.results if r.error}
+
+    def timings(self) -> dict[str, float]:
+        return {r.rule_id: r.seconds for r in self.results}
+
+    def to_event(self, scan_request_id: str) -> FindingsEvent:
+        return FindingsEvent(
+            scan_request_id=scan_request_id,
+            graph_id=self.graph_id,
+            findings=[f.model_dump(mode="json") for f in self.findings],
+            metadata={"rule_seconds": self.timings(), "rule_errors": self.errors},
+        )
+
+
+def _run_rule(
+    rule: Rule, node_ids: Sequence[str], edge_ids: Sequence[str], ctx: RuleContext
+) -> RuleResult:
+    started = time.perf_counter()
+    findings: list[Finding] = []
+    error = None
+    try:
+        for node_id in node_ids:
+            node = ctx.index.nodes_by_id[node_id]
+            findings.extend(rule.check_node(node, ctx))
+        for edge_id in edge_ids:
+            findings.extend(rule.check_edge(ctx.index.edges_by_id[edge_id], ctx))
+        findings.extend(rule.finish(ctx))
+    except Exception as exc:  # noqa: BLE001 — one broken rule must not sink the run
+        findings = []  # partial results would look like a clean pass on the rest
+        error = f"{type(exc).__name__}: {exc}"
+    return RuleResult(
+        rule_id=rule.rule_id,
+        findings=findings,
+        seconds=time.perf_counter() - started,
+        nodes_checked=len(node_ids),
+        edges_checked=len(edge_ids),
+        error=error,
+    )
+
+
+_worker_context: RuleContext | None = None
+
+
+def _init_worker(graph: CICDGraph) -> None:
+    global _worker_context
+    _worker_context = RuleContext(graph)
+
+
+def _run_in_worker(rule: Rule, node_ids: Sequence[str], edge_ids: Sequence[str]) -> RuleResult:
+    if _worker_context is None:
+        raise RuntimeError("rule worker not initialized")
+    return _run_rule(rule, node_ids, edge_ids, _worker_context)
+
+
+class RuleEngine:
+    """Runs a set of rules over graphs with a single shared traversal."""
+
+    def __init__(self, rules: Iterable[Rule]) -> None:
+        self.rules = list(rules)
+        seen: set[str] = set()
+        for rule in self.rules:
+            if not rule.rule_id:
+                raise ValueError(f"{type(rule).__name__} has no rule_id")
+            if rule.rule_id in seen:
+                raise ValueError(f"duplicate rule_id {rule.rule_id!r}")
+            seen.add(rule.rule_id)
+        self._by_node_type: dict[NodeType, list[int]] = {}
+        self._by_edge_type: dict[EdgeType, list[int]] = {}
+        for position, rule in enumerate(self.rules):
+            for node_type in rule.node_types:
+                self._by_node_type.setdefault(node_type, []).append(position)
+            for edge_type in rule.edge_types:
+                self._by_edge_type.setdefault(edge_type, []).append(position)
+
+    def dispatch(self, graph: CICDGraph) -> list[tuple[list[str], list[str]]]:
+        """One pass over the graph: (node ids, edge ids) per rule, in graph order."""
+        work: list[tuple[list[str], list[str]]] = [([], []) for _ in self.rules]
+        for node in graph.nodes:
+            for position in self._by_node_type.get(node.node_type, ()):
+                work[position][0].append(node.id)
+        for edge in graph.edges:
+            for position in self._by_edge_type.get(edge.edge_type, ()):
+                work[position][1].append(edge.id)
+        return work
+
+    def run(
+        self,
+        graph: CICDGraph,
+        *,
+        mode: Mode = "inline",
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+        context: RuleContext | None = None,
+    ) -> RuleRunReport:
+        """Evaluate every rule against ``graph``.
+
+        ``mode="thread"`` suits rules that release the GIL or do I/O;
+        ``mode="process"`` gives CPU-bound rules real parallelism, shipping
+        the graph to each worker once. An explicit ``executor`` overrides
+        ``mode``; each task then carries its own ``RuleContext``.
+        """
+        started = time.perf_counter()
+        work = self.dispatch(graph)
+        ctx = context or RuleContext(graph)
+        contexts = [ctx] * len(self.rules)
+
+        if not self.rules:
+            results = []
+        elif executor is not None:
+            results = list(executor.map(_run_rule, self.rules, *zip(*work), contexts))
+        elif mode == "inline" or len(self.rules) == 1:
+            results = [_run_rule(r, n, e, ctx) for r, (n, e) in zip(self.rules, work)]
+        elif mode == "thread":
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(_run_rule, self.rules, *zip(*work), contexts))
+        elif mode == "process":
+            with ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_worker, initargs=(graph,)
+            ) as pool:
+                results = list(pool.map(_run_in_worker, self.rules, *zip(*work)))
+        else:
+            raise ValueError(f"unknown mode {mode!r}")
+
+        return RuleRunReport(
+            graph_id=graph.id, results=results, wall_seconds=time.perf_counter() - started
+        )
+
+    def evaluate(self, graph: CICDGraph, scan_request_id: str, **options: Any) -> FindingsEvent:
+        """``run`` and convert to the ``FindingsEvent`` for ``graph``."""
+        return self.run(graph, **options).to_event(scan_request_id)
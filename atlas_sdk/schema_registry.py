@@ -0,0 +1,192 @@
+"""Versioned event schema registry.
+
+Every event published to Redis Streams is framed with a one-byte header
+that identifies its event type and schema version, followed by the JSON
+body. Consumers dispatch on that header straight to a precompiled
+validator for the exact (event, version) pair, and older payloads are
+upcast step by step to the current model — no trial-parsing against every
+known event shape, and no lockstep deploys when a schema evolves.
+
+Wire format:
+    byte 0     — wire id (1-255) registered for (event type, version)
+    bytes 1..  — UTF-8 JSON body of the event
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+from atlas_sdk.events import (
+    AITokenUsageEvent,
+    BaseEvent,
+    FindingsEvent,
+    LogAnalysisEvent,
+    ParseResultEvent,
+    ReportReadyEvent,
+    ScanRequestEvent,
+    ScanResultEvent,
+)
+
+Upcaster = Callable[[dict[str, Any]], dict[str, Any]]
+"""Converts a payload of schema version N into a payload of version N + 1."""
+
+
+class SchemaRegistryError(ValueError):
+    """Raised for unknown wire ids, duplicate registrations or broken upcast chains."""
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaEntry:
+    """A registered (event type, version) pair and its compiled validator."""
+
+    wire_id: int
+    event_type: str
+    version: int
+    adapter: TypeAdapter[Any]
+    upcaster: Upcaster | None = None
+
+
+class SchemaRegistry:
+    """Maps event classes and schema versions to one-byte wire ids.
+
+    The current version of an event is validated directly into its model.
+    Older versions are validated against their own schema (``dict[str, Any]``
+    unless a legacy model is given) and then passed through their upcasters
+    until they reach the current version.
+    """
+
+    def __init__(self) -> None:
+        self._by_wire: list[SchemaEntry | None] = [None] * 256
+        self._by_key: dict[tuple[str, int], SchemaEntry] = {}
+        self._classes: dict[str, type[BaseEvent]] = {}
+
+    def register(
+        self,
+        event_cls: type[BaseEvent],
+        wire_id: int,
+        *,
+        version: int | None = None,
+        schema: Any = None,
+        upcaster: Upcaster | None = None,
+    ) -> SchemaEntry:
+        """Register a schema version of ``event_cls`` under ``wire_id``.
+
+        Args:
+            event_cls: The current event model.
+            wire_id: Header byte for this (event, version) pair, 1-255.
+            version: Schema version; defaults to ``event_cls.schema_version``.
+            schema: Type used to validate payloads of a legacy version.
+                Defaults to ``dict[str, Any]``.
+            upcaster: For legacy versions, converts a payload to the next version.
+        """
+        if not 0 < wire_id < 256:
+            raise SchemaRegistryError(f"wire id must be in 1..255, got {wire_id}")
+        if self._by_wire[wire_id] is not None:
+            raise SchemaRegistryError(f"wire id {wire_id:#04x} is already registered")
+
+        event_type = event_cls.__name__
+        current = event_cls.schema_version
+        version = current if version is None else version
+        key = (event_type, version)
+        if key in self._by_key:
+            raise SchemaRegistryError(f"{event_type} v{version} is already registered")
+        if version > current:
+            raise SchemaRegistryError(
+                f"{event_type} v{version} is newer than the model (v{current})"
+            )
+        if version < current and upcaster is None:
+            raise SchemaRegistryError(f"legacy {event_type} v{version} needs an upcaster")
+
+        if version == current:
+            adapter: TypeAdapter[Any] = TypeAdapter(event_cls)
+        else:
+            adapter = TypeAdapter(schema if schema is not None else dict[str, Any])
+
+        entry = SchemaEntry(
+            wire_id=wire_id,
+            event_type=event_type,
+            version=version,
+            adapter=adapter,
+            upcaster=upcaster,
+        )
+        self._by_wire[wire_id] = entry
+        self._by_key[key] = entry
+        self._classes[event_type] = event_cls
+        return entry
+
+    def entry_for(
+        self, event_type: str | type[BaseEvent], version: int | None = None
+    ) -> SchemaEntry:
+        """Look up the entry for an event type, defaulting to its current version."""
+        name = event_type if isinstance(event_type, str) else event_type.__name__
+        if version is None:
+            cls = self._classes.get(name)
+            if cls is None:
+                raise SchemaRegistryError(f"{name} is not registered")
+            version = cls.schema_version
+        entry = self._by_key.get((name, version))
+        if entry is None:
+            raise SchemaRegistryError(f"{name} v{version} is not registered")
+        return entry
+
+    def peek(self, data: bytes) -> SchemaEntry:
+        """Return the entry named by a frame's header byte without parsing the body."""
+        if not data:
+            raise SchemaRegistryError("empty frame")
+        entry = self._by_wire[data[0]]
+        if entry is None:
+            raise SchemaRegistryError(f"unknown wire id {data[0]:#04x}")
+        return entry
+
+    def encode(self, event: BaseEvent) -> bytes:
+        """Serialize an event at its current schema version, with header byte."""
+        entry = self.entry_for(type(event))
+        return bytes((entry.wire_id,)) + entry.adapter.dump_json(event)
+
+    def decode(self, data: bytes) -> BaseEvent:
+        """Validate a frame into the current model of its event type."""
+        entry = self.peek(data)
+        payload = entry.adapter.validate_json(data[1:])
+        cls = self._classes[entry.event_type]
+        if entry.version == cls.schema_version:
+            return payload
+        return self.upcast(entry.event_type, entry.version, payload)
+
+    def upcast(self, event_type: str, version: int, payload: Any) -> BaseEvent:
+        """Walk a legacy payload through its upcasters to the current model."""
+        if isinstance(payload, BaseModel):
+            payload = payload.model_dump()
+        cls = self._classes[event_type]
+        while version < cls.schema_version:
+            entry = self._by_key.get((event_type, version))
+            if entry is None or entry.upcaster is None:
+                raise SchemaRegistryError(f"no upcaster from {event_type} v{version}")
+            payload = entry.upcaster(payload)
+            version += 1
+        return self.entry_for(event_type, version).adapter.validate_python(payload)
+
+
+# Default registry — wire ids are part of the inter-service contract and
+# must never be reused for a different (event, version) pair.
+registry = SchemaRegistry()
+registry.register(ScanRequestEvent, 0x01)
+registry.register(ScanResultEvent, 0x02)
+registry.register(ParseResultEvent, 0x03)
+registry.register(FindingsEvent, 0x04)
+registry.register(ReportReadyEvent, 0x05)
+registry.register(AITokenUsageEvent, 0x06)
+registry.register(LogAnalysisEvent, 0x07)
+
+
+def encode_event(event: BaseEvent) -> bytes:
+    """Encode an event with the default registry."""
+    return registry.encode(event)
+
+
+def decode_event(data: bytes) -> BaseEvent:
+    """Decode a framed event with the default registry."""
+    return registry.decode(data)
@@ -0,0 +1,414 @@
+"""Graph sharding for distributed analysis of very large CICDGraphs.
+
+``shard_graph`` assigns every node to exactly one shard, using one of
+three strategies:
+
+* ``"pipeline"`` — each pipeline with the stages, jobs, steps and
+  artifacts it contains (``CALLS`` / ``PRODUCES`` edges) is one unit;
+* ``"repository"`` — each repository with the pipelines it triggers and
+  their contents is one unit;
+* ``"min_cut"`` — balanced parts grown breadth-first and then refined by
+  moving boundary nodes to reduce the number of edges cut.
+
+Units are packed into shards by ``shards`` (count) or ``max_nodes``.
+Nodes reachable from several units (shared images, secrets,
+environments, runners) are owned by the shard that references them
+most. Each ``GraphShard`` also carries every edge touching one of its
+owned nodes, plus read-only *ghost* copies of the other endpoint, so
+rules that look one hop across a boundary still see their neighbours.
+
+Shards serialize independently (nodes keep their concrete types), and
+``merge_findings`` / ``merge_graphs`` recombine per-shard results with
+the original node, edge and graph IDs.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from atlas_sdk.adapters import AnyNode
+from atlas_sdk.enums import EdgeType, NodeType
+from atlas_sdk.models.edges import Edge
+from atlas_sdk.models.findings import Finding
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.models.nodes import Node
+from atlas_sdk.simulator import finding_key
+
+Strategy = Literal["pipeline", "repository", "min_cut"]
+
+_CONTAINMENT = {EdgeType.CALLS, EdgeType.PRODUCES}
+_UNIT_EDGES: dict[str, tuple[NodeType, set[EdgeType]]] = {
+    "pipeline": (NodeType.PIPELINE, _CONTAINMENT),
+    "repository": (NodeType.REPOSITORY, _CONTAINMENT | {EdgeType.TRIGGERS}),
+}
+_REFINE_PASSES = 4
+_IMBALANCE = 0.05
+
+
+class GraphShard(BaseModel):
+    """One partition of a graph: owned nodes, ghost neighbours, incident edges."""
+
+    source_graph_id: str
+    index: int
+    strategy: Strategy
+    header: dict[str, Any] = Field(default_factory=dict)
+    nodes: list[AnyNode] = Field(default_factory=list)
+    edges: list[Edge] = Field(default_factory=list)
+    owned_node_ids: list[str] = Field(default_factory=list)
+    ghost_node_ids: list[str] = Field(default_factory=list)
+
+    _owned: frozenset[str] = PrivateAttr(default=frozenset())
+    _ghosts: frozenset[str] = PrivateAttr(default=frozenset())
+
+    def model_post_init(self, context: Any, /) -> None:
+        self._owned = frozenset(self.owned_node_ids)
+        self._ghosts = frozenset(self.ghost_node_ids)
+
+    @property
+    def id(self) -> str:
+        return f"{self.source_graph_id}#{self.index}"
+
+    def owns(self, node_id: str) -> bool:
+        return node_id in self._owned
+
+    def is_ghost(self, node_id: str) -> bool:
+        return node_id in self._ghosts
+
+    def to_graph(self) -> CICDGraph:
+        """This shard as a standalone graph (ghosts included) for rule engines."""
+        return CICDGraph.model_validate(
+            {**self.header, "id": self.id, "nodes": list(self.nodes), "edges": list(self.edges)}
+        )
+
+
+class ShardSet(BaseModel):
+    """A complete partition of one graph."""
+
+    source_graph_id: str
+    strategy: Strategy
+    shards: list[GraphShard] = Field(default_factory=list)
+    assignment: dict[str, int] = Field(default_factory=dict)
+    cut_edges: int = 0
+
+    def shard_of(self, node_id: str) -> GraphShard | None:
+        index = self.assignment.get(node_id)
+        return None if index is None else self.shards[index]
+
+
+# ── Partitioning ──────────────────────────────────────────────────────
+
+
+def _adjacency(graph: CICDGraph) -> dict[str, list[tuple[str, Edge]]]:
+    adjacency: dict[str, list[tuple[str, Edge]]] = {n.id: [] for n in graph.nodes}
+    for edge in graph.edges:
+        if edge.source_node_id in adjacency and edge.target_node_id in adjacency:
+            adjacency[edge.source_node_id].append((edge.target_node_id, edge))
+            adjacency[edge.target_node_id].append((edge.source_node_id, edge))
+    return adjacency
+
+
+def _unit_assignment(graph: CICDGraph, strategy: str) -> dict[str, int]:
+    """Node id → unit number by claiming contained nodes from each seed."""
+    seed_type, follow = _UNIT_EDGES[strategy]
+    outgoing: dict[str, list[str]] = {}
+    for edge in graph.edges:
+        if edge.edge_type in follow:
+            outgoing.setdefault(edge.source_node_id, []).append(edge.target_node_id)
+
+    unit_of: dict[str, int] = {}
+    unit = -1
+    for seed in (n.id for n in graph.nodes if n.node_type == seed_type):
+        if seed in unit_of:
+            continue
+        unit += 1
+        unit_of[seed] = unit
+        queue = deque([seed])
+        while queue:
+            for target in outgoing.get(queue.popleft(), ()):
+                if target not in unit_of:
+                    unit_of[target] = unit
+                    queue.append(target)
+    return unit_of
+
+
+def _attach_shared(
+    graph: CICDGraph, unit_of: dict[str, int], adjacency: dict[str, list[tuple[str, Edge]]]
+) -> int:
+    """Give unclaimed nodes a unit; returns the number of units.
+
+    Nodes next to claimed ones go to the unit referencing them most; the
+    rest inherit from whichever neighbour reaches them first. Components
+    touching no unit become units of their own.
+    """
+    units = max(unit_of.values(), default=-1) + 1
+    decided: dict[str, int] = {}
+    for node in graph.nodes:
+        if node.id in unit_of:
+            continue
+        votes = Counter(unit_of[o] for o, _ in adjacency[node.id] if o in unit_of)
+        if votes:
+            decided[node.id] = min(votes, key=lambda u: (-votes[u], u))
+    unit_of.update(decided)
+
+    for node in graph.nodes:
+        if node.id in unit_of and node.id not in decided:
+            continue
+        if node.id not in unit_of:
+            unit_of[node.id] = units
+            units += 1
+        queue = deque([node.id])
+        while queue:
+            current = queue.popleft()
+            for other, _ in adjacency[current]:
+                if other not in unit_of:
+                    unit_of[other] = unit_of[current]
+                    queue.append(other)
+    return units
+
+
+def _pack(sizes: Sequence[int], shards: int | None, max_nodes: int | None) -> list[int]:
+    """Unit → shard by largest-first packing into the lightest (or first fitting) shard."""
+    order = sorted(range(len(sizes)), key=lambda u: (-sizes[u], u))
+    if shards is None and max_nodes is None:
+        return list(range(len(sizes)))
+    bins: list[int] = []
+    shard_of = [0] * len(sizes)
+    for unit in order:
+        if shards is not None:
+            if len(bins) < shards:
+                bins.append(0)
+                target = len(bins) - 1
+            else:
+                target = min(range(len(bins)), key=lambda b: (bins[b], b))
+        else:
+            limit = max_nodes or 0
+            target = next((b for b, load in enumerate(bins) if load + sizes[unit] <= limit), -1)
+            if target == -1:
+                bins.append(0)
+                target = len(bins) - 1
+        bins[target] += sizes[unit]
+        shard_of[unit] = target
+    return shard_of
+
+
+def _min_cut_assignment(
+    graph: CICDGraph,
+    adjacency: dict[str, list[tuple[str, Edge]]],
+    parts: int,
+    max_nodes: int | None = None,
+) -> dict[str, int]:
+    """Balanced BFS growth followed by greedy boundary refinement.
+
+    Refinement may grow a part up to ``_IMBALANCE`` over the balanced size,
+    but never past ``max_nodes``.
+    """
+    order: list[str] = []
+    seen: set[str] = set()
+    for node in graph.nodes:
+        if node.id in seen:
+            continue
+        seen.add(node.id)
+        queue = deque([node.id])
+        while queue:
+            current = queue.popleft()
+            order.append(current)
+            for other, _ in adjacency[current]:
+                if other not in seen:
+                    seen.add(other)
+                    queue.append(other)
+
+    target = math.ceil(len(order) / parts) if order else 1
+    part_of = {node_id: min(i // target, parts - 1) for i, node_id in enumerate(order)}
+    sizes = Counter(part_of.values())
+    limit = math.ceil(target * (1 + _IMBALANCE))
+    if max_nodes is not None:
+        limit = min(limit, max_nodes)
+
+    for _ in range(_REFINE_PASSES):
+        moved = 0
+        for node_id in order:
+            here = part_of[node_id]
+            links = Counter(part_of[o] for o, _ in adjacency[node_id])
+            best = max(links, key=lambda p: (links[p], p == here), default=here)
+            gain = links[best] - links[here]
+            if best != here and gain > 0 and sizes[best] < limit and sizes[here] > 1:
+                part_of[node_id] = best
+                sizes[here] -= 1
+                sizes[best] += 1
+                moved += 1
+        if not moved:
+            break
+    # Renumber so shard indexes are dense and follow first appearance.
+    renumber: dict[int, int] = {}
+    return {n: renumber.setdefault(p, len(renumber)) for n, p in part_of.items()}
+
+
+def shard_graph(
+    graph: CICDGraph,
+    *,
+    strategy: Strategy = "pipeline",
+    shards: int | None = None,
+    max_nodes: int | None = None,
+) -> ShardSet:
+    """Partition ``graph`` into independently processable shards.
+
+    Args:
+        strategy: ``"pipeline"``, ``"repository"`` or ``"min_cut"``.
+        shards: Number of shards to pack units into.
+        max_nodes: Upper bound of owned nodes per shard (a single unit
+            larger than this still gets a shard of its own). For
+            ``"min_cut"`` one of ``shards`` / ``max_nodes`` is required.
+    """
+    adjacency = _adjacency(graph)
+    if strategy == "min_cut":
+        if shards is None and max_nodes is None:
+            raise ValueError("min_cut needs shards or max_nodes")
+        parts = shards or 1
+        if max_nodes is not None:
+            max_nodes = max(max_nodes, 1)
+            parts = max(parts, math.ceil(len(graph.nodes) / max_nodes))
+        assignment = _min_cut_assignment(graph, adjacency, parts, max_nodes)
+    elif strategy in _UNIT_EDGES:
+        unit_of = _unit_assignment(graph, strategy)
+        units = _attach_shared(graph, unit_of, adjacency)
+        sizes = [0] * units
+        for unit in unit_of.values():
+            sizes[unit] += 1
+        shard_of_unit = _pack(sizes, shards, max_nodes)
+        renumber: dict[int, int] = {}
+        assignment = {
+            n.id: renumber.setdefault(shard_of_unit[unit_of[n.id]], len(renumber))
+            for n in graph.nodes
+        }
+    else:
+        raise ValueError(f"unknown sharding strategy {strategy!r}")
+    return _build_shards(graph, strategy, assignment)
+
+
+def _build_shards(graph: CICDGraph, strategy: Strategy, assignment: dict[str, int]) -> ShardSet:
+    count = max(assignment.values(), default=-1) + 1
+    header = graph.model_dump(mode="json", exclude={"nodes", "edges"})
+    nodes_by_id = {n.id: n for n in graph.nodes}
+    owned: list[list[str]] = [[] for _ in range(count)]
+    edges: list[list[Edge]] = [[] for _ in range(count)]
+    ghosts: list[dict[str, None]] = [{} for _ in range(count)]
+    for node in graph.nodes:
+        owned[assignment[node.id]].append(node.id)
+
+    cut = 0
+    for edge in graph.edges:
+        source = assignment.get(edge.source_node_id)
+        target = assignment.get(edge.target_node_id)
+        if source is None or target is None:
+            continue  # dangling edge
+        edges[source].append(edge)
+        if source != target:
+            cut += 1
+            edges[target].append(edge)
+            ghosts[source][edge.target_node_id] = None
+            ghosts[target][edge.source_node_id] = None
+
+    shards = [
+        GraphShard(
+            source_graph_id=graph.id,
+            index=i,
+            strategy=strategy,
+            header=header,
+            nodes=[nodes_by_id[n] for n in (*owned[i], *ghosts[i])],
+            edges=edges[i],
+            owned_node_ids=owned[i],
+            ghost_node_ids=list(ghosts[i]),
+        )
+        for i in range(count)
+    ]
+    return ShardSet(
+        source_graph_id=graph.id,
+        strategy=strategy,
+        shards=shards,
+        assignment=assignment,
+        cut_edges=cut,
+    )
+
+
+# ── Distribution and merge ────────────────────────────────────────────
+
+ShardAnalysis = Callable[[GraphShard], Iterable[Finding]]
+
+
+def merge_findings(results: Iterable[tuple[GraphShard, Iterable[Finding]]]) -> list[Finding]:
+    """Combine per-shard findings into one list without duplicates.
+
+    A finding is kept only from shards that own at least one of its
+    affected nodes (findings about ghosts alone are the owner's call), and
+    findings with the same rule and affected nodes reported by several
+    shards are kept once — the copy from the lowest shard index, so the
+    merged IDs are deterministic.
+    """
+    merged: dict[tuple[str, tuple[str, ...]], Finding] = {}
+    for shard, findings in sorted(results, key=lambda item: item[0].index):
+        for finding in findings:
+            if finding.affected_node_ids and not any(
+                shard.owns(n) for n in finding.affected_node_ids
+            ):
+                continue
+            merged.setdefault(finding_key(finding), finding)
+    return list(merged.values())
+
+
+def merge_graphs(shards: Iterable[GraphShard]) -> CICDGraph:
+    """Reassemble the source graph from (possibly updated) shards.
+
+    Each node is taken from the shard that owns it; ghost copies are
+    ignored. Edges are de-duplicated by ID.
+    """
+    shards = sorted(shards, key=lambda s: s.index)
+    if not shards:
+        raise ValueError("no shards to merge")
+    nodes: list[Node] = []
+    edges: dict[str, Edge] = {}
+    for shard in shards:
+        nodes.extend(n for n in shard.nodes if shard.owns(n.id))
+        for edge in shard.edges:
+            edges.setdefault(edge.id, edge)
+    return CICDGraph.model_validate(
+        {
+            **shards[0].header,
+            "id": shards[0].source_graph_id,
+            "nodes": nodes,
+            "edges": list(edges.values()),
+        }
+    )
+
+
+def analyze_shards(
+    shard_set: ShardSet | Sequence[GraphShard],
+    analyze: ShardAnalysis,
+    *,
+    max_workers: int | None = 1,
+    executor: Executor | None = None,
+) -> list[Finding]:
+    """Run ``analyze`` on every shard and merge the findings.
+
+    Shards run inline by default; pass ``max_workers`` greater than 1 (or
+    an ``executor``) to fan out across processes — ``analyze`` must then be
+    a picklable, module-level function.
+    """
+    shards = list(shard_set.shards if isinstance(shard_set, ShardSet) else shard_set)
+    if executor is not None:
+        outputs = list(executor.map(_run, [analyze] * len(shards), shards))
+    elif max_workers == 1 or len(shards) <= 1:
+        outputs = [list(analyze(shard)) for shard in shards]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            outputs = list(pool.map(_run, [analyze] * len(shards), shards))
+    return merge_findings(zip(shards, outputs))
+
+
+def _run(analyze: ShardAnalysis, shard: GraphShard) -> list[Finding]:
+    return list(analyze(shard))
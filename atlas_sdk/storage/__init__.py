@@ -0,0 +1,68 @@
+"""atlas_sdk.storage — Reference storage backends (in-memory and SQLite).
+
+Names are re-exported lazily so that using one store (e.g.
+``atlas_sdk.storage.images``) does not import the others and their models.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "SQLiteGraphStore": "atlas_sdk.storage.graphs",
+    "StoredGraphView": "atlas_sdk.storage.graphs",
+    "RetentionPolicy": "atlas_sdk.storage.history",
+    "SQLiteSnapshotStore": "atlas_sdk.storage.history",
+    "SQLiteDigestCache": "atlas_sdk.storage.images",
+    "InMemoryProposalRepository": "atlas_sdk.storage.proposals",
+    "ProposalExistsError": "atlas_sdk.storage.proposals",
+    "ProposalNotFoundError": "atlas_sdk.storage.proposals",
+    "ProposalPage": "atlas_sdk.storage.proposals",
+    "ProposalRepository": "atlas_sdk.storage.proposals",
+    "ProposalTransition": "atlas_sdk.storage.proposals",
+    "SQLiteProposalRepository": "atlas_sdk.storage.proposals",
+}
+
+__all__ = [
+    "InMemoryProposalRepository",
+    "ProposalExistsError",
+    "ProposalNotFoundError",
+    "ProposalPage",
+    "ProposalRepository",
+    "ProposalTransition",
+    "RetentionPolicy",
+    "SQLiteDigestCache",
+    "SQLiteGraphStore",
+    "SQLiteProposalRepository",
+    "SQLiteSnapshotStore",
+    "StoredGraphView",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
+
+if TYPE_CHECKING:
+    from atlas_sdk.storage.graphs import SQLiteGraphStore, StoredGraphView
+    from atlas_sdk.storage.history import RetentionPolicy, SQLiteSnapshotStore
+    from atlas_sdk.storage.images import SQLiteDigestCache
+    from atlas_sdk.storage.proposals import (
+        InMemoryProposalRepository,
+        ProposalExistsError,
+        ProposalNotFoundError,
+        ProposalPage,
+        ProposalRepository,
+        ProposalTransition,
+        SQLiteProposalRepository,
+    )
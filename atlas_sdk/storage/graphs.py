@@ -0,0 +1,291 @@
+"""SQLite-backed CICDGraph persistence.
+
+Graphs are stored normalized — one row per node and per edge — instead of
+as a single JSON blob, so updating one node rewrites one row. Nodes and
+edges are upserted in bulk with ``executemany`` keyed by (graph id, id),
+and point lookups mirror ``CICDGraph.get_node`` / ``get_edges_from`` /
+``get_edges_to`` through indexes on id, node type and edge endpoints.
+
+``SQLiteGraphStore.view`` exposes a stored graph through the read API
+used by ``GraphOverlay``, and ``apply_diff`` persists an overlay's changes.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator
+
+from atlas_sdk.enums import NodeType
+from atlas_sdk.models.edges import Edge
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.models.nodes import NODE_TYPE_MAP, Node
+from atlas_sdk.overlay import GraphDiff
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS graphs (
+    id      TEXT PRIMARY KEY,
+    header  TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS nodes (
+    graph_id   TEXT NOT NULL,
+    id         TEXT NOT NULL,
+    node_type  TEXT NOT NULL,
+    name       TEXT NOT NULL,
+    data       TEXT NOT NULL,
+    PRIMARY KEY (graph_id, id)
+);
+CREATE INDEX IF NOT EXISTS ix_nodes_type ON nodes (graph_id, node_type);
+
+CREATE TABLE IF NOT EXISTS edges (
+    graph_id        TEXT NOT NULL,
+    id              TEXT NOT NULL,
+    edge_type       TEXT NOT NULL,
+    source_node_id  TEXT NOT NULL,
+    target_node_id  TEXT NOT NULL,
+    data            TEXT NOT NULL,
+    PRIMARY KEY (graph_id, id)
+);
+CREATE INDEX IF NOT EXISTS ix_edges_source ON edges (graph_id, source_node_id);
+CREATE INDEX IF NOT EXISTS ix_edges_target ON edges (graph_id, target_node_id);
+"""
+
+_UPSERT_NODE = (
+    "INSERT INTO nodes (graph_id, id, node_type, name, data) VALUES (?, ?, ?, ?, ?)"
+    " ON CONFLICT (graph_id, id) DO UPDATE SET node_type = excluded.node_type,"
+    " name = excluded.name, data = excluded.data"
+)
+_UPSERT_EDGE = (
+    "INSERT INTO edges (graph_id, id, edge_type, source_node_id, target_node_id, data)"
+    " VALUES (?, ?, ?, ?, ?, ?)"
+    " ON CONFLICT (graph_id, id) DO UPDATE SET edge_type = excluded.edge_type,"
+    " source_node_id = excluded.source_node_id, target_node_id = excluded.target_node_id,"
+    " data = excluded.data"
+)
+_GRAPH_HEADER_FIELDS = {"nodes", "edges"}
+
+
+def _node_from_row(node_type: str, data: str) -> Node:
+    return NODE_TYPE_MAP.get(NodeType(node_type), Node).model_validate_json(data)
+
+
+class SQLiteGraphStore:
+    """Normalized SQLite storage for many graphs; ``":memory:"`` for a throwaway DB."""
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    # ── Writes ────────────────────────────────────────────────────────
+
+    def save_graph(self, graph: CICDGraph) -> None:
+        """Store a whole graph, replacing any previous version of it."""
+        with self._conn:
+            self._conn.execute("DELETE FROM nodes WHERE graph_id = ?", (graph.id,))
+            self._conn.execute("DELETE FROM edges WHERE graph_id = ?", (graph.id,))
+            self._write_header(graph)
+            self._upsert_nodes(graph.id, graph.nodes)
+            self._upsert_edges(graph.id, graph.edges)
+
+    def save_header(self, graph: CICDGraph) -> None:
+        """Update graph-level fields (name, platform, metadata, ...) only."""
+        with self._conn:
+            self._write_header(graph)
+
+    def upsert_nodes(self, graph_id: str, nodes: Iterable[Node]) -> int:
+        """Insert or replace nodes by ID; returns the number of rows written."""
+        with self._conn:
+            return self._upsert_nodes(graph_id, nodes)
+
+    def upsert_edges(self, graph_id: str, edges: Iterable[Edge]) -> int:
+        """Insert or replace edges by ID; returns the number of rows written."""
+        with self._conn:
+            return self._upsert_edges(graph_id, edges)
+
+    def delete_nodes(self, graph_id: str, node_ids: Iterable[str]) -> int:
+        """Delete nodes and every edge incident to them."""
+        with self._conn:
+            return self._delete_nodes(graph_id, node_ids)
+
+    def delete_edges(self, graph_id: str, edge_ids: Iterable[str]) -> int:
+        """Delete edges by ID."""
+        with self._conn:
+            return self._delete_edges(graph_id, edge_ids)
+
+    def apply_diff(self, graph_id: str, diff: GraphDiff) -> None:
+        """Persist the changes recorded by a ``GraphOverlay`` in one transaction."""
+        with self._conn:
+            self._delete_edges(graph_id, diff.removed_edge_ids)
+            self._delete_nodes(graph_id, diff.removed_node_ids)
+            self._upsert_nodes(graph_id, [*diff.added_nodes, *diff.modified_nodes])
+            self._upsert_edges(graph_id, [*diff.added_edges, *diff.modified_edges])
+
+    def delete_graph(self, graph_id: str) -> None:
+        """Remove a graph with all its nodes and edges."""
+        with self._conn:
+            for table in ("nodes", "edges"):
+                self._conn.execute(f"DELETE FROM {table} WHERE graph_id = ?", (graph_id,))
+            self._conn.execute("DELETE FROM graphs WHERE id = ?", (graph_id,))
+
+    def _write_header(self, graph: CICDGraph) -> None:
+        header = graph.model_dump_json(exclude=_GRAPH_HEADER_FIELDS)
+        self._conn.execute(
+            "INSERT INTO graphs (id, header) VALUES (?, ?)"
+            " ON CONFLICT (id) DO UPDATE SET header = excluded.header",
+            (graph.id, header),
+        )
+
+    def _upsert_nodes(self, graph_id: str, nodes: Iterable[Node]) -> int:
+        cur = self._conn.executemany(
+            _UPSERT_NODE,
+            ((graph_id, n.id, n.node_type.value, n.name, n.model_dump_json()) for n in nodes),
+        )
+        return cur.rowcount
+
+    def _upsert_edges(self, graph_id: str, edges: Iterable[Edge]) -> int:
+        cur = self._conn.executemany(
+            _UPSERT_EDGE,
+            (
+                (
+                    graph_id,
+                    e.id,
+                    e.edge_type.value,
+                    e.source_node_id,
+                    e.target_node_id,
+                    e.model_dump_json(),
+                )
+                for e in edges
+            ),
+        )
+        return cur.rowcount
+
+    def _delete_nodes(self, graph_id: str, node_ids: Iterable[str]) -> int:
+        rows = [(graph_id, node_id) for node_id in node_ids]
+        self._conn.executemany("DELETE FROM edges WHERE graph_id = ? AND source_node_id = ?", rows)
+        self._conn.executemany("DELETE FROM edges WHERE graph_id = ? AND target_node_id = ?", rows)
+        cur = self._conn.executemany("DELETE FROM nodes WHERE graph_id = ? AND id = ?", rows)
+        return cur.rowcount
+
+    def _delete_edges(self, graph_id: str, edge_ids: Iterable[str]) -> int:
+        cur = self._conn.executemany(
+            "DELETE FROM edges WHERE graph_id = ? AND id = ?",
+            [(graph_id, edge_id) for edge_id in edge_ids],
+        )
+        return cur.rowcount
+
+    # ── Reads ─────────────────────────────────────────────────────────
+
+    def graph_ids(self) -> list[str]:
+        return [row[0] for row in self._conn.execute("SELECT id FROM graphs ORDER BY id")]
+
+    def load_graph(self, graph_id: str) -> CICDGraph | None:
+        """Rebuild a full ``CICDGraph`` (nodes typed by ``node_type``)."""
+        row = self._conn.execute("SELECT header FROM graphs WHERE id = ?", (graph_id,)).fetchone()
+        if row is None:
+            return None
+        graph = CICDGraph.model_validate(json.loads(row[0]))
+        graph.nodes = list(self.iter_nodes(graph_id))
+        graph.edges = list(self.iter_edges(graph_id))
+        return graph
+
+    def node_count(self, graph_id: str) -> int:
+        sql = "SELECT COUNT(*) FROM nodes WHERE graph_id = ?"
+        return self._conn.execute(sql, (graph_id,)).fetchone()[0]
+
+    def edge_count(self, graph_id: str) -> int:
+        sql = "SELECT COUNT(*) FROM edges WHERE graph_id = ?"
+        return self._conn.execute(sql, (graph_id,)).fetchone()[0]
+
+    def iter_nodes(self, graph_id: str, node_type: NodeType | None = None) -> Iterator[Node]:
+        """Stream a graph's nodes, optionally of one type."""
+        if node_type is None:
+            cur = self._conn.execute(
+                "SELECT node_type, data FROM nodes WHERE graph_id = ? ORDER BY rowid", (graph_id,)
+            )
+        else:
+            cur = self._conn.execute(
+                "SELECT node_type, data FROM nodes WHERE graph_id = ? AND node_type = ?"
+                " ORDER BY rowid",
+                (graph_id, NodeType(node_type).value),
+            )
+        for node_type_value, data in cur:
+            yield _node_from_row(node_type_value, data)
+
+    def iter_edges(self, graph_id: str) -> Iterator[Edge]:
+        """Stream a graph's edges."""
+        cur = self._conn.execute(
+            "SELECT data FROM edges WHERE graph_id = ? ORDER BY rowid", (graph_id,)
+        )
+        for (data,) in cur:
+            yield Edge.model_validate_json(data)
+
+    def get_node(self, graph_id: str, node_id: str) -> Node | None:
+        """Find a node by its ID."""
+        row = self._conn.execute(
+            "SELECT node_type, data FROM nodes WHERE graph_id = ? AND id = ?", (graph_id, node_id)
+        ).fetchone()
+        return _node_from_row(*row) if row else None
+
+    def get_edge(self, graph_id: str, edge_id: str) -> Edge | None:
+        """Find an edge by its ID."""
+        row = self._conn.execute(
+            "SELECT data FROM edges WHERE graph_id = ? AND id = ?", (graph_id, edge_id)
+        ).fetchone()
+        return Edge.model_validate_json(row[0]) if row else None
+
+    def get_edges_from(self, graph_id: str, node_id: str) -> list[Edge]:
+        """Get all edges originating from a node."""
+        return self._edges_where(graph_id, "source_node_id", node_id)
+
+    def get_edges_to(self, graph_id: str, node_id: str) -> list[Edge]:
+        """Get all edges pointing to a node."""
+        return self._edges_where(graph_id, "target_node_id", node_id)
+
+    def _edges_where(self, graph_id: str, column: str, node_id: str) -> list[Edge]:
+        rows = self._conn.execute(
+            f"SELECT data FROM edges WHERE graph_id = ? AND {column} = ? ORDER BY rowid",
+            (graph_id, node_id),
+        )
+        return [Edge.model_validate_json(data) for (data,) in rows]
+
+    def view(self, graph_id: str) -> StoredGraphView:
+        """A read view of one stored graph, usable as a ``GraphOverlay`` base."""
+        return StoredGraphView(self, graph_id)
+
+
+class StoredGraphView:
+    """``GraphView`` over one graph in a ``SQLiteGraphStore``; every read hits SQLite."""
+
+    def __init__(self, store: SQLiteGraphStore, graph_id: str) -> None:
+        self.store = store
+        self.graph_id = graph_id
+
+    @property
+    def node_count(self) -> int:
+        return self.store.node_count(self.graph_id)
+
+    @property
+    def edge_count(self) -> int:
+        return self.store.edge_count(self.graph_id)
+
+    def iter_nodes(self) -> Iterator[Node]:
+        return self.store.iter_nodes(self.graph_id)
+
+    def iter_edges(self) -> Iterator[Edge]:
+        return self.store.iter_edges(self.graph_id)
+
+    def get_node(self, node_id: str) -> Node | None:
+        return self.store.get_node(self.graph_id, node_id)
+
+    def get_edge(self, edge_id: str) -> Edge | None:
+        return self.store.get_edge(self.graph_id, edge_id)
+
+    def get_edges_from(self, node_id: str) -> list[Edge]:
+        return self.store.get_edges_from(self.graph_id, node_id)
+
+    def get_edges_to(self, node_id: str) -> list[Edge]:
+        return self.store.get_edges_to(self.graph_id, node_id)
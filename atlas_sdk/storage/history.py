@@ -0,0 +1,271 @@
+"""Scan history storage with tiered retention and downsampling.
+
+Snapshots are appended to a time-indexed SQLite table. Each append also
+folds the snapshot into its daily and weekly rollup rows (running sums per
+metric), so downsampled series are always up to date and never need a
+recompute. ``compact`` enforces the ``RetentionPolicy`` with plain indexed
+range deletes: raw snapshots older than ``raw_days`` and daily rollups older
+than ``daily_days`` are dropped, their data already living in the coarser
+tier. Storage therefore grows by about one row per week once history is
+older than a year.
+
+``series`` answers a time range with the finest tier available for each
+part of it — raw points for recent history, then daily, then weekly
+averages — and ``trend_report`` wraps that series in a ``TrendReport``.
+Tier boundaries are aligned to day and week starts (weeks start Monday,
+UTC) so no period is counted twice.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel
+
+from atlas_sdk.models.scan_history import ScanSnapshot, TrendReport
+from atlas_sdk.storage._time import from_micros, to_micros, utc_now
+
+Resolution = Literal["auto", "raw", "daily", "weekly"]
+
+METRICS = (
+    "complexity_score",
+    "fragility_score",
+    "maturity_score",
+    "finding_count",
+    "node_count",
+    "edge_count",
+)
+_COUNT_METRICS = {"finding_count", "node_count", "edge_count"}
+
+_DAY_US = 86_400 * 1_000_000
+_WEEK_US = 7 * _DAY_US
+_WEEK_OFFSET_US = 4 * _DAY_US  # 1970-01-05 was a Monday
+
+_SUMS = ", ".join(f"sum_{m}" for m in METRICS)
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS snapshots (
+    id          TEXT PRIMARY KEY,
+    graph_name  TEXT NOT NULL,
+    scanned_us  INTEGER NOT NULL,
+    data        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_snapshots_time ON snapshots (graph_name, scanned_us);
+CREATE INDEX IF NOT EXISTS ix_snapshots_age ON snapshots (scanned_us);
+
+CREATE TABLE IF NOT EXISTS rollups (
+    graph_name  TEXT NOT NULL,
+    resolution  TEXT NOT NULL,
+    bucket_us   INTEGER NOT NULL,
+    samples     INTEGER NOT NULL,
+    {", ".join(f"sum_{m} REAL NOT NULL" for m in METRICS)},
+    PRIMARY KEY (graph_name, resolution, bucket_us)
+);
+CREATE INDEX IF NOT EXISTS ix_rollups_age ON rollups (resolution, bucket_us);
+"""
+_UPSERT_ROLLUP = (
+    f"INSERT INTO rollups (graph_name, resolution, bucket_us, samples, {_SUMS})"
+    f" VALUES (?, ?, ?, 1, {', '.join('?' for _ in METRICS)})"
+    " ON CONFLICT (graph_name, resolution, bucket_us) DO UPDATE SET"
+    " samples = samples + 1, " + ", ".join(f"sum_{m} = sum_{m} + excluded.sum_{m}" for m in METRICS)
+)
+
+
+def _day_floor(us: int) -> int:
+    return us - us % _DAY_US
+
+
+def _week_floor(us: int) -> int:
+    return us - (us - _WEEK_OFFSET_US) % _WEEK_US
+
+
+class RetentionPolicy(BaseModel):
+    """How long each tier is kept (``weekly_days=None`` keeps weeklies forever)."""
+
+    raw_days: int = 30
+    daily_days: int = 365
+    weekly_days: int | None = None
+
+
+class SQLiteSnapshotStore:
+    """Time-indexed ``ScanSnapshot`` store with incremental daily/weekly rollups.
+
+    Args:
+        path: SQLite database path; ``":memory:"`` for a throwaway store.
+        retention: Tier retention used by ``compact`` and ``series``.
+    """
+
+    def __init__(self, path: str = ":memory:", *, retention: RetentionPolicy | None = None) -> None:
+        self.retention = retention or RetentionPolicy()
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    # ── Writes ────────────────────────────────────────────────────────
+
+    def append(self, snapshot: ScanSnapshot) -> bool:
+        """Store a snapshot; returns False if its ID was already stored."""
+        return self.append_many([snapshot]) == 1
+
+    def append_many(self, snapshots: Iterable[ScanSnapshot]) -> int:
+        """Store snapshots in one transaction; returns how many were new."""
+        added = 0
+        with self._conn:
+            for snapshot in snapshots:
+                scanned_us = to_micros(snapshot.scanned_at)
+                cur = self._conn.execute(
+                    "INSERT OR IGNORE INTO snapshots (id, graph_name, scanned_us, data)"
+                    " VALUES (?, ?, ?, ?)",
+                    (snapshot.id, snapshot.graph_name, scanned_us, snapshot.model_dump_json()),
+                )
+                if not cur.rowcount:
+                    continue
+                values = [float(getattr(snapshot, m)) for m in METRICS]
+                self._conn.executemany(
+                    _UPSERT_ROLLUP,
+                    [
+                        (snapshot.graph_name, "daily", _day_floor(scanned_us), *values),
+                        (snapshot.graph_name, "weekly", _week_floor(scanned_us), *values),
+                    ],
+                )
+                added += 1
+        return added
+
+    def compact(self, now: datetime | None = None) -> dict[str, int]:
+        """Apply the retention policy; returns rows deleted per tier."""
+        raw_cut, daily_cut = self._cutoffs(now)
+        deleted: dict[str, int] = {}
+        with self._conn:
+            cur = self._conn.execute("DELETE FROM snapshots WHERE scanned_us < ?", (raw_cut,))
+            deleted["raw"] = cur.rowcount
+            cur = self._conn.execute(
+                "DELETE FROM rollups WHERE resolution = 'daily' AND bucket_us < ?", (daily_cut,)
+            )
+            deleted["daily"] = cur.rowcount
+            deleted["weekly"] = 0
+            if self.retention.weekly_days is not None:
+                weekly_cut = _week_floor(
+                    to_micros(now or utc_now()) - self.retention.weekly_days * _DAY_US
+                )
+                cur = self._conn.execute(
+                    "DELETE FROM rollups WHERE resolution = 'weekly' AND bucket_us < ?",
+                    (weekly_cut,),
+                )
+                deleted["weekly"] = cur.rowcount
+        return deleted
+
+    # ── Reads ─────────────────────────────────────────────────────────
+
+    def counts(self) -> dict[str, int]:
+        """Stored rows per tier."""
+        counts = {"raw": self._conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]}
+        for resolution in ("daily", "weekly"):
+            counts[resolution] = self._conn.execute(
+                "SELECT COUNT(*) FROM rollups WHERE resolution = ?", (resolution,)
+            ).fetchone()[0]
+        return counts
+
+    def series(
+        self,
+        graph_name: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        *,
+        resolution: Resolution = "auto",
+        now: datetime | None = None,
+    ) -> list[ScanSnapshot]:
+        """Snapshots for a graph in ``[start, end]``, oldest first.
+
+        With ``resolution="auto"`` each part of the range is served from the
+        finest tier retained for it. Rollup points are averages stamped with
+        their bucket start, with ``metadata["resolution"]`` and
+        ``metadata["samples"]`` set.
+        """
+        lo = to_micros(start) if start else None
+        hi = to_micros(end) if end else None
+        if resolution == "raw":
+            return self._raw(graph_name, lo, hi)
+        if resolution != "auto":
+            return self._rollups(graph_name, resolution, lo, hi)
+
+        raw_cut, daily_cut = self._cutoffs(now)
+        weekly = self._rollups(graph_name, "weekly", lo, _min(hi, daily_cut - 1))
+        daily = self._rollups(graph_name, "daily", _max(lo, daily_cut), _min(hi, raw_cut - 1))
+        raw = self._raw(graph_name, _max(lo, raw_cut), hi)
+        return weekly + daily + raw
+
+    def trend_report(
+        self,
+        graph_name: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        *,
+        resolution: Resolution = "auto",
+        now: datetime | None = None,
+    ) -> TrendReport:
+        """A ``TrendReport`` over ``series(...)`` with trends computed."""
+        snapshots = self.series(graph_name, start, end, resolution=resolution, now=now)
+        report = TrendReport(graph_name=graph_name, snapshots=snapshots)
+        report.compute_trends()
+        return report
+
+    def _cutoffs(self, now: datetime | None) -> tuple[int, int]:
+        now_us = to_micros(now or utc_now())
+        raw_cut = _day_floor(now_us - self.retention.raw_days * _DAY_US)
+        daily_cut = min(_week_floor(now_us - self.retention.daily_days * _DAY_US), raw_cut)
+        return raw_cut, daily_cut
+
+    def _raw(self, graph_name: str, lo: int | None, hi: int | None) -> list[ScanSnapshot]:
+        sql = "SELECT data FROM snapshots WHERE graph_name = ?"
+        params: list[object] = [graph_name]
+        sql += _range_sql("scanned_us", lo, hi, params)
+        rows = self._conn.execute(sql + " ORDER BY scanned_us, id", params)
+        return [ScanSnapshot.model_validate_json(data) for (data,) in rows]
+
+    def _rollups(
+        self, graph_name: str, resolution: str, lo: int | None, hi: int | None
+    ) -> list[ScanSnapshot]:
+        if lo is not None:
+            lo = _day_floor(lo) if resolution == "daily" else _week_floor(lo)
+        sql = f"SELECT bucket_us, samples, {_SUMS} FROM rollups WHERE graph_name = ? AND resolution = ?"
+        params: list[object] = [graph_name, resolution]
+        sql += _range_sql("bucket_us", lo, hi, params)
+        points = []
+        for bucket_us, samples, *sums in self._conn.execute(sql + " ORDER BY bucket_us", params):
+            values = {
+                m: (round(s / samples) if m in _COUNT_METRICS else s / samples)
+                for m, s in zip(METRICS, sums)
+            }
+            points.append(
+                ScanSnapshot(
+                    id=f"{resolution}:{graph_name}:{bucket_us}",
+                    graph_name=graph_name,
+                    scanned_at=from_micros(bucket_us),
+                    metadata={"resolution": resolution, "samples": samples},
+                    **values,
+                )
+            )
+        return points
+
+
+def _range_sql(column: str, lo: int | None, hi: int | None, params: list[object]) -> str:
+    sql = ""
+    if lo is not None:
+        sql += f" AND {column} >= ?"
+        params.append(lo)
+    if hi is not None:
+        sql += f" AND {column} <= ?"
+        params.append(hi)
+    return sql
+
+
+def _min(a: int | None, b: int) -> int:
+    return b if a is None else min(a, b)
+
+
+def _max(a: int | None, b: int) -> int:
+    return b if a is None else max(a, b)
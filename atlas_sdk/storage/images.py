@@ -0,0 +1,67 @@
+"""SQLite-backed image digest cache.
+
+The local disk ``CacheBackend`` for ``atlas_sdk.images.DigestCache``: one
+row per tag reference holding the resolved digest (``NULL`` for "not
+found") and its expiry, so digests resolved by one scan are reused by the
+next without asking the registry again.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS image_digests (
+    reference   TEXT PRIMARY KEY,
+    digest      TEXT,
+    expires_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_image_digests_expiry ON image_digests (expires_at);
+"""
+
+
+class SQLiteDigestCache:
+    """Persistent ``(digest, expires_at)`` store keyed by tag reference.
+
+    Safe to share between the threads of an ``ImageCatalog`` resolving in
+    parallel.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get(self, reference: str) -> tuple[str | None, float] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest, expires_at FROM image_digests WHERE reference = ?", (reference,)
+            ).fetchone()
+        return None if row is None else (row[0], row[1])
+
+    def set(self, reference: str, digest: str | None, expires_at: float) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO image_digests (reference, digest, expires_at) VALUES (?, ?, ?)"
+                " ON CONFLICT (reference) DO UPDATE SET"
+                " digest = excluded.digest, expires_at = excluded.expires_at",
+                (reference, digest, expires_at),
+            )
+
+    def delete(self, reference: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM image_digests WHERE reference = ?", (reference,))
+
+    def purge_expired(self, now: float) -> int:
+        """Delete entries that expired before ``now``; returns how many."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM image_digests WHERE expires_at <= ?", (now,))
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM image_digests").fetchone()[0]
@@ -0,0 +1,402 @@
+"""Proposal repository with indexed queries and an append-only audit log.
+
+``ProposalRepository`` is the storage contract used by services that
+answer questions like "pending proposals for graph X". Two reference
+implementations are provided:
+
+    InMemoryProposalRepository — dict + secondary indexes, for tests/CLIs
+    SQLiteProposalRepository   — normalized tables, runnable locally
+
+Every ``submit`` / ``approve`` / ``reject`` is recorded as an immutable
+``ProposalTransition`` so audit history can be replayed without loading
+whole proposal documents. Queries are keyset-paginated on
+(``updated_at``, ``id``), newest first.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from atlas_sdk.models.proposals import Proposal
+from atlas_sdk.storage._time import to_micros, utc_now
+
+TransitionAction = Literal["create", "submit", "approve", "reject"]
+
+DEFAULT_PAGE_SIZE = 50
+
+
+def _cursor(proposal: Proposal) -> str:
+    return f"{to_micros(proposal.updated_at)}:{proposal.id}"
+
+
+def _parse_cursor(cursor: str) -> tuple[int, str]:
+    micros, _, proposal_id = cursor.partition(":")
+    return int(micros), proposal_id
+
+
+class ProposalNotFoundError(KeyError):
+    """Raised when a transition targets an unknown proposal."""
+
+
+class ProposalExistsError(ValueError):
+    """Raised when creating a proposal whose ID is already stored."""
+
+
+class ProposalTransition(BaseModel):
+    """One append-only audit event in a proposal's lifecycle."""
+
+    seq: int = 0
+    proposal_id: str
+    action: TransitionAction
+    actor: str = ""
+    comment: str = ""
+    from_status: str | None = None
+    to_status: str
+    at: datetime = Field(default_factory=utc_now)
+
+
+class ProposalPage(BaseModel):
+    """One page of query results."""
+
+    items: list[Proposal] = Field(default_factory=list)
+    next_cursor: str | None = None
+
+
+class ProposalRepository(ABC):
+    """Storage contract for proposals and their audit log."""
+
+    # ── Storage primitives ────────────────────────────────────────────
+
+    @abstractmethod
+    def get(self, proposal_id: str) -> Proposal | None:
+        """Load a proposal by ID."""
+
+    @abstractmethod
+    def _write(
+        self, proposal: Proposal, transition: ProposalTransition, *, create: bool = False
+    ) -> None:
+        """Persist ``proposal`` and append ``transition`` atomically.
+
+        With ``create`` the proposal must be new: raise
+        ``ProposalExistsError`` (writing nothing) if its ID is already stored.
+        """
+
+    @abstractmethod
+    def query(
+        self,
+        *,
+        graph_id: str | None = None,
+        status: str | None = None,
+        author: str | None = None,
+        updated_after: datetime | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> ProposalPage:
+        """Proposals matching every given filter, newest ``updated_at`` first."""
+
+    @abstractmethod
+    def history(self, proposal_id: str, *, after_seq: int = 0) -> Iterator[ProposalTransition]:
+        """Stream a proposal's transitions in order, starting after ``after_seq``."""
+
+    # ── Lifecycle ─────────────────────────────────────────────────────
+
+    def create(self, proposal: Proposal, actor: str = "") -> Proposal:
+        """Store a new proposal and record its creation.
+
+        Raises:
+            ProposalExistsError: A proposal with the same ID is already stored.
+        """
+        self._write(
+            proposal,
+            ProposalTransition(
+                proposal_id=proposal.id,
+                action="create",
+                actor=actor or proposal.author,
+                to_status=proposal.status,
+                at=proposal.created_at,
+            ),
+            create=True,
+        )
+        return proposal
+
+    def submit(self, proposal_id: str, actor: str = "") -> Proposal:
+        """Move a proposal to ``pending``."""
+        return self._transition(proposal_id, "submit", actor, "")
+
+    def approve(self, proposal_id: str, reviewer: str, comment: str = "") -> Proposal:
+        """Approve a proposal (see ``Proposal.approve``)."""
+        return self._transition(proposal_id, "approve", reviewer, comment)
+
+    def reject(self, proposal_id: str, reviewer: str, reason: str = "") -> Proposal:
+        """Reject a proposal (see ``Proposal.reject``)."""
+        return self._transition(proposal_id, "reject", reviewer, reason)
+
+    def _transition(
+        self, proposal_id: str, action: TransitionAction, actor: str, comment: str
+    ) -> Proposal:
+        proposal = self.get(proposal_id)
+        if proposal is None:
+            raise ProposalNotFoundError(proposal_id)
+        before = proposal.status
+        if action == "submit":
+            proposal.submit()
+        elif action == "approve":
+            proposal.approve(actor, comment)
+        else:
+            proposal.reject(actor, comment)
+        self._write(
+            proposal,
+            ProposalTransition(
+                proposal_id=proposal_id,
+                action=action,
+                actor=actor,
+                comment=comment,
+                from_status=before,
+                to_status=proposal.status,
+                at=proposal.updated_at,
+            ),
+        )
+        return proposal
+
+    def status_at(self, proposal_id: str, at: datetime) -> str | None:
+        """Replay the audit log to find a proposal's status at a point in time."""
+        status = None
+        for transition in self.history(proposal_id):
+            if transition.at > at:
+                break
+            status = transition.to_status
+        return status
+
+
+class InMemoryProposalRepository(ProposalRepository):
+    """Dict-backed repository with secondary indexes on graph, status and author."""
+
+    def __init__(self) -> None:
+        self._proposals: dict[str, Proposal] = {}
+        self._by_graph: dict[str, set[str]] = {}
+        self._by_status: dict[str, set[str]] = {}
+        self._by_author: dict[str, set[str]] = {}
+        self._events: dict[str, list[ProposalTransition]] = {}
+        self._seq = 0
+
+    def get(self, proposal_id: str) -> Proposal | None:
+        proposal = self._proposals.get(proposal_id)
+        return proposal.model_copy(deep=True) if proposal is not None else None
+
+    def _write(
+        self, proposal: Proposal, transition: ProposalTransition, *, create: bool = False
+    ) -> None:
+        previous = self._proposals.get(proposal.id)
+        if previous is not None and create:
+            raise ProposalExistsError(proposal.id)
+        if previous is not None:
+            self._by_graph[previous.graph_id].discard(previous.id)
+            self._by_status[previous.status].discard(previous.id)
+            self._by_author[previous.author].discard(previous.id)
+        stored = proposal.model_copy(deep=True)
+        self._proposals[stored.id] = stored
+        self._by_graph.setdefault(stored.graph_id, set()).add(stored.id)
+        self._by_status.setdefault(stored.status, set()).add(stored.id)
+        self._by_author.setdefault(stored.author, set()).add(stored.id)
+        self._seq += 1
+        transition.seq = self._seq
+        self._events.setdefault(stored.id, []).append(transition)
+
+    def query(
+        self,
+        *,
+        graph_id: str | None = None,
+        status: str | None = None,
+        author: str | None = None,
+        updated_after: datetime | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> ProposalPage:
+        candidates: set[str] | None = None
+        for index, value in (
+            (self._by_graph, graph_id),
+            (self._by_status, status),
+            (self._by_author, author),
+        ):
+            if value is None:
+                continue
+            ids = index.get(value, set())
+            candidates = set(ids) if candidates is None else candidates & ids
+        pool = (
+            self._proposals.values()
+            if candidates is None
+            else [self._proposals[i] for i in candidates]
+        )
+
+        keyed = [(to_micros(p.updated_at), p.id, p) for p in pool]
+        if updated_after is not None:
+            floor = to_micros(updated_after)
+            keyed = [k for k in keyed if k[0] > floor]
+        if cursor is not None:
+            after = _parse_cursor(cursor)
+            keyed = [k for k in keyed if (k[0], k[1]) < after]
+        keyed.sort(key=lambda k: (k[0], k[1]), reverse=True)
+
+        items = [k[2].model_copy(deep=True) for k in keyed[:limit]]
+        next_cursor = _cursor(items[-1]) if len(keyed) > limit else None
+        return ProposalPage(items=items, next_cursor=next_cursor)
+
+    def history(self, proposal_id: str, *, after_seq: int = 0) -> Iterator[ProposalTransition]:
+        for transition in self._events.get(proposal_id, ()):
+            if transition.seq > after_seq:
+                yield transition.model_copy()
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS proposals (
+    id          TEXT PRIMARY KEY,
+    graph_id    TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    author      TEXT NOT NULL,
+    updated_us  INTEGER NOT NULL,
+    data        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_proposals_graph ON proposals (graph_id, updated_us, id);
+CREATE INDEX IF NOT EXISTS ix_proposals_status ON proposals (status, updated_us, id);
+CREATE INDEX IF NOT EXISTS ix_proposals_author ON proposals (author, updated_us, id);
+CREATE INDEX IF NOT EXISTS ix_proposals_updated ON proposals (updated_us, id);
+
+CREATE TABLE IF NOT EXISTS proposal_events (
+    seq          INTEGER PRIMARY KEY AUTOINCREMENT,
+    proposal_id  TEXT NOT NULL,
+    action       TEXT NOT NULL,
+    actor        TEXT NOT NULL,
+    comment      TEXT NOT NULL,
+    from_status  TEXT,
+    to_status    TEXT NOT NULL,
+    at           TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_proposal_events ON proposal_events (proposal_id, seq);
+CREATE TRIGGER IF NOT EXISTS proposal_events_no_update
+    BEFORE UPDATE ON proposal_events
+    BEGIN SELECT RAISE(ABORT, 'proposal_events is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS proposal_events_no_delete
+    BEFORE DELETE ON proposal_events
+    BEGIN SELECT RAISE(ABORT, 'proposal_events is append-only'); END;
+"""
+
+
+class SQLiteProposalRepository(ProposalRepository):
+    """SQLite-backed repository; pass ``":memory:"`` for a throwaway database."""
+
+    def __init__(self, path: str = ":memory:", *, history_batch_size: int = 500) -> None:
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+        self.history_batch_size = history_batch_size
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get(self, proposal_id: str) -> Proposal | None:
+        row = self._conn.execute(
+            "SELECT data FROM proposals WHERE id = ?", (proposal_id,)
+        ).fetchone()
+        return Proposal.model_validate_json(row[0]) if row else None
+
+    def _write(
+        self, proposal: Proposal, transition: ProposalTransition, *, create: bool = False
+    ) -> None:
+        sql = (
+            "INSERT INTO proposals (id, graph_id, status, author, updated_us, data)"
+            " VALUES (?, ?, ?, ?, ?, ?)"
+        )
+        if not create:
+            sql += (
+                " ON CONFLICT (id) DO UPDATE SET graph_id = excluded.graph_id,"
+                " status = excluded.status, author = excluded.author,"
+                " updated_us = excluded.updated_us, data = excluded.data"
+            )
+        row = (
+            proposal.id,
+            proposal.graph_id,
+            proposal.status,
+            proposal.author,
+            to_micros(proposal.updated_at),
+            proposal.model_dump_json(),
+        )
+        with self._conn:
+            try:
+                self._conn.execute(sql, row)
+            except sqlite3.IntegrityError as exc:
+                raise ProposalExistsError(proposal.id) from exc
+            cur = self._conn.execute(
+                "INSERT INTO proposal_events"
+                " (proposal_id, action, actor, comment, from_status, to_status, at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    transition.proposal_id,
+                    transition.action,
+                    transition.actor,
+                    transition.comment,
+                    transition.from_status,
+                    transition.to_status,
+                    transition.at.isoformat(),
+                ),
+            )
+            transition.seq = cur.lastrowid or 0
+
+    def query(
+        self,
+        *,
+        graph_id: str | None = None,
+        status: str | None = None,
+        author: str | None = None,
+        updated_after: datetime | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> ProposalPage:
+        clauses: list[str] = []
+        params: list[object] = []
+        for column, value in (("graph_id", graph_id), ("status", status), ("author", author)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if updated_after is not None:
+            clauses.append("updated_us > ?")
+            params.append(to_micros(updated_after))
+        if cursor is not None:
+            clauses.append("(updated_us, id) < (?, ?)")
+            params.extend(_parse_cursor(cursor))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._conn.execute(
+            f"SELECT data FROM proposals {where} ORDER BY updated_us DESC, id DESC LIMIT ?",
+            (*params, limit + 1),
+        ).fetchall()
+        items = [Proposal.model_validate_json(r[0]) for r in rows[:limit]]
+        next_cursor = _cursor(items[-1]) if len(rows) > limit else None
+        return ProposalPage(items=items, next_cursor=next_cursor)
+
+    def history(self, proposal_id: str, *, after_seq: int = 0) -> Iterator[ProposalTransition]:
+        # Fetched in fixed-size batches so long histories are never held in memory.
+        while True:
+            rows = self._conn.execute(
+                "SELECT seq, proposal_id, action, actor, comment, from_status, to_status, at"
+                " FROM proposal_events WHERE proposal_id = ? AND seq > ?"
+                " ORDER BY seq LIMIT ?",
+                (proposal_id, after_seq, self.history_batch_size),
+            ).fetchall()
+            for row in rows:
+                yield ProposalTransition(
+                    seq=row[0],
+                    proposal_id=row[1],
+                    action=row[2],
+                    actor=row[3],
+                    comment=row[4],
+                    from_status=row[5],
+                    to_status=row[6],
+                    at=datetime.fromisoformat(row[7]),
+                )
+            if len(rows) < self.history_batch_size:
+                return
+            after_seq = rows[-1][0]
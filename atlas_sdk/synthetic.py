@@ -0,0 +1,562 @@
+"""Seeded synthetic CI/CD estates for load and performance testing.
+
+``EstateGenerator`` produces project graphs shaped like real Jenkins,
+GitLab or GitHub Actions estates: repositories trigger pipelines that fan
+out into stages, jobs and steps; jobs run on runners, pull container
+images, consume secrets, produce and consume artifacts and deploy to
+environments; pipelines extend templates and import shared libraries.
+Images, secrets, environments and external services are drawn from
+estate-wide pools with skewed popularity, so the same resources show up
+across many projects and become ``CrossProjectEdge`` links.
+
+Projects are generated one at a time from a per-project seed, so
+``iter_projects`` and ``iter_events`` stream arbitrarily large estates
+while holding a single project in memory, and project ``n`` is identical
+no matter how many projects are requested.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+from collections.abc import Iterator
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, Field
+
+from atlas_sdk.enums import ArtifactType, DocType, EdgeType, Platform, Severity
+from atlas_sdk.events import BaseEvent, FindingsEvent, ParseResultEvent, ScanResultEvent
+from atlas_sdk.models.edges import Edge
+from atlas_sdk.models.findings import Evidence, Finding
+from atlas_sdk.models.graph import CICDGraph, CrossProjectEdge, MultiProjectGraph
+from atlas_sdk.models.nodes import (
+    ArtifactNode,
+    ContainerImageNode,
+    DocFileNode,
+    EnvironmentNode,
+    ExternalServiceNode,
+    JobNode,
+    Node,
+    PipelineNode,
+    RepositoryNode,
+    RunnerNode,
+    SecretRefNode,
+    StageNode,
+    StepNode,
+)
+
+Range = tuple[int, int]
+_N = TypeVar("_N", bound=Node)
+
+_CONFIG_PATHS: dict[Platform, str] = {
+    Platform.JENKINS: "Jenkinsfile",
+    Platform.GITLAB: ".gitlab-ci.yml",
+    Platform.GITHUB_ACTIONS: ".github/workflows/{name}.yml",
+    Platform.AZURE_DEVOPS: "azure-pipelines.yml",
+    Platform.BITBUCKET: "bitbucket-pipelines.yml",
+}
+_STAGE_NAMES = ["checkout", "lint", "build", "test", "package", "scan", "publish", "deploy"]
+_IMAGES = ["python", "node", "golang", "maven", "gradle", "alpine", "ubuntu", "docker", "rust"]
+_REGISTRIES = ["docker.io", "ghcr.io", "registry.gitlab.com", "quay.io", "123.dkr.ecr.aws"]
+_COMMANDS = ["make build", "npm ci", "pytest -q", "mvn -B verify", "docker build .", "helm upgrade"]
+_SERVICES = ["sonarqube", "artifactory", "vault", "slack", "jira", "snyk", "datadog", "nexus"]
+
+
+class EstateProfile(BaseModel):
+    """Size and shape distributions for one CI/CD platform.
+
+    Ranges are inclusive ``(min, max)`` bounds drawn uniformly; ``*_rate``
+    fields are per-candidate probabilities.
+    """
+
+    platform: Platform = Platform.GITLAB
+    pipelines_per_project: Range = (1, 3)
+    stages_per_pipeline: Range = (2, 6)
+    jobs_per_stage: Range = (1, 4)
+    steps_per_job: Range = (2, 6)
+    runners_per_project: Range = (1, 3)
+    docs_per_project: Range = (1, 4)
+    image_pool: int = 40
+    secret_pool: int = 80
+    service_pool: int = 16
+    environments: list[str] = Field(default_factory=lambda: ["dev", "staging", "prod"])
+    secret_rate: float = 0.35
+    artifact_rate: float = 0.4
+    deploy_rate: float = 0.15
+    needs_rate: float = 0.25
+    template_rate: float = 0.3
+    import_rate: float = 0.3
+    trigger_rate: float = 0.1
+    pinned_rate: float = 0.4
+    timeout_rate: float = 0.6
+    metadata_bytes: int = 160
+    config_line_bytes: int = 40
+    log_lines_per_job: int = 20
+
+
+PROFILES: dict[Platform, EstateProfile] = {
+    Platform.JENKINS: EstateProfile(
+        platform=Platform.JENKINS,
+        pipelines_per_project=(1, 2),
+        stages_per_pipeline=(3, 8),
+        jobs_per_stage=(1, 2),
+        steps_per_job=(3, 10),
+        template_rate=0.6,
+        import_rate=0.7,
+        pinned_rate=0.2,
+    ),
+    Platform.GITLAB: EstateProfile(platform=Platform.GITLAB),
+    Platform.GITHUB_ACTIONS: EstateProfile(
+        platform=Platform.GITHUB_ACTIONS,
+        pipelines_per_project=(2, 6),
+        stages_per_pipeline=(1, 3),
+        jobs_per_stage=(1, 5),
+        steps_per_job=(3, 12),
+        needs_rate=0.4,
+        pinned_rate=0.5,
+    ),
+}
+
+
+def _weighted_index(rng: random.Random, size: int) -> int:
+    """Skewed pick from ``range(size)``: low indexes are much more popular."""
+    return min(int(rng.paretovariate(1.2)) - 1, size - 1)
+
+
+def _metadata(rng: random.Random, mean_bytes: int) -> dict[str, Any]:
+    target = int(rng.expovariate(1 / mean_bytes)) if mean_bytes > 0 else 0
+    env: dict[str, str] = {}
+    size = 0
+    while size < target:
+        key = f"VAR_{len(env)}"
+        value = f"{rng.getrandbits(64):016x}"
+        env[key] = value
+        size += len(key) + len(value) + 6
+    return {"env": env} if env else {}
+
+
+class SyntheticProject(BaseModel):
+    """One generated project and its links to previously generated projects."""
+
+    graph: CICDGraph
+    cross_edges: list[CrossProjectEdge] = Field(default_factory=list)
+
+
+class EstateGenerator:
+    """Lazily generates a reproducible multi-project CI/CD estate.
+
+    Args:
+        profile: Shape distributions; defaults to ``PROFILES[Platform.GITLAB]``.
+        seed: Estate seed; the same seed always yields the same estate.
+        projects: Number of projects, unless ``target_nodes`` is reached first.
+        target_nodes: Stop once at least this many nodes were generated.
+    """
+
+    def __init__(
+        self,
+        profile: EstateProfile | None = None,
+        *,
+        seed: int = 0,
+        projects: int | None = 10,
+        target_nodes: int | None = None,
+    ) -> None:
+        if projects is None and target_nodes is None:
+            raise ValueError("set projects, target_nodes or both")
+        self.profile = profile or PROFILES[Platform.GITLAB]
+        self.seed = seed
+        self.projects = projects
+        self.target_nodes = target_nodes
+
+    # ── Graphs ────────────────────────────────────────────────────────
+
+    def project(self, index: int) -> CICDGraph:
+        """Generate project ``index`` (independent of every other project)."""
+        return _ProjectBuilder(self.profile, self.seed, index).build()
+
+    def iter_projects(self) -> Iterator[SyntheticProject]:
+        """Yield projects one by one with cross-project edges to earlier ones.
+
+        Only the first owner of each shared resource is remembered, so
+        memory stays proportional to the resource pools, not the estate.
+        """
+        owners: dict[str, tuple[str, str]] = {}
+        pipelines: list[tuple[str, str]] = []
+        rng = random.Random(f"{self.seed}:links")
+        generated = 0
+        for index in self._indexes():
+            graph = self.project(index)
+            cross_edges = []
+            for node in graph.nodes:
+                shared_key = node.metadata.get("shared_key")
+                if shared_key is None:
+                    continue
+                owner = owners.setdefault(shared_key, (graph.id, node.id))
+                if owner[0] != graph.id:
+                    cross_edges.append(
+                        self._cross_edge(graph.id, node, owner, node.metadata["link_type"])
+                    )
+            entry = next(n for n in graph.nodes if n.node_type == "pipeline")
+            if pipelines and rng.random() < self.profile.trigger_rate:
+                target = pipelines[_weighted_index(rng, len(pipelines))]
+                cross_edges.append(
+                    CrossProjectEdge(
+                        id=f"{graph.id}/x/trigger",
+                        source_graph_id=graph.id,
+                        source_node_id=entry.id,
+                        target_graph_id=target[0],
+                        target_node_id=target[1],
+                        link_type="cross_trigger",
+                    )
+                )
+            if len(pipelines) < 1024:
+                pipelines.append((graph.id, entry.id))
+            yield SyntheticProject(graph=graph, cross_edges=cross_edges)
+            generated += len(graph.nodes)
+            if self.target_nodes is not None and generated >= self.target_nodes:
+                return
+
+    def iter_graphs(self) -> Iterator[CICDGraph]:
+        for project in self.iter_projects():
+            yield project.graph
+
+    def multi_project_graph(self, name: str = "Synthetic Estate") -> MultiProjectGraph:
+        """Materialize the whole estate (for sizes that fit in memory)."""
+        estate = MultiProjectGraph(id=f"estate-{self.seed}", name=name)
+        for project in self.iter_projects():
+            estate.add_graph(project.graph)
+            for edge in project.cross_edges:
+                estate.add_cross_edge(edge)
+        return estate
+
+    def _indexes(self) -> Iterator[int]:
+        index = 0
+        while self.projects is None or index < self.projects:
+            yield index
+            index += 1
+
+    @staticmethod
+    def _cross_edge(
+        graph_id: str, node: Node, owner: tuple[str, str], link_type: str
+    ) -> CrossProjectEdge:
+        return CrossProjectEdge(
+            id=f"{graph_id}/x/{node.id}",
+            source_graph_id=graph_id,
+            source_node_id=node.id,
+            target_graph_id=owner[0],
+            target_node_id=owner[1],
+            link_type=link_type,
+            confidence=0.9,
+        )
+
+    # ── Event streams ─────────────────────────────────────────────────
+
+    def iter_events(self, scan_request_id: str | None = None) -> Iterator[BaseEvent]:
+        """Per project: ``ScanResultEvent``, ``ParseResultEvent``, ``FindingsEvent``."""
+        for graph in self.iter_graphs():
+            request_id = scan_request_id or f"scan-{graph.id}"
+            yield scan_result_event(graph, request_id, self.profile)
+            yield parse_result_event(graph, request_id)
+            yield findings_event(graph, request_id)
+
+
+class _ProjectBuilder:
+    """Builds one project graph with deterministic IDs."""
+
+    def __init__(self, profile: EstateProfile, seed: int, index: int) -> None:
+        self.profile = profile
+        self.rng = random.Random(f"{seed}:{index}")
+        self.graph = CICDGraph(
+            id=f"project-{index}",
+            name=f"project-{index}",
+            platform=profile.platform,
+            metadata={"synthetic_seed": seed},
+        )
+        self._shared: dict[str, Node] = {}
+
+    def build(self) -> CICDGraph:
+        p, rng, gid = self.profile, self.rng, self.graph.id
+        repo = self._add(
+            RepositoryNode(
+                id=f"{gid}/repo",
+                name=gid,
+                url=f"https://git.example.com/org/{gid}.git",
+                default_branch="main",
+            )
+        )
+        for d in range(rng.randint(*p.docs_per_project)):
+            doc_type = rng.choice(list(DocType))
+            doc = self._add(
+                DocFileNode(
+                    id=f"{gid}/doc/{d}", name=doc_type.value, path=f"docs/{d}.md", doc_type=doc_type
+                )
+            )
+            self._link(repo, doc, EdgeType.INCLUDES)
+        runners = [
+            self._add(
+                RunnerNode(
+                    id=f"{gid}/runner/{r}",
+                    name=f"runner-{r}",
+                    labels=rng.sample(["linux", "docker", "arm64", "gpu", "large"], 2),
+                    executor_type=rng.choice(["docker", "shell", "kubernetes"]),
+                )
+            )
+            for r in range(rng.randint(*p.runners_per_project))
+        ]
+
+        pipelines: list[PipelineNode] = []
+        for n in range(rng.randint(*p.pipelines_per_project)):
+            pipeline = self._pipeline(n, runners)
+            self._link(repo, pipeline, EdgeType.TRIGGERS)
+            if pipelines and rng.random() < p.template_rate:
+                self._link(pipeline, pipelines[0], EdgeType.EXTENDS)
+            if pipelines and rng.random() < p.trigger_rate:
+                self._link(rng.choice(pipelines), pipeline, EdgeType.TRIGGERS)
+            pipelines.append(pipeline)
+        return self.graph
+
+    def _pipeline(self, n: int, runners: list[RunnerNode]) -> PipelineNode:
+        p, rng, gid = self.profile, self.rng, self.graph.id
+        name = f"pipeline-{n}"
+        path = _CONFIG_PATHS[p.platform].format(name=name)
+        if "{" not in _CONFIG_PATHS[p.platform] and n:
+            path = f"ci/{name}/{path}"
+        pipeline = self._add(
+            PipelineNode(
+                id=f"{gid}/{name}",
+                name=name,
+                path=path,
+                branch="main",
+                trigger_type=rng.choice(["push", "merge_request", "schedule", "manual"]),
+                metadata=_metadata(rng, p.metadata_bytes),
+            )
+        )
+        if rng.random() < p.import_rate:
+            self._link(pipeline, self._shared_node("service"), EdgeType.IMPORTS)
+
+        produced: list[ArtifactNode] = []
+        previous_jobs: list[JobNode] = []
+        for s in range(rng.randint(*p.stages_per_pipeline)):
+            stage = self._add(
+                StageNode(
+                    id=f"{pipeline.id}/s{s}",
+                    name=_STAGE_NAMES[s % len(_STAGE_NAMES)],
+                    order=s,
+                    parallel=rng.random() < 0.3,
+                )
+            )
+            self._link(pipeline, stage, EdgeType.CALLS)
+            jobs = []
+            for j in range(rng.randint(*p.jobs_per_stage)):
+                job = self._job(stage, j, path, runners, produced, previous_jobs)
+                jobs.append(job)
+            previous_jobs = jobs
+        return pipeline
+
+    def _job(
+        self,
+        stage: StageNode,
+        j: int,
+        config_path: str,
+        runners: list[RunnerNode],
+        produced: list[ArtifactNode],
+        previous_jobs: list[JobNode],
+    ) -> JobNode:
+        p, rng = self.profile, self.rng
+        job = self._add(
+            JobNode(
+                id=f"{stage.id}/j{j}",
+                name=f"{stage.name}-{j}",
+                timeout_minutes=rng.choice([15, 30, 60]) if rng.random() < p.timeout_rate else None,
+                metadata={"config_path": config_path, **_metadata(rng, p.metadata_bytes)},
+            )
+        )
+        self._link(stage, job, EdgeType.CALLS)
+        self._link(job, rng.choice(runners), EdgeType.DEPENDS_ON)
+        self._link(job, self._shared_node("image"), EdgeType.DEPENDS_ON)
+        if previous_jobs and rng.random() < p.needs_rate:
+            self._link(job, rng.choice(previous_jobs), EdgeType.DEPENDS_ON)
+        if rng.random() < p.secret_rate:
+            self._link(job, self._shared_node("secret"), EdgeType.CONSUMES)
+        if produced and rng.random() < p.artifact_rate:
+            self._link(job, rng.choice(produced), EdgeType.CONSUMES)
+        if rng.random() < p.artifact_rate:
+            artifact_type = rng.choice(list(ArtifactType))
+            artifact = self._add(
+                ArtifactNode(
+                    id=f"{job.id}/artifact",
+                    name=f"{job.name}.{artifact_type.value}",
+                    path=f"dist/{job.name}",
+                    artifact_type=artifact_type,
+                )
+            )
+            self._link(job, artifact, EdgeType.PRODUCES)
+            produced.append(artifact)
+        if stage.name == "deploy" or rng.random() < p.deploy_rate:
+            self._link(job, self._shared_node("environment"), EdgeType.DEPLOYS_TO)
+        for k in range(rng.randint(*p.steps_per_job)):
+            step = self._add(
+                StepNode(
+                    id=f"{job.id}/k{k}",
+                    name=f"step-{k}",
+                    command=rng.choice(_COMMANDS),
+                    shell="bash",
+                )
+            )
+            self._link(job, step, EdgeType.CALLS)
+        return job
+
+    def _shared_node(self, kind: str) -> Node:
+        """Project-local node for an estate-wide resource, picked by popularity."""
+        p, rng, gid = self.profile, self.rng, self.graph.id
+        if kind == "environment":
+            key = p.environments[_weighted_index(rng, len(p.environments))]
+        else:
+            pool = {"image": p.image_pool, "secret": p.secret_pool, "service": p.service_pool}[kind]
+            key = str(_weighted_index(rng, pool))
+        shared_key = f"{kind}:{key}"
+        node = self._shared.get(shared_key)
+        if node is not None:
+            return node
+
+        n = int(key) if key.isdigit() else 0
+        node_id = f"{gid}/{kind}/{key}"
+        if kind == "image":
+            pinned = rng.random() < p.pinned_rate
+            node = ContainerImageNode(
+                id=node_id,
+                name=f"{_IMAGES[n % len(_IMAGES)]}-{n}",
+                registry=_REGISTRIES[n % len(_REGISTRIES)],
+                tag=f"{n % 5}.{n % 13}",
+                pinned=pinned,
+                digest=f"sha256:{hashlib.sha256(node_id.encode()).hexdigest()}" if pinned else None,
+            )
+            link_type = "shared_artifact"
+        elif kind == "secret":
+            node = SecretRefNode(
+                id=node_id, name=f"SECRET_{n}", key=f"SECRET_{n}", scope=rng.choice(["org", "repo"])
+            )
+            link_type = "shared_secret"
+        elif kind == "environment":
+            node = EnvironmentNode(
+                id=node_id,
+                name=key,
+                url=f"https://{key}.example.com",
+                protection_level="required_reviewers" if key == "prod" else None,
+            )
+            link_type = "shared_env"
+        else:
+            service = _SERVICES[n % len(_SERVICES)]
+            node = ExternalServiceNode(
+                id=node_id,
+                name=f"{service}-{n}",
+                url=f"https://{service}.example.com",
+                service_type=service,
+            )
+            link_type = "shared_artifact"
+        node.metadata.update(shared_key=shared_key, link_type=link_type)
+        self._shared[shared_key] = self._add(node)
+        return node
+
+    def _add(self, node: _N) -> _N:
+        node.platform = self.profile.platform
+        self.graph.add_node(node)
+        return node
+
+    def _link(self, source: Node, target: Node, edge_type: EdgeType) -> None:
+        self.graph.add_edge(
+            Edge(
+                id=f"{self.graph.id}/e{len(self.graph.edges)}",
+                edge_type=edge_type,
+                source_node_id=source.id,
+                target_node_id=target.id,
+            )
+        )
+
+
+# ── Event builders ────────────────────────────────────────────────────
+
+
+def scan_result_event(
+    graph: CICDGraph, scan_request_id: str, profile: EstateProfile | None = None
+) -> ScanResultEvent:
+    """Raw configs and build logs a scanner would have fetched for ``graph``."""
+    profile = profile or PROFILES.get(graph.platform or Platform.GITLAB, PROFILES[Platform.GITLAB])
+    rng = random.Random(f"{graph.id}:scan")
+    configs: dict[str, list[str]] = {}
+    logs = []
+    for node in graph.nodes:
+        if not isinstance(node, JobNode):
+            continue
+        path = node.metadata.get("config_path", "ci.yml")
+        lines = configs.setdefault(path, [])
+        lines.append(f"{node.name}:")
+        lines.append(f"  timeout: {node.timeout_minutes}" if node.timeout_minutes else "  script:")
+        pad = "x" * max(profile.config_line_bytes - 12, 0)
+        lines.extend(f"    - {rng.choice(_COMMANDS)} # {pad}" for _ in range(3))
+        log_lines = [
+            rng.choice(
+                [
+                    f"[{i:04d}] Step ok",
+                    f"[{i:04d}] cache hit for key deps-{i % 7}",
+                    f"[{i:04d}] docker pull {rng.choice(_IMAGES)}:latest",
+                    f"[{i:04d}] finished in {rng.randint(1, 600)}s",
+                    f"[{i:04d}] ERROR: connection reset, retrying",
+                ]
+            )
+            for i in range(profile.log_lines_per_job)
+        ]
+        logs.append({"job": node.id, "log": "\n".join(log_lines)})
+    return ScanResultEvent(
+        event_id=f"{scan_request_id}/{graph.id}/scan",
+        scan_request_id=scan_request_id,
+        platform=graph.platform or profile.platform,
+        pipeline_configs=[{"path": p, "content": "\n".join(c)} for p, c in configs.items()],
+        build_logs=logs,
+    )
+
+
+def parse_result_event(graph: CICDGraph, scan_request_id: str) -> ParseResultEvent:
+    """The parser's output for ``graph``."""
+    return ParseResultEvent(
+        event_id=f"{scan_request_id}/{graph.id}/parse",
+        scan_request_id=scan_request_id,
+        nodes=[n.model_dump(mode="json") for n in graph.nodes],
+        edges=[e.model_dump(mode="json") for e in graph.edges],
+    )
+
+
+def synthetic_findings(graph: CICDGraph) -> list[Finding]:
+    """Findings a rule engine would plausibly raise on ``graph``."""
+    findings = []
+    for node in graph.nodes:
+        if isinstance(node, JobNode) and node.timeout_minutes is None:
+            rule = ("job-no-timeout", "Job has no timeout", Severity.MEDIUM)
+        elif isinstance(node, ContainerImageNode) and not node.pinned:
+            rule = ("unpinned-image", "Container image is not pinned", Severity.HIGH)
+        elif isinstance(node, EnvironmentNode) and node.protection_level is None:
+            rule = ("unprotected-environment", "Environment has no protection", Severity.LOW)
+        else:
+            continue
+        rule_id, title, severity = rule
+        findings.append(
+            Finding(
+                id=f"{node.id}/{rule_id}",
+                rule_id=rule_id,
+                title=title,
+                description=f"{title}: {node.name}",
+                severity=severity,
+                evidence=[Evidence(node_id=node.id, source_file=node.metadata.get("config_path"))],
+                affected_node_ids=[node.id],
+            )
+        )
+    return findings
+
+
+def findings_event(graph: CICDGraph, scan_request_id: str) -> FindingsEvent:
+    """``synthetic_findings`` for ``graph`` as a ``FindingsEvent``."""
+    return FindingsEvent(
+        event_id=f"{scan_request_id}/{graph.id}/findings",
+        scan_request_id=scan_request_id,
+        graph_id=graph.id,
+        findings=[f.model_dump(mode="json") for f in synthetic_findings(graph)],
+    )
@@ -0,0 +1,225 @@
+"""Trace context for events flowing through the atlas-* pipeline.
+
+A scan travels scanner → parser → graph → rule-engine → report as a chain
+of events. Each event carries a ``TraceContext``: the scan's ``trace_id``
+plus the ``Hop`` list of every event in its ancestry, ending with its own
+hop. A hop records which service produced the event and when it was
+enqueued, and which service consumed it and when it was dequeued.
+
+``BaseEvent.start_trace`` / ``mark_enqueued`` / ``mark_dequeued`` /
+``derive`` maintain the context, and ``analyze_traces`` turns any set of
+events into per-stage queueing (enqueue → dequeue) and processing
+(dequeue → first child enqueued) latency breakdowns.
+
+This module does not import ``atlas_sdk.events``; events import it.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Any, Protocol
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def new_trace_id() -> str:
+    return uuid4().hex
+
+
+def new_span_id() -> str:
+    return uuid4().hex[:16]
+
+
+class Hop(BaseModel):
+    """One event's trip through a stream: producer → queue → consumer."""
+
+    span_id: str = Field(default_factory=new_span_id)
+    parent_span_id: str | None = None
+    event_type: str = ""
+    producer: str = ""
+    consumer: str = ""
+    enqueued_at: datetime | None = None
+    dequeued_at: datetime | None = None
+
+    @property
+    def queue_seconds(self) -> float | None:
+        if self.enqueued_at is None or self.dequeued_at is None:
+            return None
+        return (self.dequeued_at - self.enqueued_at).total_seconds()
+
+
+class TraceContext(BaseModel):
+    """Trace id plus the hops from the root event down to this one (last)."""
+
+    trace_id: str = Field(default_factory=new_trace_id)
+    hops: list[Hop] = Field(default_factory=list)
+
+    @property
+    def current(self) -> Hop:
+        return self.hops[-1]
+
+    @property
+    def span_id(self) -> str:
+        return self.current.span_id
+
+    @property
+    def parent_span_id(self) -> str | None:
+        return self.current.parent_span_id
+
+    def child(self, event_type: str, producer: str) -> TraceContext:
+        """Context for an event emitted by ``producer`` while handling this one."""
+        hop = Hop(parent_span_id=self.span_id, event_type=event_type, producer=producer)
+        return TraceContext(
+            trace_id=self.trace_id,
+            hops=[h.model_copy() for h in self.hops] + [hop],
+        )
+
+
+class _Traced(Protocol):
+    trace: TraceContext | None
+
+
+# ── Latency analysis ──────────────────────────────────────────────────
+
+
+class StageLatency(BaseModel):
+    """Latency distribution for one consuming stage, in seconds."""
+
+    stage: str
+    queue_samples: int = 0
+    queue_p50: float = 0.0
+    queue_p95: float = 0.0
+    queue_max: float = 0.0
+    processing_samples: int = 0
+    processing_p50: float = 0.0
+    processing_p95: float = 0.0
+    processing_max: float = 0.0
+
+
+class TraceSummary(BaseModel):
+    """End-to-end timing of one trace."""
+
+    trace_id: str
+    hops: list[Hop] = Field(default_factory=list)
+    total_seconds: float = 0.0
+
+
+class LatencyReport(BaseModel):
+    """Per-stage latency breakdown over a set of traces."""
+
+    stages: list[StageLatency] = Field(default_factory=list)
+    traces: list[TraceSummary] = Field(default_factory=list)
+
+    def stage(self, name: str) -> StageLatency | None:
+        return next((s for s in self.stages if s.stage == name), None)
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(q * len(sorted_values)) - 1, 0)
+    return sorted_values[rank]
+
+
+def _merge(into: Hop, other: Hop) -> None:
+    # Copies of a hop travel with descendants; later copies may know more.
+    for name in ("event_type", "producer", "consumer", "enqueued_at", "dequeued_at"):
+        if not getattr(into, name) and getattr(other, name):
+            setattr(into, name, getattr(other, name))
+
+
+def analyze_traces(events: Iterable[_Traced]) -> LatencyReport:
+    """Per-stage queueing and processing latencies from traced events.
+
+    Hops are collected from every event's context and merged by span id,
+    so the last event of a trace is enough to reconstruct it. A stage's
+    queueing time is enqueue → dequeue of the events it consumes; its
+    processing time is dequeue → enqueue of the first event it emitted in
+    response. Untraced events and hops missing a timestamp are skipped.
+    """
+    traces: dict[str, dict[str, Hop]] = {}
+    for event in events:
+        context = event.trace
+        if context is None:
+            continue
+        spans = traces.setdefault(context.trace_id, {})
+        for hop in context.hops:
+            known = spans.get(hop.span_id)
+            if known is None:
+                spans[hop.span_id] = hop.model_copy()
+            else:
+                _merge(known, hop)
+
+    queue: dict[str, list[float]] = {}
+    processing: dict[str, list[float]] = {}
+    summaries = []
+    for trace_id, spans in traces.items():
+        first_child: dict[str, datetime] = {}
+        for hop in spans.values():
+            if hop.parent_span_id and hop.enqueued_at is not None:
+                seen = first_child.get(hop.parent_span_id)
+                if seen is None or hop.enqueued_at < seen:
+                    first_child[hop.parent_span_id] = hop.enqueued_at
+        for hop in spans.values():
+            stage = hop.consumer or "<unconsumed>"
+            if hop.queue_seconds is not None:
+                queue.setdefault(stage, []).append(hop.queue_seconds)
+            emitted = first_child.get(hop.span_id)
+            if emitted is not None and hop.dequeued_at is not None:
+                seconds = (emitted - hop.dequeued_at).total_seconds()
+                processing.setdefault(stage, []).append(seconds)
+
+        hops = sorted(spans.values(), key=lambda h: (h.enqueued_at is None, h.enqueued_at))
+        stamps = [t for h in hops for t in (h.enqueued_at, h.dequeued_at) if t is not None]
+        total = (max(stamps) - min(stamps)).total_seconds() if stamps else 0.0
+        summaries.append(TraceSummary(trace_id=trace_id, hops=hops, total_seconds=total))
+
+    stages = []
+    for name in sorted(set(queue) | set(processing)):
+        q = sorted(queue.get(name, []))
+        p = sorted(processing.get(name, []))
+        stages.append(
+            StageLatency(
+                stage=name,
+                queue_samples=len(q),
+                queue_p50=_percentile(q, 0.5),
+                queue_p95=_percentile(q, 0.95),
+                queue_max=q[-1] if q else 0.0,
+                processing_samples=len(p),
+                processing_p50=_percentile(p, 0.5),
+                processing_p95=_percentile(p, 0.95),
+                processing_max=p[-1] if p else 0.0,
+            )
+        )
+    summaries.sort(key=lambda s: -s.total_seconds)
+    return LatencyReport(stages=stages, traces=summaries)
+
+
+def _stamp(at: datetime | None) -> datetime:
+    return at if at is not None else _now()
+
+
+def mark_enqueued(event: Any, producer: str | None = None, at: datetime | None = None) -> None:
+    """Record that ``event`` was put on its stream (starts a trace if needed)."""
+    if event.trace is None:
+        event.trace = TraceContext(hops=[Hop(event_type=type(event).__name__)])
+    hop = event.trace.current
+    if producer is not None:
+        hop.producer = producer
+    hop.enqueued_at = _stamp(at)
+
+
+def mark_dequeued(event: Any, consumer: str, at: datetime | None = None) -> None:
+    """Record that ``consumer`` read ``event`` off its stream."""
+    if event.trace is None:
+        event.trace = TraceContext(hops=[Hop(event_type=type(event).__name__)])
+    hop = event.trace.current
+    hop.consumer = consumer
+    hop.dequeued_at = _stamp(at)
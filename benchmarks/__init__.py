@@ -0,0 +1,5 @@
+"""Offline performance benchmarks for atlas-sdk.
+
+Run individual benchmarks as modules from the repository root, e.g.
+``python -m benchmarks.bench_startup``.
+"""
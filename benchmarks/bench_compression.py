@@ -0,0 +1,111 @@
+"""Compression benchmark: graph snapshots and findings events.
+
+For each platform profile, trains a ``SnapshotCodec`` dictionary on the
+first ``--train`` synthetic projects (graphs plus their ``FindingsEvent``)
+and compresses the next ``--test`` projects with every method: plain JSON,
+gzip, and each available codec with and without the trained dictionary.
+Reports the compression ratio (JSON bytes / compressed bytes) and
+end-to-end throughput in MB of JSON per second: "compress" times model →
+stored bytes (``model_dump_json`` or the event wire encoding, then the
+codec) and "decompress" times stored bytes → validated model, so the
+``json`` row is the cost of plain JSON storage and every other row shows
+what compression adds on top of it.
+
+Usage:
+    python -m benchmarks.bench_compression [--train 20] [--test 20] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import time
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel
+
+from atlas_sdk.compression import ZSTD_AVAILABLE, SnapshotCodec, TrainedDictionary, train_dictionary
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.schema_registry import registry
+from atlas_sdk.synthetic import PROFILES, EstateGenerator, findings_event
+
+Method = tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]
+Serializer = tuple[Callable[[Any], bytes], Callable[[bytes], object]]
+CODECS = ("zlib", "zstd") if ZSTD_AVAILABLE else ("zlib",)
+
+
+def methods(dictionaries: list[TrainedDictionary]) -> dict[str, Method]:
+    def identity(data: bytes) -> bytes:
+        return data
+
+    table: dict[str, Method] = {
+        "json": (identity, identity),
+        "gzip": (lambda d: gzip.compress(d, compresslevel=6), gzip.decompress),
+    }
+    for codec in CODECS:
+        plain = SnapshotCodec(codec=codec)
+        table[codec] = (plain.compress, plain.decompress)
+        # Dictionaries are trained without a platform, so they apply to every payload.
+        trained = SnapshotCodec([d for d in dictionaries if d.codec == codec], codec=codec)
+        table[f"{codec}+dict"] = (trained.compress, trained.decompress)
+    return table
+
+
+def measure(
+    method: Method, serializer: Serializer, models: list[BaseModel], repeat: int
+) -> tuple[int, float, float]:
+    """(stored bytes, best compress seconds, best decompress seconds), end to end."""
+    compress, decompress = method
+    encode, decode = serializer
+    best_c = best_d = float("inf")
+    frames: list[bytes] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        frames = [compress(encode(m)) for m in models]
+        best_c = min(best_c, time.perf_counter() - start)
+        start = time.perf_counter()
+        for frame in frames:
+            decode(decompress(frame))
+        best_d = min(best_d, time.perf_counter() - start)
+    return sum(map(len, frames)), best_c, best_d
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--train", type=int, default=20)
+    parser.add_argument("--test", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'platform':<16} {'payload':<9} {'method':<10} {'bytes':>10} {'ratio':>7}"
+        f" {'comp MB/s':>10} {'decomp MB/s':>12}"
+    )
+    for platform, profile in PROFILES.items():
+        generator = EstateGenerator(profile, seed=1, projects=args.train + args.test)
+        graphs = list(generator.iter_graphs())
+        events = [findings_event(g, f"scan-{g.id}") for g in graphs]
+        samples = [*graphs[: args.train], *events[: args.train]]
+        dictionaries = [train_dictionary(samples, codec=codec) for codec in CODECS]
+
+        payloads: dict[str, tuple[list[BaseModel], Serializer]] = {
+            "graph": (graphs[args.train :], (_dump_json, CICDGraph.model_validate_json)),
+            "findings": (events[args.train :], (registry.encode, registry.decode)),
+        }
+        for kind, (models, serializer) in payloads.items():
+            raw = sum(len(serializer[0](m)) for m in models)
+            for name, method in methods(dictionaries).items():
+                size, comp, decomp = measure(method, serializer, models, args.repeat)
+                print(
+                    f"{platform:<16} {kind:<9} {name:<10} {size:>10} {raw / size:>7.2f}"
+                    f" {raw / comp / 1e6:>10.1f} {raw / decomp / 1e6:>12.1f}"
+                )
+
+
+def _dump_json(model: BaseModel) -> bytes:
+    return model.model_dump_json().encode()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Memory benchmark: large finding sets with shared ConfidenceScores.
+
+Compares the retained heap of N findings validated the normal way (which
+interns default confidence scores) with N findings that each carry their
+own ``ConfidenceScore`` instance, as every finding did before interning.
+
+Usage:
+    python -m benchmarks.bench_findings_memory [--count N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from atlas_sdk.confidence import ConfidenceScore
+from atlas_sdk.enums import ConfidenceLevel, Severity, SourceType
+from atlas_sdk.models.findings import Finding
+
+_LEVELS = [
+    (ConfidenceLevel.HIGH, SourceType.STATIC_RUNTIME),
+    (ConfidenceLevel.MEDIUM, SourceType.STATIC),
+    (ConfidenceLevel.LOW, SourceType.AI_INFERENCE),
+]
+
+
+def _payload(i: int) -> dict[str, Any]:
+    level, source = _LEVELS[i % len(_LEVELS)]
+    return {
+        "rule_id": f"rule-{i % 40}",
+        "title": "No timeout configured",
+        "description": "Pipeline has no timeout",
+        "severity": Severity.MEDIUM,
+        "confidence": {"level": level, "source": source},
+        "affected_node_ids": [f"node-{i}"],
+    }
+
+
+def shared(count: int) -> list[Finding]:
+    return [Finding.model_validate(_payload(i)) for i in range(count)]
+
+
+def unshared(count: int) -> list[Finding]:
+    findings = []
+    for i in range(count):
+        payload = _payload(i)
+        finding = Finding.model_validate(payload)
+        # Bypass interning: one private score per finding.
+        score = ConfidenceScore.model_construct(**payload["confidence"], reasoning=None)
+        object.__setattr__(finding, "confidence", score)
+        findings.append(finding)
+    return findings
+
+
+def measure(build: Callable[[int], list[Finding]], count: int) -> tuple[int, int]:
+    """Return (retained bytes, distinct confidence objects)."""
+    gc.collect()
+    tracemalloc.start()
+    findings = build(count)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained, len({id(f.confidence) for f in findings})
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    base_bytes, base_objs = measure(unshared, args.count)
+    shared_bytes, shared_objs = measure(shared, args.count)
+    for label, size, objs in (
+        ("per-finding scores", base_bytes, base_objs),
+        ("interned scores", shared_bytes, shared_objs),
+    ):
+        print(
+            f"{label:<20} {size / 2**20:9.1f} MiB   {size / args.count:7.1f} B/finding"
+            f"   {objs:>8} ConfidenceScore objects"
+        )
+    print(f"reduction            {(1 - shared_bytes / base_bytes) * 100:9.1f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Hot-path benchmark suite with stored baselines.
+
+Covers ``CICDGraph`` construction and JSON round-trip at several sizes,
+node/edge lookups (linear ``CICDGraph`` scans vs ``GraphIndex``), wire
+encode/decode of every ``BaseEvent`` subclass, bulk ``Finding`` creation
+and ``TrendReport.compute_trends``. Medians are compared against
+``benchmarks/baselines.json``; the stored numbers are machine-specific, so
+refresh them with ``--save`` on the machine you compare on.
+
+Usage:
+    python -m benchmarks.bench_hot_paths [--sizes 1000 10000] [-k graph] [--save]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+from atlas_sdk.enums import Platform
+from atlas_sdk.events import (
+    AITokenUsageEvent,
+    BaseEvent,
+    FindingsEvent,
+    LogAnalysisEvent,
+    ParseResultEvent,
+    ReportReadyEvent,
+    ScanRequestEvent,
+    ScanResultEvent,
+)
+from atlas_sdk.graph_index import GraphIndex
+from atlas_sdk.models.findings import Finding
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.models.scan_history import TrendReport
+from atlas_sdk.schema_registry import registry
+from benchmarks.generators import finding_payloads, make_graph, snapshots
+from benchmarks.harness import (
+    DEFAULT_TOLERANCE,
+    Result,
+    Suite,
+    compare,
+    format_seconds,
+    load_baselines,
+    save_baselines,
+)
+
+BASELINES = Path(__file__).with_name("baselines.json")
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+LOOKUPS = 100
+EVENT_BATCH = 200
+FINDINGS = 10_000
+
+
+def sample_events() -> dict[type[BaseEvent], BaseEvent]:
+    """One representative instance per event type, with realistic payload sizes."""
+    graph = make_graph(500)
+    findings = [Finding.model_validate(p).model_dump(mode="json") for p in finding_payloads(200)]
+    return {
+        ScanRequestEvent: ScanRequestEvent(
+            platform=Platform.GITLAB, target_url="https://gitlab.example.com/org/app"
+        ),
+        ScanResultEvent: ScanResultEvent(
+            scan_request_id="r1",
+            platform=Platform.GITLAB,
+            pipeline_configs=[
+                {"path": f"ci-{i}.yml", "content": "stages: [build]\n" * 20} for i in range(20)
+            ],
+            build_logs=[{"job": f"job-{i}", "log": "step ok\n" * 200} for i in range(10)],
+        ),
+        ParseResultEvent: ParseResultEvent(
+            scan_request_id="r1",
+            nodes=[n.model_dump(mode="json") for n in graph.nodes],
+            edges=[e.model_dump(mode="json") for e in graph.edges],
+        ),
+        FindingsEvent: FindingsEvent(scan_request_id="r1", graph_id=graph.id, findings=findings),
+        ReportReadyEvent: ReportReadyEvent(
+            scan_request_id="r1", graph_id=graph.id, report_id="rep"
+        ),
+        AITokenUsageEvent: AITokenUsageEvent(
+            tenant_id="t1", provider="anthropic", model="default", tokens_used=1234
+        ),
+        LogAnalysisEvent: LogAnalysisEvent(
+            scan_request_id="r1",
+            total_patterns=100,
+            errors=10,
+            patterns=[{"type": "error", "line": i, "match": "ERROR"} for i in range(100)],
+        ),
+    }
+
+
+def build_suite(sizes: tuple[int, ...] = DEFAULT_SIZES) -> Suite:
+    suite = Suite()
+
+    for size in sizes:
+        graph = make_graph(size)
+        raw = graph.model_dump_json()
+        repeat = 3 if size >= 100_000 else 5
+        suite.add(f"graph.build[{size}]", lambda size=size: make_graph(size), repeat=repeat)
+        suite.add(f"graph.dump_json[{size}]", graph.model_dump_json, repeat=repeat)
+        suite.add(
+            f"graph.validate_json[{size}]",
+            lambda raw=raw: CICDGraph.model_validate_json(raw),
+            repeat=repeat,
+        )
+
+        rng = random.Random(size)
+        node_ids = [rng.choice(graph.nodes).id for _ in range(LOOKUPS)]
+        suite.add(f"graph.get_node[{size}]x{LOOKUPS}", _each(graph.get_node, node_ids))
+        suite.add(f"graph.get_edges_from[{size}]x{LOOKUPS}", _each(graph.get_edges_from, node_ids))
+        index = GraphIndex(graph)
+        suite.add(f"graph_index.build[{size}]", lambda graph=graph: GraphIndex(graph))
+        suite.add(f"graph_index.get_node[{size}]x{LOOKUPS}", _each(index.get_node, node_ids))
+        suite.add(
+            f"graph_index.get_edges_from[{size}]x{LOOKUPS}", _each(index.get_edges_from, node_ids)
+        )
+
+    events = sample_events()
+    missing = set(BaseEvent.__subclasses__()) - set(events)
+    if missing:
+        raise RuntimeError(f"no benchmark sample for {sorted(c.__name__ for c in missing)}")
+    for event_type, event in events.items():
+        data = registry.encode(event)
+        name = event_type.__name__
+        suite.add(f"event.encode[{name}]x{EVENT_BATCH}", _times(registry.encode, event))
+        suite.add(f"event.decode[{name}]x{EVENT_BATCH}", _times(registry.decode, data))
+
+    payloads = finding_payloads(FINDINGS)
+    suite.add(
+        f"findings.validate[{FINDINGS}]",
+        lambda: [Finding.model_validate(p) for p in payloads],
+    )
+    report = TrendReport(graph_name="bench", snapshots=snapshots(1_000))
+    suite.add("trends.compute_trends[1000]x1000", _times(lambda: report.compute_trends(), n=1000))
+    return suite
+
+
+def _each(func: Callable[[str], object], args: list[str]) -> Callable[[], None]:
+    def run() -> None:
+        for arg in args:
+            func(arg)
+
+    return run
+
+
+def _times(func: Callable[..., object], *args: object, n: int = EVENT_BATCH) -> Callable[[], None]:
+    def run() -> None:
+        for _ in range(n):
+            func(*args)
+
+    return run
+
+
+def _report(result: Result) -> None:
+    print(f"  {result.name:<48} {format_seconds(result.median)}", file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("-k", dest="select", help="only run benchmarks whose name contains this")
+    parser.add_argument("--baselines", type=Path, default=BASELINES)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--save", action="store_true", help="store medians as the new baseline")
+    args = parser.parse_args(argv)
+
+    results = build_suite(tuple(args.sizes)).run(args.select, report=_report)
+    rows = compare(results, load_baselines(args.baselines), args.tolerance)
+    print(f"{'benchmark':<48} {'median':>11} {'baseline':>11}  status")
+    for name, median, baseline, status in rows:
+        stored = format_seconds(baseline) if baseline is not None else f"{'-':>11}"
+        print(f"{name:<48} {format_seconds(median)} {stored}  {status}")
+
+    if args.save:
+        save_baselines(args.baselines, results)
+        print(f"baselines written to {args.baselines}")
+        return 0
+    return 1 if any(status == "slower" for *_, status in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""Import-time benchmark for common atlas_sdk entry points.
+
+Each sample imports one entry point in a fresh interpreter, so the numbers
+reflect what a short-lived CLI job or serverless function pays on start.
+
+Usage:
+    python -m benchmarks.bench_import [--runs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+ENTRY_POINTS: dict[str, str] = {
+    "baseline (pydantic)": "import pydantic",
+    "atlas_sdk": "import atlas_sdk",
+    "atlas_sdk.enums": "import atlas_sdk.enums",
+    "ConfidenceScore": "from atlas_sdk import ConfidenceScore",
+    "Finding": "from atlas_sdk import Finding",
+    "CICDGraph": "from atlas_sdk import CICDGraph",
+    "all public names": "import atlas_sdk; [getattr(atlas_sdk, n) for n in atlas_sdk.__all__]",
+}
+
+_PROBE = "import time; t0 = time.perf_counter(); {code}; print(time.perf_counter() - t0)"
+
+
+def sample(code: str) -> float:
+    """Seconds spent executing ``code`` in a fresh interpreter."""
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(code=code)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(out)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    for label, code in ENTRY_POINTS.items():
+        values = [sample(code) * 1000 for _ in range(args.runs)]
+        print(f"{label:<22} median {statistics.median(values):8.2f} ms   min {min(values):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
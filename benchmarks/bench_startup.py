@@ -0,0 +1,56 @@
+"""Startup benchmark: ``import atlas_sdk`` plus adapter warmup.
+
+Each sample runs in a fresh interpreter so module and schema caches are
+cold, which is what a new pod or CLI invocation sees.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_PROBE = """
+import json, time
+t0 = time.perf_counter()
+import atlas_sdk
+t1 = time.perf_counter()
+from atlas_sdk import adapters
+t2 = time.perf_counter()
+adapters.warmup()
+t3 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "adapters_import": t2 - t1, "warmup": t3 - t2}))
+"""
+
+
+def sample() -> dict[str, float]:
+    """Measure one cold start in a subprocess (seconds)."""
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(out)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    samples = [sample() for _ in range(args.runs)]
+    for phase in ("import", "adapters_import", "warmup"):
+        values = [s[phase] * 1000 for s in samples]
+        print(
+            f"{phase:<16} median {statistics.median(values):8.2f} ms"
+            f"   min {min(values):8.2f} ms   max {max(values):8.2f} ms"
+        )
+    total = [sum(s.values()) * 1000 for s in samples]
+    print(f"{'total':<16} median {statistics.median(total):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Deterministic synthetic inputs for benchmarks.
+
+Graphs are shaped like real estates: pipelines fan out to stages, stages
+to jobs, jobs to steps, with a sprinkling of images, secrets and
+environments. The same ``seed`` always yields the same structure.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from atlas_sdk.enums import EdgeType, Platform, Severity
+from atlas_sdk.models.edges import Edge
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.models.nodes import (
+    ContainerImageNode,
+    EnvironmentNode,
+    JobNode,
+    Node,
+    PipelineNode,
+    SecretRefNode,
+    StageNode,
+    StepNode,
+)
+from atlas_sdk.models.scan_history import ScanSnapshot
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def make_graph(node_count: int, *, seed: int = 0) -> CICDGraph:
+    """A graph with roughly ``node_count`` nodes and as many edges."""
+    rng = random.Random(seed)
+    graph = CICDGraph(id=f"bench-{node_count}-{seed}", name=f"bench-{node_count}")
+    shared: list[Node] = [
+        ContainerImageNode(id=f"image-{i}", name=f"python:3.{i}", tag=f"3.{i}") for i in range(8)
+    ]
+    shared += [
+        SecretRefNode(id=f"secret-{i}", name=f"TOKEN_{i}", key=f"TOKEN_{i}") for i in range(8)
+    ]
+    shared += [EnvironmentNode(id=f"env-{name}", name=name) for name in ("dev", "staging", "prod")]
+    for node in shared:
+        graph.add_node(node)
+
+    def link(source: str, target: str, edge_type: EdgeType) -> None:
+        edge_id = f"e{len(graph.edges)}"
+        graph.add_edge(
+            Edge(id=edge_id, edge_type=edge_type, source_node_id=source, target_node_id=target)
+        )
+
+    p = 0
+    while len(graph.nodes) < node_count:
+        pipeline = PipelineNode(id=f"p{p}", name=f"pipeline-{p}", platform=Platform.GITHUB_ACTIONS)
+        graph.add_node(pipeline)
+        for s in range(rng.randint(2, 4)):
+            stage = StageNode(id=f"p{p}s{s}", name=f"stage-{s}", order=s)
+            graph.add_node(stage)
+            link(pipeline.id, stage.id, EdgeType.CALLS)
+            for j in range(rng.randint(1, 3)):
+                job = JobNode(
+                    id=f"{stage.id}j{j}", name=f"job-{j}", timeout_minutes=rng.choice([None, 30])
+                )
+                graph.add_node(job)
+                link(stage.id, job.id, EdgeType.CALLS)
+                link(job.id, rng.choice(shared[:8]).id, EdgeType.DEPENDS_ON)
+                if rng.random() < 0.3:
+                    link(job.id, rng.choice(shared[8:16]).id, EdgeType.CONSUMES)
+                if rng.random() < 0.1:
+                    link(job.id, rng.choice(shared[16:]).id, EdgeType.DEPLOYS_TO)
+                for k in range(rng.randint(1, 4)):
+                    step = StepNode(id=f"{job.id}k{k}", name=f"step-{k}", command="make test")
+                    graph.add_node(step)
+                    link(job.id, step.id, EdgeType.CALLS)
+        p += 1
+    return graph
+
+
+def finding_payloads(count: int, node_ids: list[str] | None = None) -> list[dict[str, Any]]:
+    """Validated-ready ``Finding`` payloads, as a rule engine would emit them."""
+    severities = list(Severity)
+    return [
+        {
+            "rule_id": f"rule-{i % 40}",
+            "title": "Job has no timeout",
+            "description": "Jobs without a timeout can hang runners indefinitely.",
+            "severity": severities[i % len(severities)],
+            "evidence": [
+                {"source_file": f".github/workflows/ci-{i % 50}.yml", "line_number": i % 200}
+            ],
+            "affected_node_ids": [node_ids[i % len(node_ids)] if node_ids else f"node-{i}"],
+        }
+        for i in range(count)
+    ]
+
+
+def snapshots(count: int, *, graph_name: str = "bench") -> list[ScanSnapshot]:
+    rng = random.Random(count)
+    return [
+        ScanSnapshot(
+            graph_name=graph_name,
+            complexity_score=rng.uniform(0, 100),
+            fragility_score=rng.uniform(0, 100),
+            maturity_score=rng.uniform(0, 100),
+            finding_count=rng.randint(0, 200),
+            scanned_at=T0 + timedelta(hours=i),
+        )
+        for i in range(count)
+    ]
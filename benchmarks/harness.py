@@ -0,0 +1,131 @@
+"""Minimal offline timing harness with stored baselines.
+
+Benchmarks are plain callables registered in a ``Suite``. Each one is run
+``repeat`` times after one warmup call and reported by its median. Results
+are compared against a JSON baseline file (benchmark name → median
+seconds); a benchmark slower than baseline by more than ``tolerance`` is
+flagged as a regression.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+DEFAULT_TOLERANCE = 0.25
+
+
+@dataclass(slots=True)
+class Benchmark:
+    name: str
+    func: Callable[[], object]
+    setup: Callable[[], object] | None = None
+    repeat: int = 5
+
+
+@dataclass(slots=True)
+class Result:
+    name: str
+    samples: list[float] = field(default_factory=list)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def best(self) -> float:
+        return min(self.samples)
+
+
+class Suite:
+    """An ordered collection of named benchmarks."""
+
+    def __init__(self) -> None:
+        self.benchmarks: list[Benchmark] = []
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[], object],
+        *,
+        setup: Callable[[], object] | None = None,
+        repeat: int = 5,
+    ) -> None:
+        self.benchmarks.append(Benchmark(name, func, setup, repeat))
+
+    def run(
+        self, select: str | None = None, *, report: Callable[[Result], None] | None = None
+    ) -> list[Result]:
+        """Run benchmarks whose name contains ``select`` (all by default)."""
+        results = []
+        for bench in self.benchmarks:
+            if select and select not in bench.name:
+                continue
+            result = run_benchmark(bench)
+            if report is not None:
+                report(result)
+            results.append(result)
+        return results
+
+
+def run_benchmark(bench: Benchmark) -> Result:
+    """Time ``bench.func``; ``setup`` runs before every sample, untimed."""
+    result = Result(bench.name)
+    for i in range(bench.repeat + 1):
+        if bench.setup is not None:
+            bench.setup()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            bench.func()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        if i:  # first call is a warmup
+            result.samples.append(elapsed)
+    return result
+
+
+def load_baselines(path: Path) -> dict[str, float]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baselines(path: Path, results: list[Result], *, merge: bool = True) -> None:
+    """Write result medians to ``path``, keeping other stored entries if ``merge``."""
+    data = load_baselines(path) if merge else {}
+    data.update({r.name: round(r.median, 6) for r in results})
+    path.write_text(json.dumps(dict(sorted(data.items())), indent=2) + "\n")
+
+
+def compare(
+    results: list[Result], baselines: dict[str, float], tolerance: float = DEFAULT_TOLERANCE
+) -> list[tuple[str, float, float | None, str]]:
+    """(name, median, baseline, status) per result; status is ok/slower/faster/new."""
+    rows = []
+    for result in results:
+        baseline = baselines.get(result.name)
+        if baseline is None:
+            status = "new"
+        elif result.median > baseline * (1 + tolerance):
+            status = "slower"
+        elif result.median < baseline * (1 - tolerance):
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((result.name, result.median, baseline, status))
+    return rows
+
+
+def format_seconds(value: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if value >= scale:
+            return f"{value / scale:8.2f} {unit:<2}"
+    return f"{value / 1e-9:8.2f} ns"
@@ -0,0 +1,46 @@
+"""Tests for the shared TypeAdapters."""
+
+import subprocess
+import sys
+
+from atlas_sdk import JobNode, PipelineNode, ScanRequestEvent, adapters
+
+
+class TestAdapters:
+    def test_adapters_are_deferred_until_warmup(self):
+        probe = (
+            "from atlas_sdk import adapters\n"
+            "assert not any(a.pydantic_complete for a in adapters.ALL_ADAPTERS)\n"
+            "print(adapters.warmup())"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+        ).stdout
+        assert int(out) == len(adapters.ALL_ADAPTERS)
+
+    def test_warmup_builds_everything_once(self):
+        adapters.warmup()
+        assert all(a.pydantic_complete for a in adapters.ALL_ADAPTERS)
+        assert adapters.warmup() == 0
+
+    def test_typed_node_list_dispatches_on_node_type(self):
+        nodes = adapters.TYPED_NODE_LIST.validate_python(
+            [
+                {"node_type": "pipeline", "name": "build", "path": "Jenkinsfile"},
+                {"node_type": "job", "name": "deploy", "timeout_minutes": 30},
+            ]
+        )
+        assert isinstance(nodes[0], PipelineNode)
+        assert nodes[0].path == "Jenkinsfile"
+        assert isinstance(nodes[1], JobNode)
+        assert nodes[1].timeout_minutes == 30
+
+    def test_finding_list_json(self):
+        raw = b'[{"rule_id": "r", "title": "t", "description": "d", "severity": "high"}]'
+        findings = adapters.FINDING_LIST.validate_json(raw)
+        assert findings[0].rule_id == "r"
+
+    def test_event_union(self):
+        event = ScanRequestEvent(platform="jenkins", target_url="https://ci")
+        restored = adapters.EVENT.validate_json(event.model_dump_json())
+        assert isinstance(restored, ScanRequestEvent)
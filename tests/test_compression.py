@@ -0,0 +1,123 @@
+"""Tests for dictionary-compressed graph snapshots and events."""
+
+import io
+
+import pytest
+
+from atlas_sdk.compression import (
+    CompressionError,
+    SnapshotCodec,
+    TrainedDictionary,
+    train_dictionary,
+)
+from atlas_sdk.enums import Platform
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.synthetic import PROFILES, EstateGenerator, findings_event
+
+
+@pytest.fixture(scope="module")
+def graphs():
+    return list(EstateGenerator(PROFILES[Platform.GITLAB], seed=3, projects=8).iter_graphs())
+
+
+@pytest.fixture(scope="module")
+def codec(graphs):
+    codec = SnapshotCodec(codec="zlib")
+    codec.train(Platform.GITLAB, [*graphs[:6], *(findings_event(g, "s") for g in graphs[:6])])
+    return codec
+
+
+def _reloaded(graph):
+    return CICDGraph.model_validate_json(graph.model_dump_json())
+
+
+class TestTrainDictionary:
+    def test_zlib_dictionary_fits_window(self, graphs):
+        dictionary = train_dictionary(graphs, codec="zlib", size=1 << 20)
+        assert 0 < len(dictionary.data) <= 32 * 1024
+        assert b'"node_type":' in dictionary.data
+
+    def test_no_samples(self):
+        with pytest.raises(CompressionError):
+            train_dictionary([], codec="zlib")
+
+    def test_serialization_roundtrip(self, graphs):
+        dictionary = train_dictionary(graphs[:2], codec="zlib", platform=Platform.JENKINS)
+        restored = TrainedDictionary.from_bytes(dictionary.to_bytes())
+        assert restored == dictionary
+        assert restored.dict_id == dictionary.dict_id
+        with pytest.raises(CompressionError):
+            TrainedDictionary.from_bytes(b"garbage")
+
+
+class TestSnapshotCodec:
+    def test_graph_roundtrip(self, codec, graphs):
+        for graph in graphs[6:]:
+            assert codec.load_graph(codec.dump_graph(graph)) == _reloaded(graph)
+
+    def test_dictionary_shrinks_payloads(self, codec, graphs):
+        plain = SnapshotCodec(codec="zlib")
+        event = findings_event(graphs[7], "s")
+        assert len(codec.dump_graph(graphs[7])) < len(plain.dump_graph(graphs[7]))
+        assert len(codec.dump_event(event, Platform.GITLAB)) < len(plain.dump_event(event)) / 2
+
+    def test_event_roundtrip(self, codec, graphs):
+        event = findings_event(graphs[6], "s")
+        assert codec.load_event(codec.dump_event(event, Platform.GITLAB)) == event
+
+    def test_platform_fallback(self, codec, graphs):
+        assert codec.dictionary_for(Platform.JENKINS) is None
+        generic = SnapshotCodec(codec="zlib")
+        fallback = generic.train(None, graphs[:2])
+        assert generic.dictionary_for(Platform.JENKINS) is fallback
+
+    def test_streaming(self, codec, graphs):
+        graph = graphs[7]
+        buffer = io.BytesIO()
+        written = codec.write_graph(graph, buffer)
+        assert written == len(buffer.getvalue())
+        buffer.seek(0)
+        assert codec.read_graph(buffer) == _reloaded(graph)
+
+        frame = buffer.getvalue()
+        pieces = [frame[i : i + 3] for i in range(0, len(frame), 3)]
+        assert b"".join(codec.iter_decompress(pieces)) == graph.model_dump_json().encode()
+
+    def test_plain_json_passes_through(self, codec, graphs):
+        raw = graphs[0].model_dump_json().encode()
+        assert codec.decompress(raw) == raw
+        assert codec.load_graph(raw) == _reloaded(graphs[0])
+
+    def test_retired_dictionary_still_decodes(self, graphs):
+        codec = SnapshotCodec(codec="zlib")
+        codec.train(Platform.GITLAB, graphs[:2])
+        old = codec.dump_graph(graphs[6])
+        codec.train(Platform.GITLAB, graphs[2:4])
+        assert codec.dump_graph(graphs[6])[1:5] != old[1:5]
+        assert codec.load_graph(old) == _reloaded(graphs[6])
+
+    def test_missing_dictionary(self, codec, graphs):
+        frame = codec.dump_graph(graphs[6])
+        with pytest.raises(CompressionError, match="dictionary"):
+            SnapshotCodec(codec="zlib").decompress(frame)
+
+    def test_malformed_frames(self, codec):
+        with pytest.raises(CompressionError):
+            codec.decompress(b"\x01")
+        with pytest.raises(CompressionError):
+            codec.decompress(b"\x09\x00\x00\x00\x00abc")
+        frame = SnapshotCodec(codec="zlib").compress(b"x" * 1000)
+        with pytest.raises(CompressionError, match="truncated"):
+            codec.decompress(frame[:-4])
+        with pytest.raises(CompressionError, match="corrupt"):
+            codec.decompress(frame[:5] + b"junk")
+
+    def test_unknown_codec(self):
+        with pytest.raises(CompressionError):
+            SnapshotCodec(codec="lz4")  # type: ignore[arg-type]
+
+    def test_zstd_roundtrip(self, graphs):
+        pytest.importorskip("zstandard")
+        codec = SnapshotCodec(codec="zstd")
+        codec.train(Platform.GITLAB, graphs[:6])
+        assert codec.load_graph(codec.dump_graph(graphs[7])) == _reloaded(graphs[7])
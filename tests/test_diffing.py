@@ -0,0 +1,86 @@
+"""Tests for batched refactor diff generation."""
+
+from atlas_sdk import Evidence, Finding, Severity
+from atlas_sdk.diffing import DiffBuilder, apply_edits, render_file_diff
+from atlas_sdk.models.refactors import RefactorSuggestion
+
+JENKINSFILE = """pipeline {
+    agent any
+    stages {
+        stage('Build') { steps { sh 'make' } }
+        stage('Test') { steps { sh 'make test' } }
+    }
+}
+"""
+
+
+def _suggestion(before, after, **metadata):
+    return RefactorSuggestion(
+        rule_id="r",
+        description="d",
+        before_snippet=before,
+        after_snippet=after,
+        metadata=metadata,
+    )
+
+
+class TestApplyEdits:
+    def test_single_pass_with_offsets(self):
+        text, applied, skipped = apply_edits(
+            "a b a c", [("s1", "c", "C"), ("s2", "a", "A"), ("s3", "a", "AA"), ("s4", "z", "")]
+        )
+        assert text == "A b AA C"
+        assert applied == ["s2", "s3", "s1"]
+        assert skipped == ["s4"]
+
+
+class TestRenderFileDiff:
+    def test_final_newline_change_is_marked(self):
+        diff = render_file_diff("Jenkinsfile", JENKINSFILE, [("s1", "}\n}\n", "}\n}")]).diff
+        assert diff.endswith(" }\n-}\n+}\n\\ No newline at end of file\n")
+        assert render_file_diff("Jenkinsfile", JENKINSFILE, [("s1", "}\n}\n", "}\n}\n")]).diff == ""
+
+    def test_unchanged_last_line_without_newline(self):
+        original = JENKINSFILE.rstrip("\n")
+        diff = render_file_diff("Jenkinsfile", original, [("s1", "make test", "make check")]).diff
+        assert diff.endswith("     }\n }\n\\ No newline at end of file\n")
+
+
+class TestDiffBuilder:
+    def test_one_diff_per_file(self):
+        finding = Finding(
+            rule_id="r",
+            title="t",
+            description="d",
+            severity=Severity.LOW,
+            evidence=[Evidence(source_file="Jenkinsfile")],
+        )
+        s1 = _suggestion("agent any", "agent { label 'linux' }", source_file="Jenkinsfile")
+        s2 = _suggestion("sh 'make test'", "sh 'make test -j4'")
+        s2.finding_id = finding.id
+        s3 = _suggestion("image: node", "image: node:20")
+
+        builder = DiffBuilder({"Jenkinsfile": JENKINSFILE})
+        diffs = builder.render([s1, s2, s3], [finding])
+
+        assert [d.path for d in diffs] == ["", "Jenkinsfile"]
+        jenkins = diffs[1]
+        assert jenkins.diff.startswith("--- a/Jenkinsfile\n+++ b/Jenkinsfile\n")
+        assert "+    agent { label 'linux' }\n" in jenkins.diff
+        assert "+        stage('Test') { steps { sh 'make test -j4' } }\n" in jenkins.diff
+        assert jenkins.applied_suggestion_ids == [s1.id, s2.id]
+        assert "+image: node:20" in diffs[0].diff
+
+    def test_cache_and_parallel_render(self):
+        files = {f"f{i}.yml": f"image: node\nrun: test {i}\n" for i in range(3)}
+        suggestions = [
+            _suggestion("image: node", "image: node:20", source_file=path) for path in files
+        ]
+        builder = DiffBuilder(files)
+        parallel = builder.render(suggestions, max_workers=2)
+        assert builder.cache_misses == 3
+
+        again = builder.render(suggestions)
+        assert builder.cache_hits == 3
+        assert again == parallel
+        assert builder.preview(suggestions).count("+image: node:20") == 3
@@ -0,0 +1,131 @@
+"""Tests for image reference parsing and digest resolution."""
+
+import pytest
+
+from atlas_sdk.images import (
+    DigestCache,
+    ImageCatalog,
+    StubResolver,
+    parse_image_reference,
+    reference_for_node,
+)
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.models.nodes import ContainerImageNode, JobNode
+from atlas_sdk.storage import SQLiteDigestCache
+from atlas_sdk.synthetic import EstateGenerator
+
+DIGEST = "sha256:" + "ab" * 32
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestParseImageReference:
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("nginx", "docker.io/library/nginx:latest"),
+            ("nginx:1.25", "docker.io/library/nginx:1.25"),
+            ("bitnami/redis:7", "docker.io/bitnami/redis:7"),
+            ("index.docker.io/library/nginx", "docker.io/library/nginx:latest"),
+            ("GHCR.io/org/app:v1", "ghcr.io/org/app:v1"),
+            ("localhost:5000/app", "localhost:5000/app:latest"),
+            (f"nginx@{DIGEST}", f"docker.io/library/nginx@{DIGEST}"),
+            (f"quay.io/org/app:2@{DIGEST}", f"quay.io/org/app:2@{DIGEST}"),
+        ],
+    )
+    def test_normalizes(self, text, expected):
+        assert str(parse_image_reference(text)) == expected
+
+    def test_pin_status(self):
+        assert parse_image_reference(f"nginx@{DIGEST}").pinned
+        assert not parse_image_reference("nginx:1.25").pinned
+        assert parse_image_reference(f"nginx:1@{DIGEST}").tag_reference == (
+            "docker.io/library/nginx:1"
+        )
+
+    @pytest.mark.parametrize("text", ["", "Nginx", "nginx:bad tag", "nginx@sha256:short"])
+    def test_rejects_invalid(self, text):
+        with pytest.raises(ValueError):
+            parse_image_reference(text)
+
+    def test_node_fields_complete_the_name(self):
+        node = ContainerImageNode(name="org/app", registry="ghcr.io", tag="3")
+        assert str(reference_for_node(node)) == "ghcr.io/org/app:3"
+        resolved = ContainerImageNode(name="app:1", digest=DIGEST)
+        assert not reference_for_node(resolved).pinned
+        pinned = ContainerImageNode(name="app:1", digest=DIGEST, pinned=True)
+        assert reference_for_node(pinned).digest == DIGEST
+
+
+class TestDigestCache:
+    def test_lru_and_ttl(self):
+        clock = _Clock()
+        cache = DigestCache(2, ttl_seconds=10, negative_ttl_seconds=1, clock=clock)
+        cache.put("a", DIGEST)
+        cache.put("b", None)
+        cache.get("a")
+        cache.put("c", DIGEST)
+        assert cache.get("b") is None and cache.get("a") is not None
+        clock.now += 5
+        assert cache.get("c") is not None
+        clock.now += 6
+        assert cache.get("c") is None
+        assert (cache.hits, cache.misses) == (3, 2)
+
+    def test_disk_backend_survives_memory(self, tmp_path):
+        backend = SQLiteDigestCache(str(tmp_path / "cache.db"))
+        DigestCache(backend=backend).put("x", DIGEST)
+        fresh = DigestCache(backend=backend)
+        assert fresh.get("x")[0] == DIGEST
+        assert fresh.backend_hits == 1 and len(fresh) == 1
+
+
+class TestImageCatalog:
+    def _graph(self):
+        return CICDGraph(
+            name="images",
+            nodes=[
+                ContainerImageNode(id="a", name="python:3.12"),
+                ContainerImageNode(id="b", name="docker.io/library/python:3.12"),
+                ContainerImageNode(id="c", name=f"alpine@{DIGEST}"),
+                ContainerImageNode(id="d", name="private/app", registry="ghcr.io", pinned=True),
+                ContainerImageNode(id="e", name="Bad Name"),
+                JobNode(id="j", name="build"),
+            ],
+        )
+
+    def test_apply_resolves_each_reference_once(self):
+        resolver = StubResolver({"ghcr.io/private/app": DIGEST}, default=True)
+        catalog = ImageCatalog(resolver, DigestCache())
+        graph = self._graph()
+        report = catalog.apply(graph)
+        nodes = {n.id: n for n in graph.nodes}
+        assert report.images == 5 and report.invalid_node_ids == ["e"]
+        assert report.resolver_calls == 2 and report.pinned == 1 and report.resolved == 3
+        assert nodes["a"].digest == nodes["b"].digest is not None
+        assert not nodes["a"].pinned and nodes["a"].tag == "3.12"
+        assert nodes["c"].pinned and nodes["c"].digest == DIGEST
+        assert nodes["d"].pinned is False and nodes["d"].digest == DIGEST
+
+        again = catalog.apply(graph)
+        assert again.resolver_calls == 0 and again.updated_node_ids == []
+
+    def test_unresolved_keeps_existing_digest(self):
+        catalog = ImageCatalog(StubResolver(default=False), DigestCache())
+        graph = CICDGraph(name="g", nodes=[ContainerImageNode(name="app:1", digest=DIGEST)])
+        report = catalog.apply(graph)
+        assert report.unresolved == 1 and graph.nodes[0].digest == DIGEST
+
+    def test_parallel_matches_serial_on_estate(self):
+        graph = EstateGenerator(seed=2, projects=1).project(0)
+        serial = ImageCatalog(StubResolver(), DigestCache()).apply(graph.model_copy(deep=True))
+        threaded = ImageCatalog(StubResolver(), DigestCache()).apply(graph, max_workers=4)
+        assert serial.model_dump() == threaded.model_dump()
+        assert threaded.invalid_node_ids == []
+        assert threaded.pinned == sum(1 for n in graph.nodes if getattr(n, "pinned", False))
@@ -0,0 +1,119 @@
+"""Tests for incremental rule re-evaluation."""
+
+import pytest
+
+from atlas_sdk.enums import EdgeType, NodeType, Severity
+from atlas_sdk.incremental import IncrementalRuleEngine
+from atlas_sdk.models.nodes import PipelineNode
+from atlas_sdk.overlay import GraphOverlay, diff_graphs
+from atlas_sdk.rules import Rule, RuleEngine
+from atlas_sdk.synthetic import EstateGenerator
+from tests.test_rules import RULES, Broken
+
+
+class GraphSize(Rule):
+    rule_id = "graph-size"
+
+    def finish(self, ctx):
+        if len(ctx.graph.nodes) > 10:
+            yield self.finding(ctx.graph.nodes[0], f"{len(ctx.graph.nodes)} nodes", Severity.INFO)
+
+
+def _ids(findings):
+    return sorted(f.id for f in findings)
+
+
+def _full(graph):
+    return _ids(RuleEngine(RULES).run(graph).findings)
+
+
+@pytest.fixture
+def graph():
+    return EstateGenerator(seed=4, projects=1).project(0)
+
+
+class TestDiffGraphs:
+    def test_matches_overlay_diff(self, graph):
+        overlay = GraphOverlay(graph)
+        job = next(n for n in graph.nodes if n.node_type == NodeType.JOB)
+        overlay.update_node(job.id, name="renamed")
+        overlay.remove_edge(graph.edges[0].id)
+        diff = diff_graphs(graph, overlay.materialize())
+        assert diff.changed_node_ids == {job.id}
+        assert diff.removed_edge_ids == [graph.edges[0].id]
+        assert diff_graphs(graph, graph.model_copy(deep=True)).is_empty
+
+
+class TestIncrementalRuleEngine:
+    def test_first_update_is_full_run(self, graph):
+        engine = IncrementalRuleEngine(RULES)
+        report = engine.update(graph)
+        assert _ids(report.findings) == _full(graph)
+        assert report.scopes_reused == 0 and report.scopes_rerun > 0
+
+    def test_unchanged_rescan_reruns_nothing(self, graph):
+        engine = IncrementalRuleEngine(RULES)
+        first = engine.update(graph)
+        report = engine.update(graph.model_copy(deep=True))
+        assert report.scopes_rerun == 0 and report.scopes_dropped == 0
+        assert report.scopes_reused == first.scopes_rerun
+        assert _ids(report.findings) == _ids(first.findings)
+
+    def test_modified_node_reruns_only_its_scopes(self, graph):
+        engine = IncrementalRuleEngine(RULES)
+        engine.update(graph)
+        job = next(
+            n for n in graph.nodes if n.node_type == NodeType.JOB and n.timeout_minutes is None
+        )
+        overlay = GraphOverlay(graph)
+        overlay.update_node(job.id, timeout_minutes=30)
+        changed = overlay.materialize()
+
+        report = engine.update(changed, overlay.diff())
+        assert f"job-no-timeout:{job.id}" not in _ids(report.findings)
+        assert _ids(report.findings) == _full(changed)
+        assert report.scopes_rerun < 10
+
+    def test_adjacency_change_invalidates_readers(self, graph):
+        engine = IncrementalRuleEngine(RULES)
+        engine.update(graph)
+        deploy = next(f for f in engine.findings if f.rule_id == "secret-in-deploy")
+        deps = engine.dependencies(deploy.id)
+        assert deploy.affected_node_ids[0] in deps.outgoing_of
+
+        overlay = GraphOverlay(graph)
+        for edge in overlay.get_edges_from(deploy.affected_node_ids[0]):
+            if edge.edge_type == EdgeType.CONSUMES:
+                overlay.remove_edge(edge.id)
+        changed = overlay.materialize()
+        report = engine.update(changed)
+        assert deploy.id not in _ids(report.findings)
+        assert _ids(report.findings) == _full(changed)
+
+    def test_added_and_removed_subjects(self, graph):
+        engine = IncrementalRuleEngine(RULES)
+        engine.update(graph)
+        overlay = GraphOverlay(graph)
+        overlay.add_node(PipelineNode(id="extra-pipeline", name="extra"))
+        victim = next(n for n in graph.nodes if n.node_type == NodeType.CONTAINER_IMAGE)
+        overlay.remove_node(victim.id)
+        changed = overlay.materialize()
+
+        report = engine.update(changed, overlay.diff())
+        assert report.scopes_dropped >= 1
+        assert _ids(report.findings) == _full(changed)
+
+    def test_whole_graph_readers_rerun_on_any_change(self, graph):
+        engine = IncrementalRuleEngine([GraphSize()])
+        engine.update(graph)
+        assert engine.dependencies(engine.findings[0].id).whole_graph
+        assert engine.update(graph).scopes_rerun == 0
+        overlay = GraphOverlay(graph)
+        overlay.remove_edge(graph.edges[0].id)
+        assert engine.update(overlay.materialize()).scopes_rerun == 1
+
+    def test_failed_scopes_are_retried(self, graph):
+        engine = IncrementalRuleEngine([Broken()])
+        assert engine.update(graph).errors["broken"] == "RuntimeError: boom"
+        report = engine.update(graph)
+        assert report.errors and report.scopes_rerun > 0
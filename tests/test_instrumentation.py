@@ -0,0 +1,87 @@
+"""Tests for opt-in hot-path instrumentation."""
+
+from atlas_sdk import instrumentation
+from atlas_sdk.enums import Severity
+from atlas_sdk.events import AITokenUsageEvent
+from atlas_sdk.graph_index import GraphIndex
+from atlas_sdk.instrumentation import MetricsRegistry, OpenTelemetrySink, instrumented
+from atlas_sdk.models.findings import Finding
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.models.nodes import JobNode
+from atlas_sdk.schema_registry import registry
+
+
+def _finding(**overrides):
+    return Finding(rule_id="r", title="t", description="d", severity=Severity.LOW, **overrides)
+
+
+class TestInstrumentation:
+    def test_disabled_by_default_and_restored(self):
+        originals = (Finding.__init__, Finding.model_dump_json, CICDGraph.get_node)
+        assert not instrumentation.is_enabled()
+        with instrumented():
+            assert instrumentation.is_enabled()
+            assert Finding.model_dump_json is not originals[1]
+        assert not instrumentation.is_enabled()
+        assert (Finding.__init__, Finding.model_dump_json, CICDGraph.get_node) == originals
+
+    def test_validation_and_serialization(self):
+        with instrumented() as metrics:
+            finding = _finding()
+            data = finding.model_dump_json()
+            Finding.model_validate_json(data)
+            Finding.model_validate(
+                {"rule_id": "r", "title": "t", "description": "d", "severity": "low"}
+            )
+
+        validate = metrics.get("validate", "Finding")
+        assert validate.calls == 3
+        assert validate.bytes == len(data)
+        dump = metrics.get("dump_json", "Finding")
+        assert (dump.calls, dump.bytes) == (1, len(data))
+        assert dump.seconds.count == 1 and dump.seconds.total > 0
+
+    def test_subclasses_are_not_double_counted(self):
+        with instrumented() as metrics:
+            JobNode(name="build")
+        assert metrics.get("validate", "JobNode").calls == 1
+        assert metrics.get("validate", "Node") is None
+
+    def test_event_codec_and_lookups(self):
+        graph = CICDGraph(name="g", nodes=[JobNode(name="a")])
+        index = GraphIndex(graph)
+        event = AITokenUsageEvent(tenant_id="t", provider="p", model="m", tokens_used=1)
+        with instrumented() as metrics:
+            data = registry.encode(event)
+            registry.decode(data)
+            graph.get_node("missing")
+            index.get_edges_from("missing")
+
+        assert metrics.get("encode", "AITokenUsageEvent").bytes == len(data)
+        assert metrics.get("decode", "AITokenUsageEvent").calls == 1
+        assert metrics.get("lookup", "CICDGraph.get_node").calls == 1
+        assert metrics.get("lookup", "GraphIndex.get_edges_from").calls == 1
+
+    def test_prometheus_text(self):
+        with instrumented() as metrics:
+            _finding().model_dump_json()
+        text = metrics.to_prometheus()
+        labels = 'operation="dump_json",target="Finding"'
+        assert "# TYPE atlas_sdk_operation_seconds histogram" in text
+        assert f'atlas_sdk_operation_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+        assert f"atlas_sdk_operation_seconds_count{{{labels}}} 1" in text
+        assert f"atlas_sdk_operation_calls_total{{{labels}}} 1" in text
+
+    def test_multiple_sinks(self):
+        durations, sizes = [], []
+        registry_sink = MetricsRegistry()
+        otel = OpenTelemetrySink(
+            lambda value, attrs: durations.append(attrs),
+            lambda value, attrs: sizes.append(value),
+        )
+        with instrumented(registry_sink, otel) as created:
+            data = _finding().model_dump_json()
+        assert created is None
+        assert {"atlas.operation": "dump_json", "atlas.target": "Finding"} in durations
+        assert sizes == [len(data)]
+        assert registry_sink.get("validate", "Finding").calls == 1
@@ -0,0 +1,62 @@
+"""Import-cost guards for the lazily re-exported public API.
+
+Each check runs in a fresh interpreter so earlier imports in the test
+session can't mask an eager import.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import atlas_sdk
+import atlas_sdk.models
+import atlas_sdk.storage
+
+
+def _loaded_after(code: str) -> set[str]:
+    probe = f"import sys\n{code}\nprint('\\n'.join(sorted(sys.modules)))"
+    out = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    ).stdout
+    return set(out.split())
+
+
+class TestLazyImports:
+    def test_enums_do_not_import_pydantic(self):
+        loaded = _loaded_after("import atlas_sdk.enums")
+        assert "pydantic" not in loaded
+        assert "atlas_sdk.models" not in loaded
+
+    def test_confidence_score_skips_model_modules(self):
+        loaded = _loaded_after("from atlas_sdk import ConfidenceScore")
+        assert "atlas_sdk.confidence" in loaded
+        assert not {m for m in loaded if m.startswith("atlas_sdk.models")}
+        assert "atlas_sdk.events" not in loaded
+
+    def test_single_model_module_stays_isolated(self):
+        loaded = _loaded_after("from atlas_sdk.models.nodes import JobNode")
+        assert "atlas_sdk.models.graph" not in loaded
+        assert "atlas_sdk.models.findings" not in loaded
+
+    def test_single_store_stays_isolated(self):
+        loaded = _loaded_after("from atlas_sdk.storage import SQLiteDigestCache")
+        assert "atlas_sdk.storage.images" in loaded
+        assert not {"atlas_sdk.storage.graphs", "atlas_sdk.storage.proposals"} & loaded
+        assert "atlas_sdk.models.proposals" not in loaded
+
+    def test_public_names_resolve(self):
+        for name in atlas_sdk.__all__:
+            assert getattr(atlas_sdk, name) is not None
+        assert "CICDGraph" in dir(atlas_sdk)
+
+    def test_all_matches_lazy_imports(self):
+        assert sorted(atlas_sdk.__all__) == sorted(["__version__", *atlas_sdk._LAZY_IMPORTS])
+        assert sorted(atlas_sdk.models.__all__) == sorted(atlas_sdk.models._LAZY_IMPORTS)
+        assert sorted(atlas_sdk.storage.__all__) == sorted(atlas_sdk.storage._LAZY_IMPORTS)
+        for name in atlas_sdk.storage.__all__:
+            assert getattr(atlas_sdk.storage, name) is not None
+
+    def test_unknown_name_raises_attribute_error(self):
+        with pytest.raises(AttributeError, match="DoesNotExist"):
+            atlas_sdk.DoesNotExist  # noqa: B018
@@ -0,0 +1,134 @@
+"""Tests for the streaming build-log analyzer."""
+
+import asyncio
+
+from atlas_sdk.events import LogAnalysisEvent, ScanResultEvent
+from atlas_sdk.log_analysis import (
+    LogAnalyzer,
+    analyze_file,
+    analyze_lines,
+    analyze_logs,
+    analyze_scan_result,
+    analyze_stream,
+)
+
+SAMPLE_LOG = [
+    "[Pipeline] { (Build)\n",
+    "+ docker pull --quiet registry.example.com/app:1.2\n",
+    "Cache hit for key deps-abc\n",
+    "ERROR: test_login failed\n",
+    "Retrying flaky test in 5s\n",
+    "cache miss for node_modules\n",
+    "Build step took 12.5s\n",
+]
+
+
+class TestLogAnalyzer:
+    def test_single_pass_counts(self):
+        event = analyze_lines(SAMPLE_LOG, "req-1")
+        assert isinstance(event, LogAnalysisEvent)
+        assert event.errors == 2  # "ERROR" and "failed"
+        assert event.flaky_signals == 2
+        assert event.cache_hits == 1
+        assert event.cache_misses == 1
+        assert event.docker_steps == 1
+        assert event.duration_mentions == 1
+        assert event.total_patterns == len(event.patterns)
+
+    def test_subjects_are_captured(self):
+        analyzer = LogAnalyzer(source="build-42").feed_lines(SAMPLE_LOG)
+        subjects = {p["type"]: p.get("subject") for p in analyzer.patterns}
+        assert subjects["docker"] == "registry.example.com/app:1.2"
+        assert subjects["stage"] == "Build"
+        assert subjects["duration"] == "12.5s"
+        assert all(p["source"] == "build-42" for p in analyzer.patterns)
+
+    def test_docker_subject_skips_option_values(self):
+        lines = [
+            "docker run --rm -e FOO=bar -v /src:/app --name web -it nginx:1.25 echo hi\n",
+            "docker pull --platform linux/amd64 alpine:3.19\n",
+            "docker run --env=FOO=bar -d redis\n",
+        ]
+        analyzer = LogAnalyzer().feed_lines(lines)
+        assert [p.get("subject") for p in analyzer.patterns] == [
+            "nginx:1.25",
+            "alpine:3.19",
+            "redis",
+        ]
+
+    def test_pattern_samples_are_bounded(self):
+        event = analyze_lines(["ERROR\n"] * 50, "req-1", max_patterns=10)
+        assert event.errors == 50
+        assert len(event.patterns) == 10
+
+    def test_file_and_long_lines(self, tmp_path):
+        path = tmp_path / "build.log"
+        path.write_text("x" * 300 + " ERROR\nok\nfailed\n")
+        event = analyze_file(path, "req-1", max_line_chars=128)
+        assert event.errors == 2
+        assert [p["line"] for p in event.patterns] == [1, 3]
+
+    def test_file_without_trailing_newline_matches_text(self, tmp_path):
+        body = "line1\nerror at end"
+        path = tmp_path / "build.log"
+        path.write_text(body)
+        from_file = LogAnalyzer().feed_file(path)
+        from_text = LogAnalyzer().feed_text(body)
+        assert (from_file.lines_read, from_file.chars_read) == (2, len(body))
+        assert (from_text.lines_read, from_text.chars_read) == (2, len(body))
+        assert from_file.patterns == from_text.patterns
+
+    def test_async_stream(self):
+        async def lines():
+            for line in SAMPLE_LOG:
+                yield line.encode()
+
+        event = asyncio.run(analyze_stream(lines(), "req-1"))
+        assert event.cache_hits == 1
+
+    def test_custom_detectors(self):
+        analyzer = LogAnalyzer({"oom": r"out of memory"}).feed_text("Out of memory\nfine\n")
+        assert analyzer.counts == {"oom": 1}
+        assert analyzer.to_event("req-1").errors == 0
+
+
+class TestBatchAnalysis:
+    def _logs(self, tmp_path):
+        path = tmp_path / "b3.log"
+        path.write_text("cache miss\nERROR\n")
+        return [
+            {"build_id": "b1", "content": "".join(SAMPLE_LOG)},
+            {"build_id": "b2", "log": b"ERROR one\nERROR two\n\xff"},
+            str(path),
+        ]
+
+    def test_inline_merge(self, tmp_path):
+        result = analyze_logs(self._logs(tmp_path), "req-1", max_workers=1)
+        assert result.event.errors == 5
+        assert result.event.cache_misses == 2
+        assert [t.source for t in result.timings][:2] == ["b1", "b2"]
+        assert result.event.total_patterns == sum(t.total_patterns for t in result.timings)
+
+    def test_process_pool_matches_inline(self, tmp_path):
+        logs = self._logs(tmp_path)
+        inline = analyze_logs(logs, "req-1", max_workers=1)
+        pooled = analyze_logs(logs, "req-1", max_workers=2)
+        assert pooled.event.patterns == inline.event.patterns
+        assert pooled.event.model_dump(exclude={"event_id", "timestamp"}) == (
+            inline.event.model_dump(exclude={"event_id", "timestamp"})
+        )
+
+    def test_merged_samples_respect_cap(self, tmp_path):
+        result = analyze_logs(self._logs(tmp_path), "req-1", max_workers=1, max_patterns=3)
+        assert len(result.event.patterns) == 3
+        assert {p["source"] for p in result.event.patterns} == {"b1"}
+
+    def test_scan_result_event(self):
+        event = ScanResultEvent(
+            scan_request_id="req-9",
+            platform="jenkins",
+            build_logs=[{"id": "7", "content": "docker build .\n"}],
+        )
+        result = analyze_scan_result(event)
+        assert result.event.scan_request_id == "req-9"
+        assert result.event.docker_steps == 1
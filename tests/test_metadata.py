@@ -0,0 +1,177 @@
+"""Tests for compact metadata mappings and key-dictionary packing."""
+
+import copy
+import json
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from atlas_sdk import metadata as md
+from atlas_sdk.enums import Severity
+from atlas_sdk.metadata import CompactMetadata, compact, pack_metadata, unpack_metadata
+from atlas_sdk.models.edges import Edge
+from atlas_sdk.models.findings import Finding
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.models.nodes import JobNode
+from atlas_sdk.synthetic import EstateGenerator
+
+
+class TestCompactMetadata:
+    def test_behaves_like_dict(self):
+        data = {"owner": "team-a", "tier": 2, "labels": ["x"]}
+        m = CompactMetadata(data)
+        assert m == data
+        assert list(m) == list(data)
+        assert len(m) == 3
+        assert m["tier"] == 2
+        assert "owner" in m and "missing" not in m
+        assert m.get("missing", 7) == 7
+        with pytest.raises(KeyError):
+            m["missing"]
+
+    def test_set_and_delete(self):
+        m = CompactMetadata({"a": 1, "b": 2})
+        m["a"] = 10
+        m["c"] = 3
+        del m["b"]
+        assert m == {"a": 10, "c": 3}
+        assert len(m) == 2
+        with pytest.raises(KeyError):
+            del m["b"]
+        m["b"] = 20
+        assert m == {"a": 10, "b": 20, "c": 3}
+
+    def test_same_keys_share_shape(self):
+        a = CompactMetadata({"x": 1, "y": 2})
+        b = CompactMetadata({"x": 3, "y": 4})
+        assert a.shape is b.shape
+        assert CompactMetadata({"y": 1, "x": 2}).shape != a.shape
+
+    def test_wide_mapping_overflows(self):
+        data = {f"k{i}": i for i in range(md.MAX_SHAPE_KEYS + 5)}
+        m = CompactMetadata(data)
+        assert len(m.shape) == md.MAX_SHAPE_KEYS
+        assert m == data
+        assert list(m) == list(data)
+        m["extra"] = 1
+        assert m["extra"] == 1
+
+    def test_concurrent_shape_creation(self):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            shapes = list(pool.map(lambda _: CompactMetadata({"race": 1})._shape, range(64)))
+        assert all(shape is shapes[0] for shape in shapes)
+
+    def test_copies_are_independent(self):
+        m = CompactMetadata({"a": [1], "b": 2})
+        shallow = copy.copy(m)
+        deep = copy.deepcopy(m)
+        m["b"] = 3
+        m["a"].append(2)
+        assert shallow == {"a": [1, 2], "b": 2}
+        assert deep == {"a": [1], "b": 2}
+
+    def test_pickle_roundtrip(self):
+        m = CompactMetadata({"a": 1, "b": {"c": 2}})
+        restored = pickle.loads(pickle.dumps(m))
+        assert isinstance(restored, CompactMetadata)
+        assert restored == m
+        assert restored.shape is m.shape
+
+
+class TestCompact:
+    def test_model_dumps_unchanged(self):
+        node = JobNode(name="build", metadata={"owner": "a", "retries": 2})
+        before_json = node.model_dump_json()
+        before = node.model_dump()
+        assert compact(node) == 1
+        assert isinstance(node.metadata, CompactMetadata)
+        assert node.model_dump_json() == before_json
+        assert node.model_dump() == before
+        assert node.model_copy(deep=True) == node
+
+    def test_compacts_nested_models(self):
+        graph = EstateGenerator(seed=2, projects=1).project(0)
+        graph.edges[0].metadata["via"] = "x"
+        expected = graph.model_dump_json()
+        with_metadata = sum(1 for item in [*graph.nodes, *graph.edges] if item.metadata)
+        assert compact(graph) >= with_metadata
+        assert isinstance(graph.edges[0].metadata, CompactMetadata)
+        assert graph.model_dump_json() == expected
+        assert compact(graph) == 0
+
+    def test_keeps_dict_once_shapes_are_capped(self, monkeypatch):
+        wide = JobNode(name="build", metadata={f"k{i}": i for i in range(md.MAX_SHAPE_KEYS + 1)})
+        CompactMetadata(wide.metadata)  # its shape exists before the cap
+        monkeypatch.setattr(md, "MAX_SHAPES", md.shape_count())
+        node = JobNode(name="build", metadata={"never-seen-key": 1})
+        assert compact(node) == 0
+        assert type(node.metadata) is dict
+        assert compact(wide) == 1
+
+    def test_empty_metadata_left_alone(self):
+        node = JobNode(name="build")
+        assert compact(node) == 0
+        assert type(node.metadata) is dict
+
+    def test_json_schema_unchanged(self):
+        schema = JobNode.model_json_schema()["properties"]["metadata"]
+        assert schema["type"] == "object"
+
+
+class TestPackMetadata:
+    def test_roundtrip(self):
+        graph = EstateGenerator(seed=2, projects=1).project(0)
+        payload = graph.model_dump(mode="json")
+        packed = pack_metadata(payload)
+        assert md.PACKED_KEYS_FIELD in packed
+        assert unpack_metadata(packed) == payload
+        assert len(json.dumps(packed)) < len(json.dumps(payload))
+
+    def test_non_dict_payload_is_wrapped(self):
+        payload = [{"metadata": {"a": 1}}, {"metadata": {"a": 2}}]
+        packed = pack_metadata(payload)
+        assert packed[md.PACKED_BODY_FIELD] == [
+            {"metadata": {md.PACKED_SHAPE_FIELD: 0, md.PACKED_VALUES_FIELD: [1]}},
+            {"metadata": {md.PACKED_SHAPE_FIELD: 0, md.PACKED_VALUES_FIELD: [2]}},
+        ]
+        assert packed[md.PACKED_KEYS_FIELD] == [["a"]]
+        assert unpack_metadata(packed) == payload
+
+    def test_unpacked_payload_passes_through(self):
+        payload = {"metadata": {"a": 1}}
+        assert unpack_metadata(payload) is payload
+
+    def test_nested_metadata_keys_roundtrip(self):
+        for labels in ({"metadata": [5, "x"]}, {"metadata": [0, "x"]}, {"metadata": {"k": 1}}):
+            node = JobNode(name="build", metadata={"labels": labels, "metadata": [0]})
+            packed = pack_metadata(node.model_dump(mode="json"))
+            assert packed["metadata"][md.PACKED_VALUES_FIELD] == [labels, [0]]
+            assert md.loads(JobNode, md.dumps(node)) == node
+        payload = {"metadata": {}, "items": [{"metadata": [0, 1]}]}
+        assert unpack_metadata(pack_metadata(payload)) == payload
+
+    def test_compact_mappings(self):
+        packed = pack_metadata({"metadata": {"a": 1}})
+        restored = unpack_metadata(packed, compact_mappings=True)
+        assert isinstance(restored["metadata"], CompactMetadata)
+
+    def test_dumps_loads_models(self):
+        finding = Finding(
+            rule_id="R1",
+            title="t",
+            description="d",
+            severity=Severity.HIGH,
+            metadata={"scanner": "atlas", "nested": {"metadata": {"k": "v"}}},
+        )
+        restored = md.loads(Finding, md.dumps(finding))
+        assert restored == finding
+        assert isinstance(restored.metadata, CompactMetadata)
+        edge = Edge(source_node_id="a", target_node_id="b", edge_type="calls", metadata={"w": 1})
+        assert md.loads(Edge, md.dumps(edge), compact_metadata=False) == edge
+
+    def test_dumps_graph(self):
+        graph = EstateGenerator(seed=2, projects=1).project(0)
+        restored = md.loads(CICDGraph, md.dumps(graph))
+        assert restored == CICDGraph.model_validate_json(graph.model_dump_json())
+        assert len(md.dumps(graph)) < len(graph.model_dump_json())
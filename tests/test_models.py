@@ -3,6 +3,7 @@
 import json
 
 import pytest
+from pydantic import ValidationError
 
 from atlas_sdk import (
     ArtifactNode,
@@ -260,6 +261,16 @@ class TestConfidence:
         assert c.level == ConfidenceLevel.MEDIUM
         assert c.source == SourceType.STATIC
 
+    def test_scores_are_immutable(self):
+        c = ConfidenceScore.high()
+        with pytest.raises(ValidationError):
+            c.level = ConfidenceLevel.LOW
+
+    def test_factories_share_instances_without_reasoning(self):
+        assert ConfidenceScore.medium() is ConfidenceScore.medium()
+        assert ConfidenceScore.high("runtime") is not ConfidenceScore.high("runtime")
+        assert ConfidenceScore.intern(ConfidenceScore()) is ConfidenceScore.medium()
+
 
 # ── Finding model tests ──────────────────────────────────────────────
 
@@ -288,6 +299,11 @@ class TestFindings:
         assert finding.evidence[0].line_number == 5
         assert finding.confidence.level == ConfidenceLevel.MEDIUM
 
+    def test_findings_share_default_confidence(self):
+        a = Finding(rule_id="r", title="t", description="d", severity=Severity.LOW)
+        b = Finding.model_validate_json(a.model_dump_json())
+        assert a.confidence is b.confidence
+
     def test_finding_json_round_trip(self):
         finding = Finding(
             rule_id="missing-cache",
@@ -0,0 +1,99 @@
+"""Tests for copy-on-write graph overlays."""
+
+import pytest
+
+from atlas_sdk import CICDGraph, Edge, EdgeType, JobNode, PipelineNode, StageNode
+from atlas_sdk.overlay import GraphOverlay, GraphPatch
+
+
+def _graph():
+    graph = CICDGraph(name="g")
+    p, a, b = PipelineNode(name="p"), JobNode(name="a"), JobNode(name="b")
+    for node in (p, a, b):
+        graph.add_node(node)
+    graph.add_edge(Edge(edge_type=EdgeType.CALLS, source_node_id=p.id, target_node_id=a.id))
+    graph.add_edge(Edge(edge_type=EdgeType.CALLS, source_node_id=p.id, target_node_id=b.id))
+    return graph, p, a, b
+
+
+class TestGraphOverlay:
+    def test_reads_fall_through_and_base_is_untouched(self):
+        graph, p, a, b = _graph()
+        overlay = GraphOverlay(graph)
+        overlay.update_node(a.id, timeout_minutes=10)
+        overlay.remove_node(b.id)
+
+        assert overlay.get_node(a.id).timeout_minutes == 10
+        assert graph.get_node(a.id).timeout_minutes is None
+        assert overlay.get_node(b.id) is None
+        assert [e.target_node_id for e in overlay.get_edges_from(p.id)] == [a.id]
+        assert (overlay.node_count, overlay.edge_count) == (2, 1)
+        assert len(graph.nodes) == 3 and len(graph.edges) == 2
+
+    def test_diff_is_relative_to_base(self):
+        graph, _, a, b = _graph()
+        overlay = GraphOverlay(graph)
+        stage = StageNode(name="s")
+        edge = Edge(edge_type=EdgeType.CALLS, source_node_id=a.id, target_node_id=stage.id)
+        overlay.apply(
+            GraphPatch(
+                add_nodes=[stage],
+                update_nodes={a.id: {"name": "a2"}, b.id: {"name": "b"}},  # b unchanged
+                add_edges=[edge],
+            )
+        )
+        diff = overlay.diff()
+        assert [n.id for n in diff.added_nodes] == [stage.id]
+        assert [n.id for n in diff.modified_nodes] == [a.id]
+        assert len(diff.added_edges) == 1
+        assert diff.changed_node_ids == {stage.id, a.id}
+
+    def test_updates_are_validated(self):
+        graph, _, a, _ = _graph()
+        overlay = GraphOverlay(graph)
+        patch = GraphPatch.model_validate_json(
+            f'{{"update_nodes": {{"{a.id}": {{"timeout_minutes": "30"}}}}}}'
+        )
+        overlay.apply(patch)
+        assert overlay.get_node(a.id).timeout_minutes == 30
+        assert isinstance(overlay.get_node(a.id), JobNode)
+
+        with pytest.raises(ValueError, match="timeout_minutes"):
+            overlay.update_node(a.id, timeout_minutes="soon")
+        with pytest.raises(ValueError, match="unknown JobNode fields: timeout"):
+            overlay.apply(GraphPatch(update_nodes={a.id: {"timeout": 5}}))
+        with pytest.raises(ValueError, match="unknown Edge fields"):
+            overlay.update_edge(graph.edges[0].id, weight=2)
+        assert overlay.get_node(a.id).timeout_minutes == 30
+        assert overlay.diff().modified_edges == []
+
+    def test_stacking_and_commit(self):
+        graph, _, a, _ = _graph()
+        lower = GraphOverlay(graph)
+        lower.update_node(a.id, name="lower")
+        upper = lower.push()
+        upper.remove_edge(graph.edges[0].id)
+        upper.update_node(a.id, timeout_minutes=5)
+
+        assert upper.depth == 2
+        assert upper.get_node(a.id).name == "lower"
+        assert lower.get_edges_to(a.id) != []
+        assert upper.get_edges_to(a.id) == []
+
+        assert upper.commit() is lower
+        assert lower.get_node(a.id).timeout_minutes == 5
+        assert lower.edge_count == 1
+        with pytest.raises(TypeError):
+            lower.commit()
+
+    def test_materialize(self):
+        graph, p, a, _ = _graph()
+        overlay = GraphOverlay(graph).push()
+        overlay.add_node(JobNode(name="c"))
+        overlay.remove_node(p.id)
+        result = overlay.materialize()
+        assert result.id == graph.id
+        assert [n.name for n in result.nodes] == ["a", "b", "c"]
+        assert result.edges == []
+        assert result.get_node(a.id) is graph.get_node(a.id)
+        assert overlay.materialize(deep=True).get_node(a.id) is not graph.get_node(a.id)
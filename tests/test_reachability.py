@@ -0,0 +1,136 @@
+"""Tests for the secret exposure reachability index."""
+
+import random
+
+from atlas_sdk.enums import EdgeType
+from atlas_sdk.models.edges import Edge
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.models.nodes import (
+    ArtifactNode,
+    EnvironmentNode,
+    ExternalServiceNode,
+    JobNode,
+    RunnerNode,
+    SecretRefNode,
+    StepNode,
+)
+from atlas_sdk.overlay import GraphOverlay
+from atlas_sdk.reachability import ReachabilityIndex
+from atlas_sdk.synthetic import EstateGenerator
+
+
+def _edge(edge_id, source, target, edge_type):
+    return Edge(id=edge_id, source_node_id=source, target_node_id=target, edge_type=edge_type)
+
+
+def _graph():
+    return CICDGraph(
+        name="exposure",
+        nodes=[
+            SecretRefNode(id="s", name="token", key="TOKEN", scope="repo"),
+            JobNode(id="build", name="build"),
+            StepNode(id="upload", name="upload"),
+            ExternalServiceNode(id="registry", name="registry"),
+            ArtifactNode(id="bundle", name="bundle"),
+            JobNode(id="deploy", name="deploy"),
+            EnvironmentNode(id="prod", name="prod"),
+            JobNode(id="other", name="other"),
+            EnvironmentNode(id="staging", name="staging"),
+            RunnerNode(id="runner", name="runner"),
+        ],
+        edges=[
+            _edge("e1", "build", "s", EdgeType.CONSUMES),
+            _edge("e2", "build", "upload", EdgeType.CALLS),
+            _edge("e3", "upload", "registry", EdgeType.DEPENDS_ON),
+            _edge("e4", "build", "bundle", EdgeType.PRODUCES),
+            _edge("e5", "deploy", "bundle", EdgeType.CONSUMES),
+            _edge("e6", "deploy", "prod", EdgeType.DEPLOYS_TO),
+            _edge("e7", "other", "staging", EdgeType.DEPLOYS_TO),
+            _edge("e8", "build", "runner", EdgeType.DEPENDS_ON),
+        ],
+    )
+
+
+def _snapshot(index, graph):
+    return {n.id: sorted(index.reachable_sinks(n.id)) for n in graph.nodes}
+
+
+class TestReachabilityIndex:
+    def test_exposure_follows_data_flow(self):
+        index = ReachabilityIndex.from_graph(_graph())
+        exposure = index.exposure("s")
+        assert exposure.key == "TOKEN" and exposure.scope == "repo"
+        assert exposure.environment_ids == ["prod"]
+        assert exposure.external_service_ids == ["registry"]
+        assert exposure.artifact_ids == ["bundle"]
+        assert index.reaches("s", "prod") and not index.reaches("s", "staging")
+        assert not index.reaches("s", "runner")
+        assert index.secrets_reaching("prod") == ["s"]
+
+    def test_path_and_carriers(self):
+        index = ReachabilityIndex.from_graph(_graph())
+        assert index.path("s", "prod") == ["s", "build", "bundle", "deploy", "prod"]
+        assert index.path("s", "staging") is None
+        assert sorted(index.carriers("s")) == ["build", "deploy", "upload"]
+
+    def test_incremental_edge_changes(self):
+        index = ReachabilityIndex.from_graph(_graph())
+        index.remove_edge("e6")
+        assert not index.reaches("s", "prod")
+        assert index.reaches("s", "bundle")
+        index.add_edge(_edge("e9", "other", "bundle", EdgeType.CONSUMES))
+        assert index.reaches("s", "staging")
+        index.remove_edge("e4")
+        assert index.exposure("s").external_service_ids == ["registry"]
+        assert not index.reaches("s", "staging")
+
+    def test_node_removal_and_retyping(self):
+        index = ReachabilityIndex.from_graph(_graph())
+        index.remove_node("bundle")
+        assert index.exposure("s").environment_ids == []
+        index.add_node(ExternalServiceNode(id="runner", name="runner"))
+        assert index.reaches("s", "runner")
+
+    def test_incremental_matches_rebuild(self):
+        graph = EstateGenerator(seed=11, projects=1).project(0)
+        index = ReachabilityIndex.from_graph(graph)
+        edges = {e.id: e for e in graph.edges}
+        node_ids = [n.id for n in graph.nodes]
+        rng = random.Random(3)
+        for step in range(60):
+            if step % 2:
+                edge_id = rng.choice(sorted(edges))
+                del edges[edge_id]
+                index.remove_edge(edge_id)
+            else:
+                source, target = rng.sample(node_ids, 2)
+                edge_type = rng.choice([EdgeType.CONSUMES, EdgeType.CALLS, EdgeType.PRODUCES])
+                edges[f"x{step}"] = _edge(f"x{step}", source, target, edge_type)
+                index.add_edge(edges[f"x{step}"])
+        changed = graph.model_copy(update={"edges": list(edges.values())})
+        assert _snapshot(index, changed) == _snapshot(
+            ReachabilityIndex.from_graph(changed), changed
+        )
+
+    def test_apply_diff(self):
+        graph = _graph()
+        overlay = GraphOverlay(graph)
+        overlay.remove_edge("e5")
+        overlay.add_edge(_edge("e9", "build", "staging", EdgeType.DEPLOYS_TO))
+        index = ReachabilityIndex.from_graph(graph)
+        index.apply_diff(overlay.diff())
+        assert index.exposure("s").environment_ids == ["staging"]
+
+    def test_estate_follows_shared_links(self):
+        estate = EstateGenerator(seed=5, projects=6).multi_project_graph()
+        index = ReachabilityIndex.from_estate(estate)
+        link = next(e for e in estate.cross_edges if e.link_type == "shared_secret")
+        copy = index.exposure(link.source_node_id)
+        owner = index.exposure(link.target_node_id)
+        assert set(copy.environment_ids) == set(owner.environment_ids)
+
+        index.remove_edge(link.id)
+        estate.cross_edges.remove(link)
+        rebuilt = ReachabilityIndex.from_estate(estate)
+        for node_id in (link.source_node_id, link.target_node_id):
+            assert index.exposure(node_id) == rebuilt.exposure(node_id)
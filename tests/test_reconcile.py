@@ -0,0 +1,92 @@
+"""Tests for runtime/static confidence reconciliation."""
+
+from atlas_sdk import (
+    CICDGraph,
+    ConfidenceLevel,
+    ConfidenceScore,
+    ContainerImageNode,
+    Edge,
+    EdgeType,
+    Finding,
+    PipelineNode,
+    Severity,
+    SourceType,
+    StageNode,
+)
+from atlas_sdk.events import LogAnalysisEvent
+from atlas_sdk.reconcile import reconcile_confidence
+
+
+def _graph():
+    graph = CICDGraph(name="g")
+    pipeline = PipelineNode(name="main", path="Jenkinsfile")
+    stage = StageNode(name="Build")
+    image = ContainerImageNode(
+        name="registry.example.com/app:1.2",
+        source=SourceType.AI_INFERENCE,
+        confidence=ConfidenceLevel.LOW,
+    )
+    for node in (pipeline, stage, image):
+        graph.add_node(node)
+    graph.add_edge(
+        Edge(edge_type=EdgeType.CALLS, source_node_id=pipeline.id, target_node_id=stage.id)
+    )
+    return graph, pipeline, stage, image
+
+
+class TestReconcile:
+    def test_upgrades_observed_nodes_edges_and_findings(self):
+        graph, pipeline, stage, image = _graph()
+        finding = Finding(
+            rule_id="r",
+            title="t",
+            description="d",
+            severity=Severity.LOW,
+            affected_node_ids=[stage.id],
+        )
+        event = LogAnalysisEvent(
+            scan_request_id="req",
+            patterns=[
+                {"type": "stage", "subject": "build"},
+                {"type": "docker", "subject": "registry.example.com/app:1.2"},
+                {"type": "x", "path": "Jenkinsfile"},
+                {"type": "stage", "subject": "Unknown"},
+            ],
+        )
+
+        report = reconcile_confidence(graph, [event], [finding])
+
+        assert report.observations == 4
+        assert report.unmatched_observations == 1
+        assert stage.source == SourceType.STATIC_RUNTIME
+        assert stage.confidence == ConfidenceLevel.HIGH
+        assert pipeline.confidence == ConfidenceLevel.HIGH
+        assert image.source == SourceType.RUNTIME
+        assert image.confidence == ConfidenceLevel.MEDIUM
+        assert graph.edges[0].source == SourceType.STATIC_RUNTIME
+        assert finding.confidence.level == ConfidenceLevel.HIGH
+        assert report.upgraded == 5
+
+    def test_downgrade_is_opt_in(self):
+        graph, _, stage, _ = _graph()
+        stage.source, stage.confidence = SourceType.STATIC_RUNTIME, ConfidenceLevel.HIGH
+        finding = Finding(
+            rule_id="r",
+            title="t",
+            description="d",
+            severity=Severity.LOW,
+            affected_node_ids=[stage.id],
+            confidence=ConfidenceScore.high(),
+        )
+
+        assert reconcile_confidence(graph, [], [finding]).changes == []
+        report = reconcile_confidence(graph, [], [finding], downgrade_unobserved=True)
+
+        assert stage.source == SourceType.STATIC
+        assert finding.confidence.level == ConfidenceLevel.MEDIUM
+        assert report.downgraded == 2
+
+    def test_node_id_join_is_exact(self):
+        graph, pipeline, _, _ = _graph()
+        report = reconcile_confidence(graph, [{"node_id": pipeline.id}])
+        assert report.observed_node_ids == [pipeline.id]
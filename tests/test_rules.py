@@ -0,0 +1,113 @@
+"""Tests for the rule execution framework."""
+
+import pytest
+
+from atlas_sdk.enums import EdgeType, NodeType, Severity
+from atlas_sdk.rules import Rule, RuleEngine
+from atlas_sdk.synthetic import EstateGenerator, synthetic_findings
+
+
+class NoTimeout(Rule):
+    rule_id = "job-no-timeout"
+    node_types = frozenset({NodeType.JOB})
+
+    def check_node(self, node, ctx):
+        if node.timeout_minutes is None:
+            yield self.finding(node, "Job has no timeout", Severity.MEDIUM)
+
+
+class UnpinnedImage(Rule):
+    rule_id = "unpinned-image"
+    node_types = frozenset({NodeType.CONTAINER_IMAGE})
+
+    def check_node(self, node, ctx):
+        if not node.pinned:
+            yield self.finding(node, "Container image is not pinned", Severity.HIGH)
+
+
+class SecretInDeploy(Rule):
+    rule_id = "secret-in-deploy"
+    edge_types = frozenset({EdgeType.DEPLOYS_TO})
+
+    def check_edge(self, edge, ctx):
+        secrets = ctx.successors(edge.source_node_id, EdgeType.CONSUMES)
+        if any(s.node_type == NodeType.SECRET_REF for s in secrets):
+            yield self.finding(edge, "Deploy job consumes secrets", Severity.LOW)
+
+
+class PipelineCount(Rule):
+    rule_id = "pipeline-count"
+
+    def finish(self, ctx):
+        pipelines = ctx.nodes_of_type(NodeType.PIPELINE)
+        if len(pipelines) > 1:
+            yield self.finding(pipelines[0], "Many pipelines", Severity.INFO)
+
+
+class Broken(Rule):
+    rule_id = "broken"
+    node_types = frozenset({NodeType.JOB})
+
+    def check_node(self, node, ctx):
+        raise RuntimeError("boom")
+
+
+RULES = [NoTimeout(), UnpinnedImage(), SecretInDeploy(), PipelineCount()]
+
+
+@pytest.fixture(scope="module")
+def graph():
+    return EstateGenerator(seed=4, projects=1).project(0)
+
+
+class TestRuleEngine:
+    def test_dispatches_only_declared_types(self, graph):
+        engine = RuleEngine(RULES)
+        report = engine.run(graph)
+        jobs = sum(1 for n in graph.nodes if n.node_type == NodeType.JOB)
+        deploys = sum(1 for e in graph.edges if e.edge_type == EdgeType.DEPLOYS_TO)
+        by_rule = {r.rule_id: r for r in report.results}
+        assert by_rule["job-no-timeout"].nodes_checked == jobs
+        assert by_rule["job-no-timeout"].edges_checked == 0
+        assert by_rule["secret-in-deploy"].edges_checked == deploys
+        assert by_rule["pipeline-count"].nodes_checked == 0
+
+    def test_matches_reference_findings(self, graph):
+        report = RuleEngine(RULES).run(graph)
+        expected = {
+            (f.rule_id, f.affected_node_ids[0])
+            for f in synthetic_findings(graph)
+            if f.rule_id in {"job-no-timeout", "unpinned-image"}
+        }
+        found = {
+            (f.rule_id, f.affected_node_ids[0])
+            for f in report.findings
+            if f.rule_id in {"job-no-timeout", "unpinned-image"}
+        }
+        assert found == expected
+        assert [r.rule_id for r in report.results] == [r.rule_id for r in RULES]
+
+    @pytest.mark.parametrize("mode", ["thread", "process"])
+    def test_pools_match_inline(self, graph, mode):
+        inline = RuleEngine(RULES).run(graph)
+        pooled = RuleEngine(RULES).run(graph, mode=mode, max_workers=2)
+        assert pooled.findings == inline.findings
+        assert all(r.seconds >= 0 for r in pooled.results)
+
+    def test_broken_rule_is_isolated(self, graph):
+        report = RuleEngine([Broken(), NoTimeout()]).run(graph)
+        assert report.errors == {"broken": "RuntimeError: boom"}
+        assert report.results[0].findings == []
+        assert report.results[1].findings
+
+    def test_emits_findings_event(self, graph):
+        event = RuleEngine(RULES).evaluate(graph, "scan-1")
+        assert event.graph_id == graph.id and event.scan_request_id == "scan-1"
+        assert len(event.findings) == len(RuleEngine(RULES).run(graph).findings)
+        assert set(event.metadata["rule_seconds"]) == {r.rule_id for r in RULES}
+
+    def test_rejects_duplicate_or_missing_ids(self):
+        with pytest.raises(ValueError):
+            RuleEngine([NoTimeout(), NoTimeout()])
+        with pytest.raises(ValueError):
+            RuleEngine([Rule()])
@@ -0,0 +1,72 @@
+"""Tests for dependency-aware refactor scheduling."""
+
+from atlas_sdk import Finding, Severity
+from atlas_sdk.models.refactors import RefactorPlan, RefactorSuggestion
+from atlas_sdk.scheduling import conflict_graph, parse_effort, schedule_plan
+
+
+def _suggestion(nodes, effort="5 minutes", **metadata):
+    return RefactorSuggestion(
+        rule_id="r",
+        description="d",
+        before_snippet="",
+        after_snippet="",
+        affected_node_ids=nodes,
+        effort_estimate=effort,
+        metadata=metadata,
+    )
+
+
+class TestScheduling:
+    def test_parse_effort(self):
+        assert parse_effort("5 minutes") == 5
+        assert parse_effort("1 hour") == 60
+        assert parse_effort("2h 30m") == 150
+        assert parse_effort("1 day") == 480
+        assert parse_effort("soon") == 30
+
+    def test_conflicts_via_nodes_and_files(self):
+        a = _suggestion(["n1"])
+        b = _suggestion(["n1", "n2"])
+        c = _suggestion(["n3"], source_file="Jenkinsfile")
+        d = _suggestion([], source_file="Jenkinsfile")
+        graph = conflict_graph([a, b, c, d])
+        assert graph[a.id] == {b.id}
+        assert graph[c.id] == {d.id}
+
+    def test_batches_are_conflict_free_and_ordered(self):
+        critical = Finding(rule_id="r", title="t", description="d", severity=Severity.CRITICAL)
+        a = _suggestion(["n1"], effort="1 hour")
+        b = _suggestion(["n1"], effort="5 minutes")
+        b.finding_id = critical.id
+        c = _suggestion(["n2"], effort="1 day")
+        d = _suggestion(["n3"], effort="10 minutes", impact=3)
+        plan = RefactorPlan(name="p", suggestions=[a, b, c, d])
+
+        schedule = schedule_plan(plan, [critical])
+
+        assert schedule.conflict_count == 1
+        # b conflicts with a and comes later in the plan, so it must wait for a.
+        assert [b_.suggestion_ids for b_ in schedule.batches] == [[d.id, a.id, c.id], [b.id]]
+        assert [b_.index for b_ in schedule.batches] == [0, 1]
+        assert schedule.max_parallelism == 3
+        assert schedule.batches[0].total_effort_minutes == 10 + 60 + 480
+
+    def test_conflicting_suggestions_keep_plan_order(self):
+        first = _suggestion(["n1"], effort="1 day")
+        second = _suggestion(["n2"], effort="1 day", source_file="ci.yml")
+        third = _suggestion(["n1", "n3"], effort="1 minute", impact=5)
+        fourth = _suggestion([], effort="1 minute", impact=5, source_file="ci.yml")
+        fifth = _suggestion(["n3"], effort="1 minute", impact=5)
+        plan = RefactorPlan(name="p", suggestions=[first, second, third, fourth, fifth])
+
+        schedule = schedule_plan(plan)
+
+        batch_of = {sid: b.index for b in schedule.batches for sid in b.suggestion_ids}
+        conflicts = conflict_graph(plan.suggestions)
+        position = {s.id: i for i, s in enumerate(plan.suggestions)}
+        for sid, others in conflicts.items():
+            for other in others:
+                if position[sid] < position[other]:
+                    assert batch_of[sid] < batch_of[other]
+        assert batch_of == {first.id: 0, second.id: 0, third.id: 1, fourth.id: 1, fifth.id: 2}
@@ -0,0 +1,76 @@
+"""Tests for the versioned event schema registry."""
+
+from typing import ClassVar
+
+import pytest
+
+from atlas_sdk import FindingsEvent, Platform, ScanRequestEvent
+from atlas_sdk.events import BaseEvent
+from atlas_sdk.schema_registry import (
+    SchemaRegistry,
+    SchemaRegistryError,
+    decode_event,
+    encode_event,
+    registry,
+)
+
+
+class RenamedEvent(BaseEvent):
+    """v2 renamed ``url`` to ``target_url`` and added ``retries``."""
+
+    schema_version: ClassVar[int] = 2
+
+    target_url: str
+    retries: int
+
+
+def _v1_to_v2(payload):
+    payload = dict(payload)
+    payload["target_url"] = payload.pop("url")
+    payload.setdefault("retries", 0)
+    return payload
+
+
+class TestSchemaRegistry:
+    def test_round_trip_default_registry(self):
+        event = ScanRequestEvent(platform=Platform.JENKINS, target_url="https://ci")
+        frame = encode_event(event)
+        assert frame[0] == 0x01
+        restored = decode_event(frame)
+        assert isinstance(restored, ScanRequestEvent)
+        assert restored.event_id == event.event_id
+
+    def test_peek_dispatches_on_header(self):
+        frame = encode_event(FindingsEvent(scan_request_id="r", graph_id="g"))
+        entry = registry.peek(frame)
+        assert entry.event_type == "FindingsEvent"
+        assert entry.version == 1
+
+    def test_unknown_wire_id(self):
+        with pytest.raises(SchemaRegistryError):
+            decode_event(b"\xff{}")
+
+    def test_legacy_version_is_upcast(self):
+        reg = SchemaRegistry()
+        reg.register(RenamedEvent, 0x10, version=1, upcaster=_v1_to_v2)
+        reg.register(RenamedEvent, 0x11)
+
+        legacy = b"\x10" + b'{"event_id": "e1", "url": "https://old"}'
+        event = reg.decode(legacy)
+        assert isinstance(event, RenamedEvent)
+        assert event.target_url == "https://old"
+        assert event.retries == 0
+
+        current = reg.encode(event)
+        assert current[0] == 0x11
+        assert reg.decode(current).event_id == "e1"
+
+    def test_registration_errors(self):
+        reg = SchemaRegistry()
+        reg.register(RenamedEvent, 0x20)
+        with pytest.raises(SchemaRegistryError):
+            reg.register(RenamedEvent, 0x21)  # duplicate version
+        with pytest.raises(SchemaRegistryError):
+            reg.register(ScanRequestEvent, 0x20)  # wire id taken
+        with pytest.raises(SchemaRegistryError):
+            reg.register(RenamedEvent, 0x22, version=1)  # legacy without upcaster
@@ -0,0 +1,126 @@
+"""Tests for graph sharding and shard result merging."""
+
+import pytest
+
+from atlas_sdk.enums import NodeType, Severity
+from atlas_sdk.models.findings import Finding
+from atlas_sdk.models.graph import CICDGraph
+from atlas_sdk.models.nodes import ContainerImageNode, JobNode
+from atlas_sdk.sharding import GraphShard, analyze_shards, merge_findings, merge_graphs, shard_graph
+from atlas_sdk.synthetic import EstateGenerator
+
+
+@pytest.fixture(scope="module")
+def graph():
+    estate = EstateGenerator(seed=11, projects=8).multi_project_graph()
+    return CICDGraph(
+        id="mono",
+        name="monorepo",
+        nodes=[n for g in estate.graphs for n in g.nodes],
+        edges=[e for g in estate.graphs for e in g.edges],
+    )
+
+
+def _unpinned_images(shard):
+    return [
+        Finding(
+            rule_id="unpinned-image",
+            title="Unpinned image",
+            description=node.name,
+            severity=Severity.HIGH,
+            affected_node_ids=[node.id],
+        )
+        for node in shard.nodes
+        if isinstance(node, ContainerImageNode) and not node.pinned
+    ]
+
+
+class TestShardGraph:
+    @pytest.mark.parametrize(
+        "strategy, options",
+        [
+            ("pipeline", {}),
+            ("pipeline", {"shards": 3}),
+            ("repository", {"max_nodes": 400}),
+            ("min_cut", {"shards": 4}),
+        ],
+    )
+    def test_every_node_owned_once_and_merge_restores(self, graph, strategy, options):
+        shard_set = shard_graph(graph, strategy=strategy, **options)
+        owned = [n for s in shard_set.shards for n in s.owned_node_ids]
+        assert sorted(owned) == sorted(n.id for n in graph.nodes)
+
+        merged = merge_graphs(shard_set.shards)
+        assert merged.id == graph.id and merged.name == graph.name
+        assert {n.id for n in merged.nodes} == {n.id for n in graph.nodes}
+        assert {e.id for e in merged.edges} == {e.id for e in graph.edges}
+        assert isinstance(
+            merged.get_node(next(n.id for n in graph.nodes if n.node_type == "job")), JobNode
+        )
+
+    def test_pipeline_units_stay_together(self, graph):
+        shard_set = shard_graph(graph, strategy="pipeline")
+        pipelines = [n for n in graph.nodes if n.node_type == NodeType.PIPELINE]
+        assert len(shard_set.shards) >= len(pipelines)
+        for edge in graph.edges:
+            if edge.edge_type == "calls":
+                assert (
+                    shard_set.assignment[edge.source_node_id]
+                    == shard_set.assignment[edge.target_node_id]
+                )
+
+    def test_ghosts_cover_cut_edges(self, graph):
+        shard_set = shard_graph(graph, strategy="min_cut", shards=4)
+        assert shard_set.cut_edges > 0
+        for shard in shard_set.shards:
+            present = {n.id for n in shard.nodes}
+            for edge in shard.edges:
+                assert {edge.source_node_id, edge.target_node_id} <= present
+                assert shard.owns(edge.source_node_id) or shard.owns(edge.target_node_id)
+            assert all(shard.is_ghost(n) and not shard.owns(n) for n in shard.ghost_node_ids)
+
+    def test_min_cut_is_balanced_and_beats_arbitrary_split(self, graph):
+        shard_set = shard_graph(graph, strategy="min_cut", shards=4)
+        sizes = [len(s.owned_node_ids) for s in shard_set.shards]
+        assert max(sizes) <= len(graph.nodes) / 4 * 1.1
+        assert shard_set.cut_edges < len(graph.edges) * 0.1
+
+    def test_min_cut_respects_max_nodes(self, graph):
+        max_nodes = len(graph.nodes) // 4
+        for kwargs in ({"max_nodes": max_nodes}, {"shards": 2, "max_nodes": max_nodes}):
+            shard_set = shard_graph(graph, strategy="min_cut", **kwargs)
+            assert max(len(s.owned_node_ids) for s in shard_set.shards) <= max_nodes
+
+    def test_shards_serialize_independently(self, graph):
+        shard = shard_graph(graph, strategy="pipeline", shards=2).shards[1]
+        restored = GraphShard.model_validate_json(shard.model_dump_json())
+        assert restored == shard
+        assert restored.owns(shard.owned_node_ids[0])
+        assert {type(n) for n in restored.nodes} == {type(n) for n in shard.nodes}
+        assert restored.to_graph().id == shard.id
+
+    def test_requires_size_for_min_cut(self, graph):
+        with pytest.raises(ValueError):
+            shard_graph(graph, strategy="min_cut")
+
+
+class TestMergeFindings:
+    def test_matches_unsharded_analysis(self, graph):
+        expected = {f.affected_node_ids[0] for f in _unpinned_images(graph)}
+        shard_set = shard_graph(graph, strategy="min_cut", shards=4)
+        merged = analyze_shards(shard_set, _unpinned_images)
+        assert sorted(f.affected_node_ids[0] for f in merged) == sorted(expected)
+
+    def test_ghost_only_findings_and_duplicates_dropped(self, graph):
+        shards = shard_graph(graph, strategy="pipeline", shards=2).shards
+        owned = shards[0].owned_node_ids[0]
+        finding = Finding(
+            rule_id="r",
+            title="t",
+            description="d",
+            severity=Severity.LOW,
+            affected_node_ids=[owned],
+        )
+        copy = finding.model_copy(update={"id": "other"})
+        merged = merge_findings([(shards[1], [copy]), (shards[0], [finding, finding])])
+        assert [f.id for f in merged] == [finding.id]
@@ -0,0 +1,113 @@
+"""Tests for incremental refactor-plan simulation."""
+
+from atlas_sdk import CICDGraph, Edge, EdgeType, Finding, JobNode, PipelineNode, Severity
+from atlas_sdk.models.refactors import RefactorPlan, RefactorSuggestion
+from atlas_sdk.overlay import GraphOverlay
+from atlas_sdk.simulator import PlanSimulator, simulate_plan
+
+
+def _no_timeout(view, scope):
+    """Scoped rule: every job without a timeout is a finding."""
+    for node_id in sorted(scope):
+        node = view.get_node(node_id)
+        if isinstance(node, JobNode) and node.timeout_minutes is None:
+            yield Finding(
+                rule_id="no-timeout",
+                title="No timeout",
+                description=node.name,
+                severity=Severity.HIGH,
+                affected_node_ids=[node_id],
+            )
+
+
+def _setup(n_jobs=5):
+    graph = CICDGraph(name="g")
+    pipeline = PipelineNode(name="main")
+    graph.add_node(pipeline)
+    jobs = [JobNode(name=f"job-{i}") for i in range(n_jobs)]
+    for job in jobs:
+        graph.add_node(job)
+        graph.add_edge(
+            Edge(edge_type=EdgeType.CALLS, source_node_id=pipeline.id, target_node_id=job.id)
+        )
+    view = GraphOverlay(graph)
+    findings = [f for job in jobs for f in _no_timeout(view, {job.id})]
+    return graph, jobs, findings
+
+
+def _fix(job, finding):
+    return RefactorSuggestion(
+        rule_id="no-timeout",
+        finding_id=finding.id,
+        description="Add timeout",
+        before_snippet="",
+        after_snippet="options { timeout(30) }",
+        affected_node_ids=[job.id],
+        metadata={"graph_patch": {"update_nodes": {job.id: {"timeout_minutes": 30}}}},
+    )
+
+
+class TestPlanSimulator:
+    def test_scoped_reevaluation(self):
+        graph, jobs, findings = _setup()
+        calls = []
+
+        def evaluate(view, scope):
+            calls.append(scope)
+            return _no_timeout(view, scope)
+
+        plan = RefactorPlan(
+            name="p", suggestions=[_fix(jobs[0], findings[0]), _fix(jobs[1], findings[1])]
+        )
+        simulator = PlanSimulator(graph, findings, evaluate=evaluate)
+        result = simulator.simulate(plan)
+
+        assert calls == [frozenset({jobs[0].id}), frozenset({jobs[1].id})]
+        assert result.findings_removed == 2
+        assert result.findings_remaining == 3
+        assert [i.findings_removed for i in result.suggestion_impacts] == [1, 1]
+        total = next(d for d in result.score_deltas if d.metric == "high_findings")
+        assert (total.before, total.after, total.improved) == (5, 3, True)
+        # The base graph is untouched; the overlay holds the projection.
+        assert graph.get_node(jobs[0].id).timeout_minutes is None
+        assert simulator.overlay.get_node(jobs[0].id).timeout_minutes == 30
+
+    def test_structural_patch_and_new_findings(self):
+        graph, jobs, findings = _setup(2)
+        new_job = JobNode(name="added")
+        suggestion = RefactorSuggestion(
+            rule_id="split",
+            description="Split job",
+            before_snippet="",
+            after_snippet="",
+            metadata={
+                "graph_patch": {
+                    "remove_node_ids": [jobs[1].id],
+                    "add_nodes": [new_job.model_dump()],
+                }
+            },
+        )
+        result = simulate_plan(
+            graph, findings, RefactorPlan(name="p", suggestions=[suggestion]), evaluate=_no_timeout
+        )
+        impact = result.suggestion_impacts[0]
+        assert (impact.findings_removed, impact.findings_added) == (1, 1)
+        assert result.projected_node_count == 3
+        assert result.projected_edge_count == 1
+
+    def test_without_evaluator_resolves_named_finding(self):
+        graph, jobs, findings = _setup(3)
+        plan = RefactorPlan(name="p", suggestions=[_fix(jobs[2], findings[2])])
+        result = simulate_plan(graph, findings, plan)
+        assert result.findings_removed == 1
+        assert result.findings_remaining == 2
+
+    def test_custom_score_function(self):
+        graph, jobs, findings = _setup(4)
+
+        def score(view, active):
+            return {"fragility": 10.0 * len(active), "maturity": 100.0 - 10 * len(active)}
+
+        plan = RefactorPlan(name="p", suggestions=[_fix(jobs[0], findings[0])])
+        result = simulate_plan(graph, findings, plan, evaluate=_no_timeout, score=score)
+        assert result.total_improvements == 2
@@ -0,0 +1,267 @@
+"""Tests for the reference storage backends."""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from atlas_sdk import CICDGraph, Edge, EdgeType, JobNode, NodeType, PipelineNode
+from atlas_sdk.models.proposals import Proposal
+from atlas_sdk.models.scan_history import ScanSnapshot
+from atlas_sdk.overlay import GraphOverlay
+from atlas_sdk.storage import (
+    InMemoryProposalRepository,
+    ProposalExistsError,
+    ProposalNotFoundError,
+    RetentionPolicy,
+    SQLiteDigestCache,
+    SQLiteGraphStore,
+    SQLiteProposalRepository,
+    SQLiteSnapshotStore,
+)
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def proposals(request):
+    if request.param == "memory":
+        yield InMemoryProposalRepository()
+    else:
+        repo = SQLiteProposalRepository()
+        yield repo
+        repo.close()
+
+
+def _seed(repo, count=5):
+    created = []
+    for i in range(count):
+        proposal = Proposal(
+            graph_id="g1" if i % 2 == 0 else "g2",
+            plan_id="p",
+            title=f"proposal {i}",
+            author="alice" if i < 3 else "bob",
+            created_at=T0 + timedelta(minutes=i),
+            updated_at=T0 + timedelta(minutes=i),
+        )
+        created.append(repo.create(proposal))
+    return created
+
+
+class TestProposalRepository:
+    def test_transitions_are_recorded(self, proposals):
+        (p,) = _seed(proposals, 1)
+        proposals.submit(p.id, actor="alice")
+        approved = proposals.approve(p.id, reviewer="carol", comment="lgtm")
+
+        assert approved.status == "approved"
+        assert proposals.get(p.id).comments[0].text == "lgtm"
+        history = list(proposals.history(p.id))
+        assert [t.action for t in history] == ["create", "submit", "approve"]
+        assert [t.to_status for t in history] == ["draft", "pending", "approved"]
+        assert history[0].seq < history[1].seq < history[2].seq
+        assert [t.action for t in proposals.history(p.id, after_seq=history[0].seq)] == [
+            "submit",
+            "approve",
+        ]
+        assert proposals.status_at(p.id, T0) == "draft"
+
+    def test_unknown_proposal(self, proposals):
+        with pytest.raises(ProposalNotFoundError):
+            proposals.submit("missing")
+
+    def test_create_rejects_duplicate_id(self, proposals):
+        (p,) = _seed(proposals, 1)
+        proposals.submit(p.id)
+        with pytest.raises(ProposalExistsError):
+            proposals.create(p.model_copy(update={"title": "replacement"}))
+        stored = proposals.get(p.id)
+        assert (stored.title, stored.status) == (p.title, "pending")
+        assert [t.action for t in proposals.history(p.id)] == ["create", "submit"]
+
+    def test_indexed_queries(self, proposals):
+        created = _seed(proposals)
+        proposals.submit(created[0].id)
+        proposals.submit(created[4].id)
+
+        pending = proposals.query(graph_id="g1", status="pending")
+        assert {p.id for p in pending.items} == {created[0].id, created[4].id}
+        assert [p.id for p in proposals.query(author="bob").items] == [
+            created[4].id,
+            created[3].id,
+        ]
+        recent = proposals.query(updated_after=T0 + timedelta(minutes=2), status="draft")
+        assert [p.id for p in recent.items] == [created[3].id]
+
+    def test_keyset_pagination(self, proposals):
+        created = _seed(proposals)
+        seen, cursor = [], None
+        while True:
+            page = proposals.query(limit=2, cursor=cursor)
+            seen.extend(p.id for p in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+        assert seen == [p.id for p in reversed(created)]
+
+    def test_sqlite_audit_log_is_append_only(self):
+        repo = SQLiteProposalRepository(history_batch_size=1)
+        (p,) = _seed(repo, 1)
+        repo.submit(p.id)
+        assert len(list(repo.history(p.id))) == 2
+        with pytest.raises(sqlite3.DatabaseError):
+            repo._conn.execute("DELETE FROM proposal_events")
+
+
+def _graph():
+    graph = CICDGraph(name="g", metadata={"repo": "org/app"})
+    p, a, b = PipelineNode(name="p"), JobNode(name="a"), JobNode(name="b")
+    for node in (p, a, b):
+        graph.add_node(node)
+    graph.add_edge(Edge(edge_type=EdgeType.CALLS, source_node_id=p.id, target_node_id=a.id))
+    graph.add_edge(Edge(edge_type=EdgeType.CALLS, source_node_id=p.id, target_node_id=b.id))
+    return graph, p, a, b
+
+
+class TestSQLiteGraphStore:
+    def test_round_trip_keeps_node_types(self):
+        graph, p, a, _ = _graph()
+        store = SQLiteGraphStore()
+        store.save_graph(graph)
+
+        loaded = store.load_graph(graph.id)
+        assert loaded == graph
+        assert isinstance(store.get_node(graph.id, a.id), JobNode)
+        assert [n.id for n in store.iter_nodes(graph.id, NodeType.PIPELINE)] == [p.id]
+        assert store.get_node(graph.id, "missing") is None
+        assert store.load_graph("missing") is None
+
+    def test_upserts_and_adjacency(self):
+        graph, p, a, b = _graph()
+        store = SQLiteGraphStore()
+        store.save_graph(graph)
+
+        assert store.upsert_nodes(graph.id, [a.model_copy(update={"timeout_minutes": 5})]) == 1
+        assert store.get_node(graph.id, a.id).timeout_minutes == 5
+        assert store.node_count(graph.id) == 3
+        assert {e.target_node_id for e in store.get_edges_from(graph.id, p.id)} == {a.id, b.id}
+        assert [e.source_node_id for e in store.get_edges_to(graph.id, b.id)] == [p.id]
+
+        store.delete_nodes(graph.id, [b.id])
+        assert store.get_edges_to(graph.id, b.id) == []
+        assert (store.node_count(graph.id), store.edge_count(graph.id)) == (2, 1)
+
+    def test_overlay_diff_is_persisted(self):
+        graph, _, a, b = _graph()
+        store = SQLiteGraphStore()
+        store.save_graph(graph)
+
+        overlay = GraphOverlay(store.view(graph.id))
+        overlay.update_node(a.id, name="a2")
+        overlay.remove_node(b.id)
+        store.apply_diff(graph.id, overlay.diff())
+
+        assert store.get_node(graph.id, a.id).name == "a2"
+        assert store.get_node(graph.id, b.id) is None
+        assert store.edge_count(graph.id) == 1
+
+    def test_graphs_are_isolated(self):
+        first, _, _, _ = _graph()
+        second, _, _, _ = _graph()
+        store = SQLiteGraphStore()
+        store.save_graph(first)
+        store.save_graph(second)
+        store.delete_graph(first.id)
+        assert store.graph_ids() == [second.id]
+        assert store.node_count(second.id) == 3
+
+
+class TestSQLiteSnapshotStore:
+    NOW = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+    def _history(self, days=800, per_day=3):
+        store = SQLiteSnapshotStore()
+        snapshots = [
+            ScanSnapshot(
+                graph_name="app",
+                fragility_score=float(day % 10),
+                finding_count=day % 5,
+                scanned_at=self.NOW - timedelta(days=day, hours=6 * i),
+            )
+            for day in range(days)
+            for i in range(per_day)
+        ]
+        assert store.append_many(snapshots) == len(snapshots)
+        return store, snapshots
+
+    def test_append_is_idempotent(self):
+        store = SQLiteSnapshotStore()
+        snapshot = ScanSnapshot(graph_name="app", scanned_at=T0)
+        assert store.append(snapshot) is True
+        assert store.append(snapshot) is False
+        assert store.counts() == {"raw": 1, "daily": 1, "weekly": 1}
+
+    def test_compaction_bounds_storage(self):
+        store, _ = self._history()
+        deleted = store.compact(now=self.NOW)
+        counts = store.counts()
+
+        assert deleted["raw"] > 0 and deleted["daily"] > 0
+        assert counts["raw"] <= 31 * 3
+        assert counts["daily"] <= 372
+        assert counts["weekly"] <= 800 // 7 + 2
+
+    def test_auto_series_covers_history_once(self):
+        store, snapshots = self._history()
+        store.compact(now=self.NOW)
+        series = store.series("app", now=self.NOW)
+
+        samples = sum(p.metadata.get("samples", 1) for p in series)
+        assert samples == len(snapshots)
+        assert [p.scanned_at for p in series] == sorted(p.scanned_at for p in series)
+        assert series[0].metadata["resolution"] == "weekly"
+        assert "resolution" not in series[-1].metadata
+        assert len(series) < len(snapshots) // 4
+
+    def test_rollups_average_metrics(self):
+        store = SQLiteSnapshotStore()
+        for hour, score in ((1, 2.0), (2, 4.0)):
+            store.append(
+                ScanSnapshot(
+                    graph_name="app",
+                    fragility_score=score,
+                    scanned_at=T0 + timedelta(hours=hour),
+                )
+            )
+        (point,) = store.series("app", T0, T0 + timedelta(days=1), resolution="daily")
+        assert point.fragility_score == 3.0
+        assert point.scanned_at == T0
+        assert point.metadata == {"resolution": "daily", "samples": 2}
+
+    def test_trend_report_uses_series(self):
+        store, _ = self._history(days=3, per_day=1)
+        report = store.trend_report("app", now=self.NOW)
+        assert report.total_snapshots == 3
+        assert [t.metric for t in report.trends] == ["complexity", "fragility", "maturity"]
+
+    def test_custom_weekly_retention(self):
+        store, _ = self._history()
+        store.retention = RetentionPolicy(weekly_days=400)
+        store.compact(now=self.NOW)
+        assert store.counts()["weekly"] <= 400 // 7 + 2
+
+
+class TestSQLiteDigestCache:
+    def test_roundtrip_and_expiry(self, tmp_path):
+        path = str(tmp_path / "digests.db")
+        cache = SQLiteDigestCache(path)
+        cache.set("docker.io/library/nginx:1", "sha256:" + "a" * 64, 100.0)
+        cache.set("docker.io/library/gone:1", None, 50.0)
+        cache.close()
+
+        cache = SQLiteDigestCache(path)
+        assert cache.get("docker.io/library/nginx:1") == ("sha256:" + "a" * 64, 100.0)
+        assert cache.get("docker.io/library/gone:1") == (None, 50.0)
+        assert cache.purge_expired(now=60.0) == 1
+        cache.delete("docker.io/library/nginx:1")
+        assert len(cache) == 0
@@ -0,0 +1,86 @@
+"""Tests for the synthetic estate generator."""
+
+import pytest
+
+from atlas_sdk.enums import EdgeType, NodeType, Platform
+from atlas_sdk.events import FindingsEvent, ParseResultEvent, ScanResultEvent
+from atlas_sdk.schema_registry import decode_event, encode_event
+from atlas_sdk.synthetic import PROFILES, EstateGenerator
+
+
+def _structure(estate):
+    return [g.model_dump(exclude={"scanned_at"}) for g in estate.graphs]
+
+
+class TestEstateGenerator:
+    def test_same_seed_same_estate(self):
+        first = EstateGenerator(seed=7, projects=3).multi_project_graph()
+        second = EstateGenerator(seed=7, projects=3).multi_project_graph()
+        other = EstateGenerator(seed=8, projects=3).multi_project_graph()
+
+        assert _structure(first) == _structure(second)
+        assert _structure(first) != _structure(other)
+        assert first.cross_edges == second.cross_edges
+
+    def test_projects_do_not_depend_on_estate_size(self):
+        small = EstateGenerator(seed=1, projects=2)
+        large = EstateGenerator(seed=1, projects=50)
+        assert small.project(1).nodes == large.project(1).nodes
+
+    def test_covers_every_node_and_edge_type(self):
+        estate = EstateGenerator(seed=3, projects=40).multi_project_graph()
+        node_types = {n.node_type for g in estate.graphs for n in g.nodes}
+        edge_types = {e.edge_type for g in estate.graphs for e in g.edges}
+        assert node_types == set(NodeType)
+        assert edge_types == set(EdgeType)
+
+    def test_edges_and_cross_edges_resolve(self):
+        estate = EstateGenerator(seed=2, projects=10).multi_project_graph()
+        ids = {g.id: {n.id for n in g.nodes} for g in estate.graphs}
+        for graph in estate.graphs:
+            for edge in graph.edges:
+                assert {edge.source_node_id, edge.target_node_id} <= ids[graph.id]
+        assert estate.cross_edges
+        for edge in estate.cross_edges:
+            assert edge.source_node_id in ids[edge.source_graph_id]
+            assert edge.target_node_id in ids[edge.target_graph_id]
+            assert edge.source_graph_id != edge.target_graph_id
+
+    def test_target_nodes_streams_lazily(self):
+        generator = EstateGenerator(seed=0, projects=None, target_nodes=2_000)
+        stream = generator.iter_graphs()
+        first = next(stream)
+        assert first.id == "project-0"
+        total = len(first.nodes) + sum(len(g.nodes) for g in stream)
+        assert total >= 2_000
+
+    @pytest.mark.parametrize("platform", sorted(PROFILES))
+    def test_profiles(self, platform):
+        graph = EstateGenerator(PROFILES[platform], projects=1).project(0)
+        assert graph.platform == platform
+        assert all(n.platform == platform for n in graph.nodes)
+
+    def test_requires_a_size(self):
+        with pytest.raises(ValueError):
+            EstateGenerator(projects=None)
+
+
+class TestSyntheticEvents:
+    def test_event_stream_per_project(self):
+        events = list(EstateGenerator(seed=5, projects=2).iter_events("scan-1"))
+        assert [type(e) for e in events] == [
+            ScanResultEvent,
+            ParseResultEvent,
+            FindingsEvent,
+        ] * 2
+        scan, parse, findings = events[:3]
+        assert scan.platform == Platform.GITLAB
+        assert scan.pipeline_configs and scan.build_logs
+        assert len(parse.nodes) == len(EstateGenerator(seed=5).project(0).nodes)
+        node_ids = {n["id"] for n in parse.nodes}
+        assert findings.findings
+        assert all(set(f["affected_node_ids"]) <= node_ids for f in findings.findings)
+
+    def test_events_round_trip_on_the_wire(self):
+        for event in EstateGenerator(seed=5, projects=1).iter_events("scan-1"):
+            assert decode_event(encode_event(event)) == event
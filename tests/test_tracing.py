@@ -0,0 +1,104 @@
+"""Tests for event trace propagation and latency analysis."""
+
+from datetime import datetime, timedelta, timezone
+
+from atlas_sdk.enums import Platform
+from atlas_sdk.events import (
+    FindingsEvent,
+    ParseResultEvent,
+    ReportReadyEvent,
+    ScanRequestEvent,
+    ScanResultEvent,
+)
+from atlas_sdk.schema_registry import decode_event, encode_event
+from atlas_sdk.tracing import analyze_traces
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _at(seconds):
+    return T0 + timedelta(seconds=seconds)
+
+
+def _pipeline(offset=0.0, parse_queue=1.0):
+    """scan request → scan result → parse result → findings → report ready."""
+    request = ScanRequestEvent(platform=Platform.GITLAB, target_url="https://example.com")
+    request.start_trace("atlas-api")
+    request.mark_enqueued(at=_at(offset))
+    request.mark_dequeued("atlas-scanner", at=_at(offset + 0.5))
+
+    result = request.derive(ScanResultEvent)
+    result.mark_enqueued(at=_at(offset + 3.5))
+    result.mark_dequeued("atlas-parser", at=_at(offset + 3.5 + parse_queue))
+
+    parsed = result.derive(ParseResultEvent)
+    parsed.mark_enqueued(at=_at(offset + 6.5 + parse_queue))
+    parsed.mark_dequeued("atlas-rule-engine", at=_at(offset + 7 + parse_queue))
+
+    findings = parsed.derive(FindingsEvent, graph_id="g1")
+    findings.mark_enqueued(at=_at(offset + 9 + parse_queue))
+    findings.mark_dequeued("atlas-report", at=_at(offset + 9.5 + parse_queue))
+
+    ready = findings.derive(ReportReadyEvent, report_id="r1")
+    ready.mark_enqueued(at=_at(offset + 10 + parse_queue))
+    return [request, result, parsed, findings, ready]
+
+
+class TestTraceContext:
+    def test_derive_carries_context_and_fields(self):
+        request, result, parsed, findings, ready = _pipeline()
+        trace_ids = {e.trace.trace_id for e in (request, result, parsed, findings, ready)}
+        assert len(trace_ids) == 1
+
+        assert result.scan_request_id == request.event_id
+        assert result.platform == Platform.GITLAB
+        assert ready.graph_id == "g1" and ready.scan_request_id == request.event_id
+        assert parsed.trace.parent_span_id == result.trace.span_id
+        assert [h.event_type for h in ready.trace.hops] == [
+            "ScanRequestEvent",
+            "ScanResultEvent",
+            "ParseResultEvent",
+            "FindingsEvent",
+            "ReportReadyEvent",
+        ]
+        assert result.trace.current.producer == "atlas-scanner"
+        # The parent's hop history is copied, not shared.
+        assert request.trace.hops[0] is not ready.trace.hops[0]
+
+    def test_untraced_events_stay_untraced_and_compatible(self):
+        event = ScanRequestEvent(platform=Platform.GITLAB, target_url="u")
+        assert event.trace is None
+        child = event.derive(ScanResultEvent, producer="atlas-scanner")
+        assert event.trace is not None and child.trace.trace_id == event.trace.trace_id
+
+    def test_context_survives_the_wire(self):
+        *_, ready = _pipeline()
+        decoded = decode_event(encode_event(ready))
+        assert decoded.trace == ready.trace
+
+
+class TestAnalyzeTraces:
+    def test_stage_breakdown_from_last_events(self):
+        events = [_pipeline(0, parse_queue=1.0)[-1], _pipeline(100, parse_queue=3.0)[-1]]
+        report = analyze_traces(events)
+
+        parser = report.stage("atlas-parser")
+        assert parser.queue_samples == 2
+        assert (parser.queue_p50, parser.queue_max) == (1.0, 3.0)
+        assert parser.processing_p50 == 3.0
+        scanner = report.stage("atlas-scanner")
+        assert (scanner.queue_p50, scanner.processing_p50) == (0.5, 3.0)
+        assert report.stage("atlas-report").processing_max == 0.5
+        assert [t.total_seconds for t in report.traces] == [13.0, 11.0]
+
+    def test_merges_partial_copies(self):
+        request, result, *_ = _pipeline()
+        # An early copy of the request hop lacks the dequeue stamp.
+        early = request.model_copy(deep=True)
+        early.trace.hops[0].dequeued_at = None
+        report = analyze_traces([early, result])
+        assert report.stage("atlas-scanner").queue_p50 == 0.5
+
+    def test_ignores_untraced(self):
+        event = ScanRequestEvent(platform=Platform.GITLAB, target_url="u")
+        assert analyze_traces([event]).stages == []